@@ -0,0 +1,59 @@
+"""
+Measure the per-repo time of scoring a large batch of (already loaded) repo contexts,
+one repo at a time and with the columnar (NumPy-vectorized) engine.
+Run with: uv run python -m benchmarks.bench_columnar_scoring
+"""
+
+import argparse
+import time
+
+from benchmarks.utils import print_table
+from rely.core.metrics.columnar_scoring import create_metric_columns, score_columns
+from rely.services.score_repo_service import get_metric_classes, score_repo_context
+from tests.factories import create_synthetic_repo_context
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=200_000)
+    args = parser.parse_args()
+
+    metric_classes = get_metric_classes()
+    repo_contexts = [
+        create_synthetic_repo_context(index) for index in range(args.repos)
+    ]
+
+    started_at = time.perf_counter()
+
+    for repo_context in repo_contexts:
+        score_repo_context(repo_context, metric_classes)
+
+    per_repo_time = (time.perf_counter() - started_at) / args.repos
+
+    started_at = time.perf_counter()
+    metric_columns = create_metric_columns(repo_contexts)
+    columns_time = (time.perf_counter() - started_at) / args.repos
+
+    started_at = time.perf_counter()
+    score_columns(metric_columns, metric_classes)
+    columnar_time = (time.perf_counter() - started_at) / args.repos
+
+    print_table(
+        ["Scoring", "Time per repo", f"Time for {args.repos} repos"],
+        [
+            [
+                label,
+                f"{elapsed * 1e6:.2f} us",
+                f"{elapsed * args.repos:.2f} s",
+            ]
+            for label, elapsed in [
+                ("One repo at a time", per_repo_time),
+                ("Columns from repo contexts", columns_time),
+                ("Columnar scoring", columnar_time),
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
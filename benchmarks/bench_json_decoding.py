@@ -0,0 +1,66 @@
+"""
+Compare decoding GitHub responses with the stdlib (then validating the dict) against
+validating the raw bytes in a single pass.
+Run with: uv run python -m benchmarks.bench_json_decoding
+"""
+
+import argparse
+import json
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from benchmarks.utils import load_fixture_bytes, measure_time_per_call, print_table
+from rely.clients.models.content_tree_list import ContentTreeList
+from rely.clients.models.scoring_content_tree import ScoringContentTree
+from rely.clients.models.scoring_repository import ScoringRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    args = parser.parse_args()
+
+    get_repo_body = load_fixture_bytes("get_repo_response.json")
+    get_repo_contents_body = load_fixture_bytes("get_repo_contents_response.json")
+    content_trees_adapter = TypeAdapter(list[ScoringContentTree])
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "get_repo",
+            lambda: ScoringRepository.model_validate(json.loads(get_repo_body)),
+            lambda: ScoringRepository.model_validate_json(get_repo_body),
+        ),
+        (
+            "get_repo_contents",
+            lambda: ContentTreeList(
+                content_tree_list=json.loads(get_repo_contents_body)
+            ),
+            lambda: ContentTreeList.model_construct(
+                content_tree_list=content_trees_adapter.validate_json(
+                    get_repo_contents_body
+                )
+            ),
+        ),
+    ]
+    rows = []
+
+    for name, decode_then_validate, validate_json in cases:
+        two_pass_time = measure_time_per_call(decode_then_validate, args.iterations)
+        single_pass_time = measure_time_per_call(validate_json, args.iterations)
+        rows.append(
+            [
+                name,
+                f"{two_pass_time * 1e6:.1f} us",
+                f"{single_pass_time * 1e6:.1f} us",
+                f"{(two_pass_time - single_pass_time) * 1e6:.1f} us",
+            ]
+        )
+
+    print_table(
+        ["Response", "json.loads + validate", "Single pass", "Saved per request"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
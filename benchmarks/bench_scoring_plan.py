@@ -0,0 +1,113 @@
+"""
+Measure the per-repo overhead of scoring a large batch of (already loaded) repo contexts,
+with a precompiled scoring plan and with metric instances recreated on every access.
+Run with: uv run python -m benchmarks.bench_scoring_plan
+"""
+
+import argparse
+import time
+from decimal import Decimal
+from typing import Callable, Sequence, Type
+
+from benchmarks.utils import print_table
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.types import MetricScore
+from rely.core.models.repo_context import RepoContext
+from rely.services.score_repo_service import (
+    RepoResult,
+    get_metric_classes,
+    score_repo_context,
+)
+from tests.factories import create_synthetic_repo_context
+
+
+def _score_repo_context_without_plan(
+    repo_context: RepoContext, metric_classes: Sequence[Type[BaseMetric]]
+) -> RepoResult:
+    """Score a repo like before scoring plans (metric instances are recreated on every access)."""
+
+    def _create_metric_instances() -> list[BaseMetric]:
+        return [metric_class(repo_context) for metric_class in metric_classes]
+
+    weighted_sum = Decimal(
+        sum(
+            [
+                metric_instance.compute_metric_weighted_score()
+                for metric_instance in _create_metric_instances()
+            ]
+        )
+    )
+    highest_possible_score = Decimal(
+        sum(
+            [
+                MetricScore.GOOD.value * metric_instance.get_metric_weight()
+                for metric_instance in _create_metric_instances()
+            ]
+        )
+    )
+    overall_score = weighted_sum / highest_possible_score
+
+    return RepoResult(
+        overall_score_decimal=float(overall_score),
+        overall_score_int=int(overall_score * 100),
+        maximum_metric_score=MetricScore.GOOD.value,
+        metrics=[
+            metric_instance.serialize()
+            for metric_instance in _create_metric_instances()
+        ],
+    )
+
+
+def _measure_time_per_repo(
+    score: Callable[[RepoContext], RepoResult], repo_contexts: Sequence[RepoContext]
+) -> float:
+    """Measure the average time (in seconds) of scoring a repo in a batch."""
+
+    started_at = time.perf_counter()
+
+    for repo_context in repo_contexts:
+        score(repo_context)
+
+    return (time.perf_counter() - started_at) / len(repo_contexts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=20_000)
+    args = parser.parse_args()
+
+    metric_classes = get_metric_classes()
+    repo_contexts = [
+        create_synthetic_repo_context(index) for index in range(args.repos)
+    ]
+
+    without_plan_time = _measure_time_per_repo(
+        lambda repo_context: _score_repo_context_without_plan(
+            repo_context, metric_classes
+        ),
+        repo_contexts,
+    )
+    with_plan_time = _measure_time_per_repo(
+        lambda repo_context: score_repo_context(repo_context, metric_classes),
+        repo_contexts,
+    )
+
+    print_table(
+        ["Scoring", "Time per repo", f"Time for {args.repos} repos"],
+        [
+            [
+                "Without plan",
+                f"{without_plan_time * 1e6:.1f} us",
+                f"{without_plan_time * args.repos:.2f} s",
+            ],
+            [
+                "Precompiled plan",
+                f"{with_plan_time * 1e6:.1f} us",
+                f"{with_plan_time * args.repos:.2f} s",
+            ],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare validating GitHub responses into the full (generated) models and into the scoring views.
+Run with: uv run python -m benchmarks.bench_scoring_views
+"""
+
+import argparse
+from typing import Any, Callable
+
+from pydantic import BaseModel, TypeAdapter
+
+from benchmarks.utils import (
+    load_fixture,
+    measure_retained_memory_per_call,
+    measure_time_per_call,
+    print_table,
+)
+from rely.clients.models.content_tree import ContentTree
+from rely.clients.models.full_repository import FullRepository
+from rely.clients.models.scoring_content_tree import ScoringContentTree
+from rely.clients.models.scoring_repository import ScoringRepository
+
+
+def _create_validator(
+    model_class: type[BaseModel] | TypeAdapter[Any], response: Any
+) -> Callable[[], object]:
+    """Create a function that validates a response."""
+
+    if isinstance(model_class, TypeAdapter):
+        return lambda: model_class.validate_python(response)
+
+    return lambda: model_class.model_validate(response)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2_000)
+    args = parser.parse_args()
+
+    get_repo_response = load_fixture("get_repo_response.json")
+    get_repo_contents_response = load_fixture("get_repo_contents_response.json")
+    cases: list[tuple[str, type[BaseModel] | TypeAdapter[Any], Any]] = [
+        ("FullRepository", FullRepository, get_repo_response),
+        ("ScoringRepository", ScoringRepository, get_repo_response),
+        (
+            "list[ContentTree]",
+            TypeAdapter(list[ContentTree]),
+            get_repo_contents_response,
+        ),
+        (
+            "list[ScoringContentTree]",
+            TypeAdapter(list[ScoringContentTree]),
+            get_repo_contents_response,
+        ),
+    ]
+    rows = []
+
+    for name, model_class, response in cases:
+        validate = _create_validator(model_class, response)
+        time_per_call = measure_time_per_call(validate, args.iterations)
+        memory_per_call = measure_retained_memory_per_call(validate, args.iterations)
+        rows.append(
+            [name, f"{time_per_call * 1e6:.1f} us", f"{memory_per_call / 1024:.1f} KiB"]
+        )
+
+    print_table(["Model", "Validation time", "Retained memory"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Final, Sequence
+
+
+FIXTURES_DIR: Final[Path] = (
+    Path(__file__).parent.parent
+    / "tests"
+    / "clients"
+    / "test_github_api_client"
+    / "fixtures"
+)
+
+
+def load_fixture_bytes(file_name: str) -> bytes:
+    """Load a (GitHub API response) fixture as raw bytes."""
+
+    return (FIXTURES_DIR / file_name).read_bytes()
+
+
+def load_fixture(file_name: str) -> Any:
+    """Load a (GitHub API response) fixture as decoded JSON."""
+
+    return json.loads(load_fixture_bytes(file_name))
+
+
+def measure_time_per_call(function: Callable[[], object], iterations: int) -> float:
+    """Measure the average wall time (in seconds) of a call (best of 5 rounds)."""
+
+    function()
+    best_round = float("inf")
+
+    for _ in range(5):
+        started_at = time.perf_counter()
+
+        for _ in range(iterations):
+            function()
+
+        best_round = min(best_round, time.perf_counter() - started_at)
+
+    return best_round / iterations
+
+
+def measure_retained_memory_per_call(
+    function: Callable[[], object], iterations: int
+) -> float:
+    """Measure the average memory (in bytes) retained by the results of a call."""
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        results = [function() for _ in range(iterations)]
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # NOTE: Results are kept alive until memory is measured
+    del results
+
+    return (retained - baseline) / iterations
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> None:
+    """Print a plain-text table of benchmark results."""
+
+    widths = [
+        max(len(header), *(len(row[index]) for row in rows))
+        for index, header in enumerate(headers)
+    ]
+
+    for row in [headers, ["-" * width for width in widths], *rows]:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
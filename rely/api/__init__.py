@@ -1,13 +1,335 @@
-from fastapi import FastAPI
+from typing import AsyncIterator, Collection, Final, Type
 
-from rely.services.score_repo_service import RepoResult, score_repo
+from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, HttpUrl
 
+from rely.api.dependencies import (
+    GitHubAPIClientDependency,
+    RepoResultCacheDependency,
+    ScoringSingleFlightDependency,
+    SettingsDependency,
+    WatchedReposDependency,
+    lifespan,
+)
+from rely.clients.github_api_client import GitHubAPIError
+from rely.clients.rate_limiter import RateLimitState
+from rely.clients.single_flight import SingleFlightStats
+from rely.clients.token_pool import TokenUsage
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.models.repo_identifier import RepoIdentifier
+from rely.services.repo_result_cache import Freshness, score_repo_cached
+from rely.services.score_repo_service import (
+    RepoResult,
+    get_metric_classes,
+    parse_metric_names,
+)
+from rely.services.score_repos_service import RepoOutcome, scan_org, score_repos
+from rely.services.watched_repos_service import WatchedReposStats
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
+
+NDJSON_MEDIA_TYPE: Final[str] = "application/x-ndjson"
+SSE_MEDIA_TYPE: Final[str] = "text/event-stream"
+
+
+class ScoreRepoResponse(RepoResult):
+    """Model for the score repo response body (a result, along with its freshness)."""
+
+    freshness: Freshness
+    # Seconds since the result was scored (like the Age header)
+    age: int
+
+
+class ScoreReposRequest(BaseModel):
+    """Model for the score repos request body."""
+
+    repo_urls: list[str]
+    # Normalized names of the metrics to compute (defaults to all metrics)
+    metrics: list[str] | None = None
+
+
+class ScoreReposResponse(BaseModel):
+    """Model for the score repos response body (one outcome per unique repo URL)."""
+
+    results: list[RepoOutcome]
+
+
+class CoalescingStats(BaseModel):
+    """Model for the request coalescing counters (GitHub fetches and /score_repo scorings)."""
+
+    fetches: SingleFlightStats
+    scorings: SingleFlightStats
+
+
+class ScoreReposSummary(BaseModel):
+    """Model for the summary that ends a streamed score repos response."""
+
+    repo_count: int
+    error_count: int
+
+
+class ScoreReposSummaryRecord(BaseModel):
+    """Model for the final NDJSON record of a streamed score repos response."""
+
+    summary: ScoreReposSummary
+
+
+def _get_metric_classes(
+    metric_names: Collection[str] | None,
+) -> list[Type[BaseMetric]]:
+    """Get metric classes, or respond with an error if the metric selection is invalid."""
+
+    try:
+        return get_metric_classes(metric_names)
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
 
 
 @app.get("/score_repo")
-async def score(repo_url: str) -> RepoResult:
-    """Score repo endpoint."""
+async def score(
+    repo_url: str,
+    response: Response,
+    github_api_client: GitHubAPIClientDependency,
+    repo_result_cache: RepoResultCacheDependency,
+    watched_repos: WatchedReposDependency,
+    metrics: str | None = None,
+) -> ScoreRepoResponse:
+    """
+    Score repo endpoint.
+    NOTE: metrics is an optional comma-separated list of metric names to compute.
+          Watched repos are served from their background-refreshed results (without touching GitHub).
+          Other results are cached: stale results are served (and refreshed in the background)
+          within a grace window, or while GitHub is rate limiting (or unavailable).  Freshness is
+          reported by the Age and Cache-Control headers, and the freshness field.
+          If the repo can't be scored, responds with a 502.
+    """
+
+    metric_classes = _get_metric_classes(
+        parse_metric_names(metrics) if metrics is not None else None
+    )
+
+    try:
+        repo_identifier = RepoIdentifier(url=HttpUrl(repo_url))
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
+
+    cached_repo_result = watched_repos.get(repo_identifier, metric_classes)
+
+    if cached_repo_result is not None:
+        cache_control = watched_repos.cache_control
+    else:
+        try:
+            cached_repo_result = await score_repo_cached(
+                repo_url, github_api_client, repo_result_cache, metric_classes
+            )
+        except GitHubAPIError as error:
+            raise HTTPException(status_code=502, detail=str(error))
+
+        cache_control = repo_result_cache.cache_control
+
+    age = int(cached_repo_result.age)
+    response.headers["Age"] = str(age)
+    response.headers["Cache-Control"] = cache_control
+
+    return ScoreRepoResponse(
+        **cached_repo_result.repo_result.model_dump(),
+        freshness=cached_repo_result.freshness,
+        age=age,
+    )
+
+
+@app.post("/score_repos")
+async def score_many(
+    score_repos_request: ScoreReposRequest,
+    settings: SettingsDependency,
+    github_api_client: GitHubAPIClientDependency,
+) -> ScoreReposResponse:
+    """
+    Score repos endpoint.
+    NOTE: Duplicate repo URLs are dropped, and results are returned in input order.
+    """
+
+    metric_classes = _get_metric_classes(score_repos_request.metrics)
+    unique_repo_urls = list(
+        dict.fromkeys(repo_url.strip() for repo_url in score_repos_request.repo_urls)
+    )
+    outcomes_by_repo_url = {
+        repo_outcome.repo_url: repo_outcome
+        async for repo_outcome in score_repos(
+            unique_repo_urls,
+            github_api_client,
+            settings.max_concurrency,
+            metric_classes,
+        )
+    }
+
+    return ScoreReposResponse(
+        results=[outcomes_by_repo_url[repo_url] for repo_url in unique_repo_urls]
+    )
+
+
+@app.get("/scan_org")
+async def scan(
+    org: str,
+    settings: SettingsDependency,
+    github_api_client: GitHubAPIClientDependency,
+    user: bool = False,
+    metrics: str | None = None,
+) -> ScoreReposResponse:
+    """
+    Scan org endpoint (scores every repo of an organization, or of a user if user is true).
+    NOTE: Results are sorted by repo URL.  If the repos can't be listed, responds with a 502.
+    """
+
+    metric_classes = _get_metric_classes(
+        parse_metric_names(metrics) if metrics is not None else None
+    )
+
+    try:
+        repo_outcomes = [
+            repo_outcome
+            async for repo_outcome in scan_org(
+                org,
+                github_api_client,
+                settings.max_concurrency,
+                metric_classes,
+                is_user=user,
+            )
+        ]
+    except GitHubAPIError as error:
+        raise HTTPException(status_code=502, detail=str(error))
+
+    return ScoreReposResponse(
+        results=sorted(repo_outcomes, key=lambda repo_outcome: repo_outcome.repo_url)
+    )
+
+
+@app.post(
+    "/score_repos/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {NDJSON_MEDIA_TYPE: {}, SSE_MEDIA_TYPE: {}},
+            "description": "One outcome per unique repo URL (in completion order), then a summary.",
+        }
+    },
+)
+async def score_many_stream(
+    score_repos_request: ScoreReposRequest,
+    settings: SettingsDependency,
+    github_api_client: GitHubAPIClientDependency,
+    accept: str | None = Header(default=None),
+) -> StreamingResponse:
+    """
+    Streaming score repos endpoint.
+    Each outcome is sent as soon as its repo is scored (NDJSON by default, or Server-Sent Events
+    if the Accept header asks for text/event-stream), followed by a final summary record.
+    NOTE: If the client disconnects, the stream is cancelled, which cancels any pending fetches.
+    """
+
+    metric_classes = _get_metric_classes(score_repos_request.metrics)
+    unique_repo_urls = list(
+        dict.fromkeys(repo_url.strip() for repo_url in score_repos_request.repo_urls)
+    )
+    repo_outcomes = score_repos(
+        unique_repo_urls,
+        github_api_client,
+        settings.max_concurrency,
+        metric_classes,
+    )
+
+    if accept is not None and SSE_MEDIA_TYPE in accept:
+        return StreamingResponse(
+            _stream_server_sent_events(repo_outcomes),
+            media_type=SSE_MEDIA_TYPE,
+            # Ask proxies not to buffer (or cache) the stream
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return StreamingResponse(
+        _stream_ndjson(repo_outcomes), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+async def _stream_ndjson(
+    repo_outcomes: AsyncIterator[RepoOutcome],
+) -> AsyncIterator[str]:
+    """Stream outcomes as NDJSON records, followed by a summary record."""
+
+    async for record in _summarize_outcomes(repo_outcomes):
+        if isinstance(record, ScoreReposSummary):
+            yield ScoreReposSummaryRecord(summary=record).model_dump_json() + "\n"
+        else:
+            yield record.model_dump_json() + "\n"
+
+
+async def _stream_server_sent_events(
+    repo_outcomes: AsyncIterator[RepoOutcome],
+) -> AsyncIterator[str]:
+    """
+    Stream outcomes as Server-Sent Events ("outcome" events), followed by a "summary" event.
+    Reference: https://html.spec.whatwg.org/multipage/server-sent-events.html
+    """
+
+    async for record in _summarize_outcomes(repo_outcomes):
+        event = "summary" if isinstance(record, ScoreReposSummary) else "outcome"
+
+        yield f"event: {event}\ndata: {record.model_dump_json()}\n\n"
+
+
+async def _summarize_outcomes(
+    repo_outcomes: AsyncIterator[RepoOutcome],
+) -> AsyncIterator[RepoOutcome | ScoreReposSummary]:
+    """
+    Pass outcomes through, followed by a summary of them.
+    NOTE: Outcomes are counted as they pass, so they are never held in memory.
+    """
+
+    repo_count = 0
+    error_count = 0
+
+    async for repo_outcome in repo_outcomes:
+        repo_count += 1
+        error_count += repo_outcome.error is not None
+
+        yield repo_outcome
+
+    yield ScoreReposSummary(repo_count=repo_count, error_count=error_count)
+
+
+@app.get("/ratelimit")
+async def rate_limit(github_api_client: GitHubAPIClientDependency) -> RateLimitState:
+    """Rate limit endpoint (current GitHub API budget)."""
+
+    return github_api_client.rate_limit_state
+
+
+@app.get("/ratelimit/tokens")
+async def token_usage(
+    github_api_client: GitHubAPIClientDependency,
+) -> list[TokenUsage]:
+    """Token usage endpoint (requests and GitHub API budget per token)."""
+
+    return github_api_client.token_usage
+
+
+@app.get("/coalescing")
+async def coalescing(
+    github_api_client: GitHubAPIClientDependency,
+    scoring_single_flight: ScoringSingleFlightDependency,
+) -> CoalescingStats:
+    """Request coalescing endpoint (how many fetches and scorings joined one already in flight)."""
+
+    return CoalescingStats(
+        fetches=github_api_client.coalescing_stats,
+        scorings=scoring_single_flight.stats,
+    )
+
+
+@app.get("/watched")
+async def watched(watched_repos: WatchedReposDependency) -> WatchedReposStats:
+    """Watched repos endpoint (how many are loaded, and how many refreshes succeeded or failed)."""
 
-    return await score_repo(repo_url)
+    return watched_repos.stats
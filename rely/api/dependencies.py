@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+from typing import Annotated, AsyncIterator, cast
+
+from fastapi import Depends, FastAPI, Request
+
+from rely.config.settings import Settings
+from rely.clients.github_api_client import GitHubAPIClient
+from rely.clients.single_flight import SingleFlight
+from rely.services.repo_result_cache import RepoResultCache
+from rely.services.watched_repos_service import WatchedRepos, read_watched_repo_urls
+from rely.services.score_repo_service import (
+    RepoResult,
+    ScoringKey,
+    create_github_api_client,
+)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create application-lifetime components on startup and close them on shutdown.
+    NOTE: Sharing a single HTTP session across requests lets us reuse pooled
+          (keep-alive) connections instead of performing a new handshake per request.
+          Concurrent requests to score the same repo share a single scoring, and scored
+          results are cached (background refreshes are cancelled on shutdown).
+          Watched repos (if configured) are refreshed by a background task.
+    """
+
+    settings = Settings()
+
+    async with create_github_api_client(settings) as github_api_client:
+        app.state.settings = settings
+        app.state.github_api_client = github_api_client
+        app.state.scoring_single_flight = SingleFlight[ScoringKey, RepoResult]()
+        app.state.repo_result_cache = RepoResultCache(
+            app.state.scoring_single_flight,
+            max_size=settings.result_cache_max_size,
+            max_age=settings.result_max_age,
+            stale_while_revalidate=settings.result_stale_while_revalidate,
+            stale_if_error=settings.result_stale_if_error,
+            refresh_timeout=settings.result_refresh_timeout,
+            is_rate_limited=github_api_client.is_rate_limited,
+        )
+
+        app.state.watched_repos = WatchedRepos(
+            (
+                read_watched_repo_urls(settings.watched_repos_file)
+                if settings.watched_repos_file is not None
+                else []
+            ),
+            refresh_interval=settings.watched_repos_refresh_interval,
+            max_concurrency=settings.max_concurrency,
+        )
+        watched_repos_task = asyncio.create_task(
+            app.state.watched_repos.run(github_api_client)
+        )
+
+        try:
+            yield
+        finally:
+            watched_repos_task.cancel()
+            await asyncio.gather(watched_repos_task, return_exceptions=True)
+            await app.state.repo_result_cache.close()
+
+
+def get_settings(request: Request) -> Settings:
+    """Get application-lifetime settings."""
+
+    return cast(Settings, request.app.state.settings)
+
+
+def get_github_api_client(request: Request) -> GitHubAPIClient:
+    """Get application-lifetime GitHub API client."""
+
+    return cast(GitHubAPIClient, request.app.state.github_api_client)
+
+
+def get_scoring_single_flight(request: Request) -> SingleFlight[ScoringKey, RepoResult]:
+    """Get application-lifetime coalescer of concurrent scorings."""
+
+    return cast(
+        SingleFlight[ScoringKey, RepoResult], request.app.state.scoring_single_flight
+    )
+
+
+def get_repo_result_cache(request: Request) -> RepoResultCache:
+    """Get application-lifetime result cache."""
+
+    return cast(RepoResultCache, request.app.state.repo_result_cache)
+
+
+def get_watched_repos(request: Request) -> WatchedRepos:
+    """Get application-lifetime watched repos."""
+
+    return cast(WatchedRepos, request.app.state.watched_repos)
+
+
+SettingsDependency = Annotated[Settings, Depends(get_settings)]
+GitHubAPIClientDependency = Annotated[GitHubAPIClient, Depends(get_github_api_client)]
+ScoringSingleFlightDependency = Annotated[
+    SingleFlight[ScoringKey, RepoResult], Depends(get_scoring_single_flight)
+]
+RepoResultCacheDependency = Annotated[RepoResultCache, Depends(get_repo_result_cache)]
+WatchedReposDependency = Annotated[WatchedRepos, Depends(get_watched_repos)]
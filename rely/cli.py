@@ -1,24 +1,659 @@
+import asyncio
+import contextlib
+import pathlib
+import sys
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Collection,
+    Iterable,
+    TextIO,
+    Type,
+)
+
 import asyncclick as click
 from rich.console import Console
 from rich.table import Table
 
-from rely.services.score_repo_service import score_repo
+from rely.config.settings import Settings
+from rely.clients.disk_response_store import DiskResponseStore, get_default_cache_path
+from rely.clients.github_api_client import GitHubAPIClient, GitHubAPIError
+from rely.clients.http_client import HTTPClient
+from rely.clients.package_resolver import CachedPackageResolver, RegistryPackageResolver
+from rely.clients.response_cache import ResponseCache
+from rely.core.manifest_parser import ManifestError, parse_manifests
+from rely.core.metrics.base_metric import BaseMetric
+from rely.services.score_repo_service import (
+    RepoResult,
+    create_github_api_client,
+    create_github_graphql_client,
+    get_metric_classes,
+    parse_metric_names,
+)
+from rely.services.dependency_graph_service import (
+    DependencyGraphResult,
+    score_dependency_graph,
+)
+from rely.services.score_file_service import score_repo_context_lines
+from rely.services.score_repos_service import (
+    DependencyOutcome,
+    RepoOutcome,
+    scan_dependencies,
+    scan_org,
+    score_repos,
+    score_repos_with_graphql,
+)
+
+
+OUTPUT_FORMATS = ("table", "json", "ndjson")
+BACKENDS = ("rest", "graphql")
+
+
+class DefaultCommandGroup(click.Group):
+    """
+    Group that falls back to a default command, if no subcommand is given.
+    NOTE: This keeps "rely URL..." working alongside subcommands (like "rely score-file").
+    """
+
+    def __init__(self, *args: Any, default_command_name: str, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.default_command_name = default_command_name
+
+    async def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or (args[0] not in self.commands and args[0] != "--help"):
+            args = [self.default_command_name, *args]
+
+        return await super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup, default_command_name="score")
+def cli() -> None:
+    """Score GitHub repos (runs the "score" command if no command is given)."""
+
+
+def _parse_metric_classes(
+    ctx: click.Context, param: click.Parameter, metric_names: str | None
+) -> list[Type[BaseMetric]]:
+    """Parse the --metrics option into metric classes."""
+
+    try:
+        return get_metric_classes(
+            parse_metric_names(metric_names) if metric_names is not None else None
+        )
+    except ValueError as error:
+        raise click.BadParameter(str(error), ctx=ctx, param=param)
+
+
+# NOTE: Shared by all scoring commands, which receive the parsed metric classes
+metrics_option = click.option(
+    "--metrics",
+    "metric_classes",
+    default=None,
+    callback=_parse_metric_classes,
+    help="Comma-separated list of metrics to compute (like star_count_metric,last_commit_metric).  Defaults to all metrics.",
+)
+
+
+@cli.command("score")
+@click.argument("repo_urls", nargs=-1)
+@click.option(
+    "--file",
+    "-f",
+    "repo_url_file",
+    type=click.File("r"),
+    help="Read repo URLs from a file (one per line).  Use '-' to read from stdin.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of repos to score concurrently.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    show_default=True,
+    help="Output format.",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(BACKENDS),
+    default="rest",
+    show_default=True,
+    help="GitHub API to fetch repos with (graphql packs many repos into each request).",
+)
+@metrics_option
+@click.option(
+    "--max-age",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Seconds that cached responses are used without contacting GitHub.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Don't read or write the on-disk response cache.",
+)
+async def score(
+    repo_urls: tuple[str, ...],
+    repo_url_file: TextIO | None,
+    concurrency: int | None,
+    output_format: str,
+    backend: str,
+    metric_classes: list[Type[BaseMetric]],
+    max_age: float | None,
+    no_cache: bool,
+) -> None:
+    """Score repos by URL, and render repo results to terminal."""
+
+    if repo_url_file is None and not repo_urls and not sys.stdin.isatty():
+        repo_url_file = sys.stdin
+
+    if repo_url_file is None and not repo_urls:
+        raise click.UsageError("Provide at least one repo URL (or use --file).")
+
+    all_repo_urls = _chain_repo_urls(repo_urls, repo_url_file)
+
+    has_errors = await render(
+        all_repo_urls,
+        output_format,
+        concurrency,
+        backend=backend,
+        metric_classes=metric_classes,
+        use_cache=not no_cache,
+        max_age=max_age,
+    )
+
+    if has_errors:
+        sys.exit(1)
+
+
+@cli.command("score-file")
+@click.argument("repo_context_file", type=click.File("rb"))
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="ndjson",
+    show_default=True,
+    help="Output format.",
+)
+@metrics_option
+def score_file(
+    repo_context_file: BinaryIO,
+    output_format: str,
+    metric_classes: list[Type[BaseMetric]],
+) -> None:
+    """
+    Score archived repo contexts from an NDJSON file (one per line), without any network access.
+    Use '-' to read from stdin.
+    """
+
+    repo_outcomes = score_repo_context_lines(repo_context_file, metric_classes)
+
+    if render_outcomes(repo_outcomes, output_format):
+        sys.exit(1)
+
+
+@cli.command("scan-org")
+@click.argument("org")
+@click.option(
+    "--user",
+    "is_user",
+    is_flag=True,
+    default=False,
+    help="Scan a user's repos instead of an organization's.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of repos (and pages) to fetch concurrently.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    show_default=True,
+    help="Output format.",
+)
+@metrics_option
+@click.option(
+    "--max-age",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Seconds that cached responses are used without contacting GitHub.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Don't read or write the on-disk response cache.",
+)
+async def scan_org_command(
+    org: str,
+    is_user: bool,
+    concurrency: int | None,
+    output_format: str,
+    metric_classes: list[Type[BaseMetric]],
+    max_age: float | None,
+    no_cache: bool,
+) -> None:
+    """
+    Score every repo of a GitHub organization (or user).
+    Repo metadata comes from the repository listing (one request per 100 repos).
+    """
+
+    settings = Settings()
+    outcome_renderer = OutcomeRenderer(output_format)
+
+    async with contextlib.AsyncExitStack() as exit_stack:
+        github_api_client = await _enter_github_api_client(
+            exit_stack,
+            settings,
+            use_cache=not no_cache,
+            max_age=settings.disk_cache_max_age if max_age is None else max_age,
+        )
+        repo_outcomes = scan_org(
+            org,
+            github_api_client,
+            concurrency or settings.max_concurrency,
+            metric_classes,
+            is_user=is_user,
+        )
+
+        try:
+            with outcome_renderer:
+                async for repo_outcome in repo_outcomes:
+                    outcome_renderer.render(repo_outcome)
+        except GitHubAPIError as error:
+            raise click.ClickException(f"Could not list repos of {org}: {error}")
+
+    if outcome_renderer.has_errors:
+        sys.exit(1)
+
+
+@cli.command("scan")
+@click.argument(
+    "path",
+    type=click.Path(exists=True, path_type=pathlib.Path),
+    default=".",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of dependencies to resolve and score concurrently.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    show_default=True,
+    help="Output format.",
+)
+@metrics_option
+@click.option(
+    "--max-age",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Seconds that cached responses are used without contacting GitHub (or package registries).",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Don't read or write the on-disk response cache.",
+)
+@click.option(
+    "--graph",
+    is_flag=True,
+    default=False,
+    help="Score the transitive dependency graph, and summarize each dependency by its weakest link.",
+)
+@click.option(
+    "--max-depth",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Maximum depth of the dependency graph to walk (defaults to the whole graph).",
+)
+async def scan_command(
+    path: pathlib.Path,
+    concurrency: int | None,
+    output_format: str,
+    metric_classes: list[Type[BaseMetric]],
+    max_age: float | None,
+    no_cache: bool,
+    graph: bool,
+    max_depth: int | None,
+) -> None:
+    """
+    Score the GitHub repo of every dependency of a project.
+    PATH is a manifest (pyproject.toml, uv.lock, requirements*.txt or package.json),
+    or a project directory with manifests at its top level (defaults to the current directory).
+    """
+
+    try:
+        dependencies = parse_manifests(path)
+    except ManifestError as error:
+        raise click.BadParameter(str(error), param_hint="PATH")
+
+    settings = Settings()
+    max_age = settings.disk_cache_max_age if max_age is None else max_age
+    outcome_renderer = OutcomeRenderer(output_format)
+
+    async with contextlib.AsyncExitStack() as exit_stack:
+        disk_response_store = _enter_disk_response_store(
+            exit_stack, use_cache=not no_cache
+        )
+        github_api_client = await exit_stack.enter_async_context(
+            create_github_api_client(
+                settings,
+                response_store=disk_response_store,
+                max_age=max_age if disk_response_store is not None else None,
+            )
+        )
+        # NOTE: Registry responses share the on-disk cache, so repeat scans skip the registries too
+        registry_http_client = await exit_stack.enter_async_context(
+            HTTPClient(
+                pool_size=settings.http_pool_size,
+                keepalive_timeout=settings.http_keepalive_timeout,
+                response_store=disk_response_store,
+                max_age=max_age if disk_response_store is not None else None,
+            )
+        )
+        package_resolver = CachedPackageResolver(
+            RegistryPackageResolver(registry_http_client),
+            ResponseCache(settings.package_resolution_cache_max_size),
+            ttl=settings.package_resolution_cache_ttl,
+        )
+
+        if graph:
+            dependency_graph_result = await score_dependency_graph(
+                dependencies,
+                package_resolver,
+                github_api_client,
+                concurrency or settings.max_concurrency,
+                metric_classes,
+                max_depth=max_depth,
+            )
+
+            if render_dependency_graph(dependency_graph_result, output_format):
+                sys.exit(1)
+
+            return
+
+        with outcome_renderer:
+            async for dependency_outcome in scan_dependencies(
+                dependencies,
+                package_resolver,
+                github_api_client,
+                concurrency or settings.max_concurrency,
+                metric_classes,
+            ):
+                outcome_renderer.render(dependency_outcome)
+
+    if outcome_renderer.has_errors:
+        sys.exit(1)
+
+
+async def _chain_repo_urls(
+    repo_urls: Iterable[str], repo_url_file: TextIO | None
+) -> AsyncIterator[str]:
+    """
+    Yield repo URLs from arguments, then from file (skipping blank lines and comments).
+    NOTE: Lines are read in a thread, so that a slow producer (like a pipe into stdin) doesn't
+          block requests that are already in flight.
+    """
+
+    for repo_url in repo_urls:
+        yield repo_url
+
+    if repo_url_file is None:
+        return
 
+    while line := await asyncio.to_thread(repo_url_file.readline):
+        repo_url = line.strip()
 
-@click.command()
-@click.argument("repo_url")
-async def cli(repo_url: str) -> None:
-    """Handle CLI options and render repo results to terminal."""
+        if repo_url and not repo_url.startswith("#"):
+            yield repo_url
 
-    await render(repo_url)
 
+async def render(
+    repo_urls: Iterable[str] | AsyncIterable[str],
+    output_format: str,
+    concurrency: int | None = None,
+    *,
+    backend: str = "rest",
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+    use_cache: bool = True,
+    max_age: float | None = None,
+) -> bool:
+    """
+    Score repos concurrently and render each result as soon as it is available.
+    Returns True if any repo could not be scored.
+    NOTE: Unless disabled, responses are cached on disk between runs.  Cached responses
+          younger than max_age are used without contacting GitHub, older ones are revalidated.
+          The on-disk cache only applies to the REST backend.
+    """
+
+    settings = Settings()
+    max_concurrency = concurrency or settings.max_concurrency
+    max_age = settings.disk_cache_max_age if max_age is None else max_age
+    outcome_renderer = OutcomeRenderer(output_format)
+
+    async with contextlib.AsyncExitStack() as exit_stack:
+        if backend == "graphql":
+            github_graphql_client = await exit_stack.enter_async_context(
+                create_github_graphql_client(settings)
+            )
+            repo_outcomes = score_repos_with_graphql(
+                repo_urls, github_graphql_client, max_concurrency, metric_classes
+            )
+        else:
+            github_api_client = await _enter_github_api_client(
+                exit_stack, settings, use_cache=use_cache, max_age=max_age
+            )
+            repo_outcomes = score_repos(
+                repo_urls, github_api_client, max_concurrency, metric_classes
+            )
+
+        with outcome_renderer:
+            async for repo_outcome in repo_outcomes:
+                outcome_renderer.render(repo_outcome)
+
+    return outcome_renderer.has_errors
+
+
+async def _enter_github_api_client(
+    exit_stack: contextlib.AsyncExitStack,
+    settings: Settings,
+    *,
+    use_cache: bool,
+    max_age: float,
+) -> GitHubAPIClient:
+    """Create a GitHubAPIClient (backed by the on-disk cache, unless disabled) that is closed with the exit stack."""
+
+    disk_response_store = _enter_disk_response_store(exit_stack, use_cache=use_cache)
+
+    return await exit_stack.enter_async_context(
+        create_github_api_client(
+            settings,
+            response_store=disk_response_store,
+            max_age=max_age if use_cache else None,
+        )
+    )
+
+
+def _enter_disk_response_store(
+    exit_stack: contextlib.AsyncExitStack, *, use_cache: bool
+) -> DiskResponseStore | None:
+    """Open the on-disk cache (unless disabled), which is closed with the exit stack."""
+
+    if not use_cache:
+        return None
+
+    disk_response_store = DiskResponseStore(get_default_cache_path())
+    exit_stack.callback(disk_response_store.close)
+
+    return disk_response_store
+
+
+def render_outcomes(repo_outcomes: Iterable[RepoOutcome], output_format: str) -> bool:
+    """
+    Render repo outcomes as soon as each one is available.
+    Returns True if any repo could not be scored.
+    """
+
+    outcome_renderer = OutcomeRenderer(output_format)
+
+    with outcome_renderer:
+        for repo_outcome in repo_outcomes:
+            outcome_renderer.render(repo_outcome)
+
+    return outcome_renderer.has_errors
+
+
+class OutcomeRenderer:
+    """
+    Renderer of a stream of repo (or dependency) outcomes (one at a time, so output streams too).
+    NOTE: Used as a context manager, which opens and closes the JSON array.
+    """
+
+    def __init__(self, output_format: str) -> None:
+        self.output_format = output_format
+        self.has_errors = False
+        self._console = Console()
+        self._is_first_outcome = True
+
+    def __enter__(self) -> "OutcomeRenderer":
+        if self.output_format == "json":
+            click.echo("[")
+
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self.output_format == "json":
+            click.echo("]")
+
+    def render(self, outcome: RepoOutcome | DependencyOutcome) -> None:
+        """Render a single repo (or dependency) outcome."""
+
+        self.has_errors = self.has_errors or outcome.error is not None
+
+        if self.output_format == "table":
+            if isinstance(outcome, DependencyOutcome):
+                render_dependency_line(self._console, outcome)
+            else:
+                render_table(self._console, outcome)
+        elif self.output_format == "json":
+            separator = "" if self._is_first_outcome else ","
+            click.echo(f"{separator}{outcome.model_dump_json()}")
+        else:
+            click.echo(outcome.model_dump_json())
+
+        self._is_first_outcome = False
+
+
+def render_table(console: Console, repo_outcome: RepoOutcome) -> None:
+    """Render a single repo outcome to terminal as a table."""
+
+    if repo_outcome.result is None:
+        console.print(
+            f"[red]Could not score {repo_outcome.repo_url}: {repo_outcome.error}[/red]"
+        )
+
+        return
+
+    console.print(build_table(repo_outcome.repo_url, repo_outcome.result))
+    console.print(f"Overall score is {repo_outcome.result.overall_score_int}%")
+
+
+def render_dependency_line(
+    console: Console, dependency_outcome: DependencyOutcome
+) -> None:
+    """Render a single dependency outcome to terminal as a line."""
+
+    dependency = dependency_outcome.dependency
+    name = f"{dependency.name} ({dependency.ecosystem.value})"
+
+    if dependency_outcome.result is None:
+        console.print(f"[red]Could not score {name}: {dependency_outcome.error}[/red]")
+
+        return
+
+    console.print(
+        f"{name} {dependency_outcome.repo_url} "
+        f"[green]{dependency_outcome.result.overall_score_int}%[/green]"
+    )
+
+
+def render_dependency_graph(
+    dependency_graph_result: DependencyGraphResult, output_format: str
+) -> bool:
+    """
+    Render a scored dependency graph (a summary per top-level dependency).
+    Returns True if any top-level dependency could not be scored.
+    """
+
+    if output_format == "table":
+        Console().print(build_dependency_graph_table(dependency_graph_result))
+    elif output_format == "json":
+        click.echo(dependency_graph_result.model_dump_json())
+    else:
+        for summary in dependency_graph_result.summaries:
+            click.echo(summary.model_dump_json())
+
+    top_level_dependencies = {
+        summary.dependency for summary in dependency_graph_result.summaries
+    }
+
+    return any(
+        node.error is not None
+        for node in dependency_graph_result.nodes
+        if node.dependency in top_level_dependencies
+    )
+
+
+def build_dependency_graph_table(
+    dependency_graph_result: DependencyGraphResult,
+) -> Table:
+    """Build a table of weakest links for a scored dependency graph."""
+
+    table = Table(title="Rely scores by weakest link")
+
+    table.add_column("Dependency", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Packages", style="magenta")
+    table.add_column("Unscored", style="red")
+    table.add_column("Weakest link", style="yellow")
+    table.add_column("Score", justify="right", style="green")
+
+    for summary in dependency_graph_result.summaries:
+        table.add_row(
+            f"{summary.dependency.name} ({summary.dependency.ecosystem.value})",
+            str(summary.package_count),
+            str(summary.error_count),
+            summary.weakest_dependency.name if summary.weakest_dependency else "-",
+            f"{summary.weakest_score_int}%"
+            if summary.weakest_score_int is not None
+            else "-",
+        )
 
-async def render(repo_url: str) -> None:
-    """Render repo results to terminal."""
+    return table
 
-    repo_result = await score_repo(repo_url)
 
-    console = Console()
+def build_table(repo_url: str, repo_result: RepoResult) -> Table:
+    """Build a table of metrics for a repo result."""
 
     table = Table(title=f"Rely score for {repo_url}")
 
@@ -31,11 +666,10 @@ async def render(repo_url: str) -> None:
     for metric in repo_result.metrics:
         table.add_row(
             metric.prettified_name,
-            str(metric.metric_value),
+            "-" if metric.metric_value is None else str(metric.metric_value),
             f"{metric.metric_score}/{repo_result.maximum_metric_score}",
             str(metric.metric_weight),
             str(metric.metric_weighted_score),
         )
 
-    console.print(table)
-    console.print(f"Overall score is {repo_result.overall_score_int}%")
+    return table
@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Final
+
+from rely.clients.response_store import StoredResponse
+
+
+_CREATE_TABLE_STATEMENT: Final[str] = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL
+)
+"""
+
+
+def get_default_cache_path() -> Path:
+    """Get default cache path (in the XDG cache directory)."""
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(xdg_cache_home) / "rely" / "responses.sqlite3"
+
+
+class DiskResponseStore:
+    """
+    Persistent response store, backed by SQLite.
+    NOTE: Bodies are stored as zlib-compressed (raw) JSON.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(path)
+        # WAL mode avoids an fsync per write, which matters when storing thousands of responses
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_CREATE_TABLE_STATEMENT)
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Close database connection."""
+
+        self._connection.close()
+
+    def get(self, url: str) -> StoredResponse | None:
+        row = self._connection.execute(
+            "SELECT fetched_at, etag, last_modified, body FROM responses WHERE url = ?",
+            (url,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        fetched_at, etag, last_modified, compressed_body = row
+
+        return StoredResponse(
+            body=zlib.decompress(compressed_body),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def set(self, url: str, stored_response: StoredResponse) -> None:
+        compressed_body = zlib.compress(stored_response.body)
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (url, fetched_at, etag, last_modified, body) VALUES (?, ?, ?, ?, ?)",
+            (
+                url,
+                stored_response.fetched_at,
+                stored_response.etag,
+                stored_response.last_modified,
+                compressed_body,
+            ),
+        )
+        self._connection.commit()
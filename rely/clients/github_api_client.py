@@ -1,10 +1,23 @@
-from typing import Final, Any
+import asyncio
+import re
+import urllib.parse
+from typing import Any, Final, Mapping, NamedTuple
 from types import MappingProxyType
 
 import aiohttp
+from pydantic import TypeAdapter, ValidationError
 
-from rely.clients.http_client import HTTPClient
-from rely.clients.models.full_repository import FullRepository
+from rely.clients.http_client import HTTPClient, HTTPResponse
+from rely.clients.rate_limiter import (
+    RETRYABLE_STATUSES,
+    RateLimitState,
+    is_rate_limited,
+)
+from rely.clients.response_cache import CacheStats, ResponseCache
+from rely.clients.single_flight import SingleFlight, SingleFlightStats
+from rely.clients.token_pool import TokenPool, TokenUsage
+from rely.clients.models.scoring_repository import ScoringRepository
+from rely.clients.models.scoring_content_tree import ScoringContentTree
 from rely.clients.models.content_tree_list import ContentTreeList
 from rely.core.models.repo_identifier import RepoIdentifier
 
@@ -15,36 +28,140 @@ class GitHubAPIError(Exception):
     pass
 
 
+class GitHubUnavailableError(GitHubAPIError):
+    """Exception for requests that kept failing because GitHub is rate limiting, unavailable or unreachable."""
+
+    pass
+
+
+# Validates a contents listing (a bare JSON array) straight from the response body
+_CONTENT_TREES_ADAPTER: Final[TypeAdapter[list[ScoringContentTree]]] = TypeAdapter(
+    list[ScoringContentTree]
+)
+# Validates a page of a repository listing straight from the response body
+_REPOS_ADAPTER: Final[TypeAdapter[list[ScoringRepository]]] = TypeAdapter(
+    list[ScoringRepository]
+)
+# Decodes a page of a repository listing without validating its items (to validate them one by one)
+_REPO_ITEMS_ADAPTER: Final[TypeAdapter[list[dict[str, Any]]]] = TypeAdapter(
+    list[dict[str, Any]]
+)
+# Matches the URL of the last page in a Link header
+_LAST_PAGE_LINK_PATTERN: Final[re.Pattern[str]] = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+
+class InvalidRepository(NamedTuple):
+    """A repository from a repository listing that failed validation."""
+
+    full_name: str
+    error: str
+
+
 class GitHubAPIClient:
     """Minimal GitHub API client for interacting with repos."""
 
     API_BASE_URL: Final[str] = "https://api.github.com"
+    # Maximum page size of list endpoints
+    REPOS_PER_PAGE: Final[int] = 100
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        personal_access_token: str | None = None,
+        *,
+        token_pool: TokenPool | None = None,
+        response_cache: ResponseCache[ScoringRepository | ContentTreeList]
+        | None = None,
+        repo_cache_ttl: float = 300.0,
+        contents_cache_ttl: float = 900.0,
+        max_retries: int = 3,
+    ) -> None:
+        """
+        Initialize client.
+        NOTE: If a response cache is given, validated responses are cached (per URL),
+              which skips both the network and validation for repeat lookups.
+              Requests are paced by the rate limiter of the token they use, and rate limited
+              (or failed) GET requests are retried up to max_retries times.
+              Exactly one of personal_access_token and token_pool must be given; with a token
+              pool, requests are spread across its tokens.
+              Both the response cache and the coalescing of concurrent fetches (which share a
+              single request) ignore the case of URLs, like GitHub does.
+        """
+
+        if personal_access_token is not None and token_pool is None:
+            token_pool = TokenPool([personal_access_token])
+        elif personal_access_token is not None or token_pool is None:
+            raise ValueError(
+                "Exactly one of personal_access_token and token_pool is required"
+            )
 
-    def __init__(self, http_client: HTTPClient, personal_access_token: str) -> None:
         self._http_client = http_client
-        self._personal_access_token = personal_access_token
+        self._token_pool = token_pool
+        self._response_cache = response_cache
+        self._repo_cache_ttl = repo_cache_ttl
+        self._contents_cache_ttl = contents_cache_ttl
+        self._max_retries = max_retries
+        self._repo_single_flight: SingleFlight[str, ScoringRepository] = SingleFlight()
+        self._contents_single_flight: SingleFlight[str, ContentTreeList] = (
+            SingleFlight()
+        )
+
+    @property
+    def rate_limit_state(self) -> RateLimitState:
+        """Get current rate limit budget (combined for all tokens)."""
+
+        return self._token_pool.state
+
+    def is_rate_limited(self) -> bool:
+        """Check whether requests would have to wait for a rate limit to reset (or for a backoff to end)."""
+
+        return not self._token_pool.is_available()
+
+    @property
+    def token_usage(self) -> list[TokenUsage]:
+        """Get usage (and rate limit budget) per token."""
+
+        return self._token_pool.usage
 
     @property
-    def headers(self) -> MappingProxyType[str, str]:
-        return MappingProxyType(
-            {
-                "Authorization": f"Bearer {self._personal_access_token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
+    def cache_stats(self) -> CacheStats | None:
+        """Get response cache counters (None if caching is disabled)."""
+
+        if self._response_cache is None:
+            return None
+
+        return self._response_cache.stats
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        """Get request coalescing counters (fetches performed and fetches that joined one in flight)."""
+
+        repo_stats = self._repo_single_flight.stats
+        contents_stats = self._contents_single_flight.stats
+
+        return SingleFlightStats(
+            calls=repo_stats.calls + contents_stats.calls,
+            coalesced=repo_stats.coalesced + contents_stats.coalesced,
+            in_flight=repo_stats.in_flight + contents_stats.in_flight,
         )
 
-    async def get_repo(self, repo_identifier: RepoIdentifier) -> FullRepository:
+    async def get_repo(self, repo_identifier: RepoIdentifier) -> ScoringRepository:
         """
         Get a repository.
         Reference: https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#get-a-repository
         """
 
         url = f"{self.API_BASE_URL}/repos/{repo_identifier.repo_owner}/{repo_identifier.repo_name}"
-        response = await self._perform_get_request(url)
 
-        # TODO: Add error handling
-        return FullRepository.model_validate(response)
+        cache_key = _get_cache_key(url)
+
+        cached_full_repository = self._get_cached(cache_key)
+        if isinstance(cached_full_repository, ScoringRepository):
+            return cached_full_repository
+
+        return await self._repo_single_flight.run(
+            cache_key, lambda: self._fetch_repo(url, cache_key)
+        )
 
     async def get_repo_contents(self, contents_url: str) -> ContentTreeList:
         """
@@ -55,23 +172,272 @@ class GitHubAPIClient:
 
         # Remove "/{+path}" from the end of the contents URL
         url = contents_url.rstrip("/{+path}")
-        response = await self._perform_get_request(url)
+
+        cache_key = _get_cache_key(url)
+
+        cached_content_tree_list = self._get_cached(cache_key)
+        if isinstance(cached_content_tree_list, ContentTreeList):
+            return cached_content_tree_list
+
+        return await self._contents_single_flight.run(
+            cache_key, lambda: self._fetch_repo_contents(url, cache_key)
+        )
+
+    async def get_repo_root_contents(
+        self, repo_identifier: RepoIdentifier
+    ) -> ContentTreeList:
+        """
+        Get the contents of a repository's root directory.
+        NOTE: The contents URL is built from the repo identifier, so this doesn't need to wait for get_repo
+        """
+
+        contents_url = f"{self.API_BASE_URL}/repos/{repo_identifier.repo_owner}/{repo_identifier.repo_name}/contents"
+
+        return await self.get_repo_contents(contents_url)
+
+    async def list_owner_repos(
+        self, owner: str, *, is_user: bool = False, max_concurrency: int = 10
+    ) -> list[ScoringRepository | InvalidRepository]:
+        """
+        List the repositories of an organization (or a user), 100 per page.
+        Reference: https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#list-organization-repositories
+        NOTE: Once the first page reports the page count (in its Link header), all other pages are
+              fetched concurrently (at most max_concurrency at a time).  If it doesn't (like a fresh
+              stored response, which has no headers), pages are fetched one by one until one isn't full.
+              Repositories that fail validation are listed as InvalidRepository (instead of failing
+              the whole listing), and pages that can't be decoded raise a GitHubAPIError.
+        """
+
+        owner_type = "users" if is_user else "orgs"
+        url = f"{self.API_BASE_URL}/{owner_type}/{urllib.parse.quote(owner)}/repos"
+
+        first_page = await self._perform_get_response(_get_page_url(url, 1))
+        full_repositories = _validate_repos_page(first_page.body)
+        last_page = _get_last_page(first_page.headers)
+
+        if last_page is not None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _get_page(
+                page: int,
+            ) -> list[ScoringRepository | InvalidRepository]:
+                async with semaphore:
+                    return await self._get_repos_page(url, page)
+
+            pages = await asyncio.gather(
+                *(_get_page(page) for page in range(2, last_page + 1))
+            )
+
+            for page_full_repositories in pages:
+                full_repositories.extend(page_full_repositories)
+
+            return full_repositories
+
+        page = 1
+        page_full_repositories = full_repositories
+
+        while len(page_full_repositories) == self.REPOS_PER_PAGE:
+            page += 1
+            page_full_repositories = await self._get_repos_page(url, page)
+            full_repositories.extend(page_full_repositories)
+
+        return full_repositories
+
+    async def _fetch_repo(self, url: str, cache_key: str) -> ScoringRepository:
+        """Fetch (and cache) a repository."""
+
+        body = await self._perform_get_request(url)
+
+        # TODO: Add error handling
+        full_repository = ScoringRepository.model_validate_json(body)
+        self._set_cached(cache_key, full_repository, self._repo_cache_ttl)
+
+        return full_repository
+
+    async def _fetch_repo_contents(self, url: str, cache_key: str) -> ContentTreeList:
+        """Fetch (and cache) the contents of a repository."""
+
+        body = await self._perform_get_request(url)
 
         # TODO: Add error handling
-        return ContentTreeList(content_tree_list=response)
+        # NOTE: The entries were just validated, so the wrapper is constructed without revalidation
+        content_tree_list = ContentTreeList.model_construct(
+            content_tree_list=_CONTENT_TREES_ADAPTER.validate_json(body)
+        )
+        self._set_cached(cache_key, content_tree_list, self._contents_cache_ttl)
+
+        return content_tree_list
+
+    async def _get_repos_page(
+        self, url: str, page: int
+    ) -> list[ScoringRepository | InvalidRepository]:
+        """Get a single page of a repository listing."""
+
+        response = await self._perform_get_response(_get_page_url(url, page))
+
+        return _validate_repos_page(response.body)
+
+    def _get_cached(self, cache_key: str) -> ScoringRepository | ContentTreeList | None:
+        """Get a validated response from the response cache (if enabled)."""
+
+        if self._response_cache is None:
+            return None
 
-    async def _perform_get_request(self, url: str) -> Any:
+        return self._response_cache.get(cache_key)
+
+    def _set_cached(
+        self,
+        cache_key: str,
+        response: ScoringRepository | ContentTreeList,
+        ttl: float,
+    ) -> None:
+        """Store a validated response in the response cache (if enabled)."""
+
+        if self._response_cache is not None:
+            self._response_cache.set(cache_key, response, ttl)
+
+    async def _perform_get_request(self, url: str) -> bytes:
         """
         Perform HTTP request and handle errors.
+        NOTE: Returns the raw body, which is parsed and validated in a single pass.
+        """
+
+        response = await self._perform_get_response(url)
+
+        return response.body
+
+    async def _perform_get_response(self, url: str) -> HTTPResponse:
+        """
+        Perform HTTP request and handle errors (returning the whole response, along with its headers).
+        NOTE: Timeouts and connection errors are retried like server errors.
         Reference: https://docs.github.com/en/rest/using-the-rest-api/troubleshooting-the-rest-api?apiVersion=2022-11-28
         """
 
+        for attempt in range(self._max_retries + 1):
+            # NOTE: Each attempt selects a token, so a rate limited request is retried with another token
+            pooled_token = self._token_pool.select()
+            rate_limiter = pooled_token.rate_limiter
+
+            try:
+                response = await self._http_client.get_response(
+                    url=url,
+                    headers=_get_headers(await pooled_token.get_token()),
+                    before_request=pooled_token.acquire,
+                )
+            except aiohttp.ClientResponseError as error:
+                is_retryable = (
+                    is_rate_limited(error.status, error.headers)
+                    or error.status in RETRYABLE_STATUSES
+                )
+
+                if not is_retryable or attempt == self._max_retries:
+                    rate_limiter.update(error.headers)
+                    error_class = (
+                        GitHubUnavailableError if is_retryable else GitHubAPIError
+                    )
+
+                    raise error_class(
+                        f"Received {error.status} response with message: {error.message}"
+                    )
+
+                rate_limiter.back_off(error.status, error.headers, attempt)
+            except (aiohttp.ClientConnectionError, TimeoutError) as error:
+                if attempt == self._max_retries:
+                    raise GitHubUnavailableError(
+                        f"Could not reach GitHub: {_describe_error(error)}"
+                    )
+
+                rate_limiter.back_off(None, None, attempt)
+            else:
+                rate_limiter.update(response.headers)
+
+                return response
+
+        # NOTE: This is unreachable, since the last attempt either returns or raises
+        raise GitHubAPIError("Exceeded maximum number of retries")
+
+
+def _describe_error(error: Exception) -> str:
+    """Describe an error (by its type, if it has no message, like most timeouts)."""
+
+    return str(error) or type(error).__name__
+
+
+def _get_headers(token: str) -> MappingProxyType[str, str]:
+    """Get request headers for a token."""
+
+    return MappingProxyType(
+        {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+    )
+
+
+def _validate_repos_page(body: bytes) -> list[ScoringRepository | InvalidRepository]:
+    """
+    Validate a page of a repository listing.
+    NOTE: The whole page is validated in a single pass, unless some repository is invalid, in which
+          case repositories are validated one by one (so that only the invalid ones are dropped).
+    """
+
+    try:
+        return list(_REPOS_ADAPTER.validate_json(body))
+    except ValidationError:
+        pass
+
+    try:
+        repo_items = _REPO_ITEMS_ADAPTER.validate_json(body)
+    except ValidationError as error:
+        raise GitHubAPIError(f"Received an invalid repository listing: {error}")
+
+    full_repositories: list[ScoringRepository | InvalidRepository] = []
+
+    for repo_item in repo_items:
         try:
-            return await self._http_client.get(
-                url=url,
-                headers=self.headers,
-            )
-        except aiohttp.ClientResponseError as error:
-            raise GitHubAPIError(
-                f"Received {error.status} response with message: {error.message}"
+            full_repositories.append(ScoringRepository.model_validate(repo_item))
+        except ValidationError as error:
+            full_repositories.append(
+                InvalidRepository(
+                    full_name=str(repo_item.get("full_name", "unknown")),
+                    error=f"Invalid repository: {error}",
+                )
             )
+
+    return full_repositories
+
+
+def _get_cache_key(url: str) -> str:
+    """
+    Get the key of a URL in the response cache (and for coalescing concurrent fetches).
+    NOTE: GitHub matches owner and repo names case-insensitively, so URLs differing only in case
+          share a single cache entry.
+    """
+
+    return url.lower()
+
+
+def _get_page_url(url: str, page: int) -> str:
+    """Get the URL of a page of a list endpoint (with the maximum page size)."""
+
+    return f"{url}?per_page={GitHubAPIClient.REPOS_PER_PAGE}&page={page}"
+
+
+def _get_last_page(headers: Mapping[str, str]) -> int | None:
+    """
+    Get the number of the last page from a Link header (None if there is no last page link).
+    Reference: https://docs.github.com/en/rest/using-the-rest-api/using-pagination-in-the-rest-api?apiVersion=2022-11-28
+    """
+
+    match = _LAST_PAGE_LINK_PATTERN.search(headers.get("Link", ""))
+
+    if match is None:
+        return None
+
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(match.group(1)).query)
+
+    try:
+        return int(query["page"][0])
+    except (KeyError, ValueError):
+        return None
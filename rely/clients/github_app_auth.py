@@ -0,0 +1,166 @@
+import asyncio
+import datetime
+import time
+from typing import Callable, Final, NamedTuple
+
+import aiohttp
+
+from rely.clients.http_client import HTTPClient
+from rely.clients.github_api_client import GitHubAPIClient, GitHubAPIError
+
+
+class InstallationToken(NamedTuple):
+    """Installation access token, along with its expiry (Unix timestamp in seconds)."""
+
+    token: str
+    expires_at: float
+
+
+class GitHubAppTokenProvider:
+    """
+    Provider of GitHub App installation access tokens.
+    A JWT is signed locally with the App's private key and exchanged for an installation token,
+    which is cached until shortly before it expires.
+    Reference: https://docs.github.com/en/apps/creating-github-apps/authenticating-with-a-github-app/authenticating-as-a-github-app-installation
+    NOTE: Requires the "app" extra (PyJWT with cryptography) for signing JWTs.
+    """
+
+    # GitHub rejects JWTs that expire more than 10 minutes in the future
+    JWT_LIFETIME: Final[float] = 540.0
+    # Issue JWTs in the past to allow for clock drift
+    JWT_CLOCK_DRIFT: Final[float] = 60.0
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        app_id: str,
+        private_key: str,
+        installation_id: int,
+        *,
+        api_base_url: str = GitHubAPIClient.API_BASE_URL,
+        refresh_margin: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize token provider.
+        NOTE: Tokens are refreshed once they expire within refresh_margin seconds.  Until they
+              actually expire, the cached token keeps being returned while the refresh runs in
+              the background, so requests never wait for a refresh unless they have to.
+        """
+
+        self._http_client = http_client
+        self._app_id = app_id
+        self._private_key = private_key
+        self._installation_id = installation_id
+        self._api_base_url = api_base_url
+        self._refresh_margin = refresh_margin
+        self._clock = clock
+        self._installation_token: InstallationToken | None = None
+        # At most one refresh is in flight, and every caller shares it
+        self._refresh_task: asyncio.Task[InstallationToken] | None = None
+
+    @property
+    def token_hint(self) -> str:
+        """Get a hint that identifies the installation without revealing its tokens."""
+
+        return f"app-installation-{self._installation_id}"
+
+    async def get_token(self) -> str:
+        """Get a currently valid installation token (refreshing it if needed)."""
+
+        now = self._clock()
+        installation_token = self._installation_token
+
+        if installation_token is None or installation_token.expires_at <= now:
+            return (await self._refresh()).token
+
+        if installation_token.expires_at - self._refresh_margin <= now:
+            self._start_refresh()
+
+        return installation_token.token
+
+    def create_jwt(self) -> str:
+        """Create a JWT (signed with the App's private key) to authenticate as the App."""
+
+        try:
+            import jwt
+        except ImportError as error:
+            raise ImportError(
+                'GitHub App authentication requires the "app" extra (like "pip install rely[app]")'
+            ) from error
+
+        now = self._clock()
+
+        return jwt.encode(
+            {
+                "iat": int(now - self.JWT_CLOCK_DRIFT),
+                "exp": int(now + self.JWT_LIFETIME),
+                "iss": self._app_id,
+            },
+            self._private_key,
+            algorithm="RS256",
+        )
+
+    async def _refresh(self) -> InstallationToken:
+        """Wait for a (shared) refresh of the installation token."""
+
+        # NOTE: Shielded, so that a cancelled caller doesn't cancel the refresh for everyone else
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Task[InstallationToken]:
+        """Start refreshing the installation token, unless a refresh is already in flight."""
+
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._perform_refresh())
+            # Background refreshes may fail without anyone awaiting them (the next call retries)
+            self._refresh_task.add_done_callback(_retrieve_exception)
+
+        return self._refresh_task
+
+    async def _perform_refresh(self) -> InstallationToken:
+        """Exchange a freshly signed JWT for an installation token, and cache it."""
+
+        try:
+            installation_token = await self._create_installation_token()
+            self._installation_token = installation_token
+
+            return installation_token
+        finally:
+            self._refresh_task = None
+
+    async def _create_installation_token(self) -> InstallationToken:
+        """
+        Create an installation access token.
+        Reference: https://docs.github.com/en/rest/apps/apps?apiVersion=2022-11-28#create-an-installation-access-token-for-an-app
+        """
+
+        url = f"{self._api_base_url}/app/installations/{self._installation_id}/access_tokens"
+
+        try:
+            response = await self._http_client.post(
+                url=url,
+                json=None,
+                headers={
+                    "Authorization": f"Bearer {self.create_jwt()}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+            )
+        except aiohttp.ClientResponseError as error:
+            raise GitHubAPIError(
+                f"Received {error.status} response with message: {error.message}"
+            )
+
+        return InstallationToken(
+            token=response["token"],
+            expires_at=datetime.datetime.fromisoformat(
+                response["expires_at"]
+            ).timestamp(),
+        )
+
+
+def _retrieve_exception(task: asyncio.Task[InstallationToken]) -> None:
+    """Mark a task's exception as retrieved (to avoid "never retrieved" warnings)."""
+
+    if not task.cancelled():
+        task.exception()
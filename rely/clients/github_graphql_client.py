@@ -0,0 +1,301 @@
+import datetime
+import itertools
+from typing import Any, Final, Mapping, NamedTuple, Sequence
+from types import MappingProxyType
+
+import aiohttp
+
+from rely.clients.http_client import HTTPClient
+from rely.clients.github_api_client import GitHubAPIError
+from rely.clients.token_pool import TokenProvider
+from rely.clients.models.scoring_repository import ScoringLicense, ScoringRepository
+from rely.clients.models.scoring_content_tree import ScoringContentTree
+from rely.clients.models.content_tree_list import ContentTreeList
+from rely.core.models.repo_identifier import RepoIdentifier
+
+
+# All repository fields that metrics need (root directory entries are read from the HEAD tree)
+_REPOSITORY_FRAGMENT: Final[str] = """
+fragment RepositoryFields on Repository {
+  name
+  nameWithOwner
+  description
+  stargazerCount
+  forkCount
+  isArchived
+  isDisabled
+  pushedAt
+  licenseInfo { key name spdxId }
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  object(expression: "HEAD:") {
+    ... on Tree {
+      entries { name path type mode oid object { ... on Blob { byteSize } } }
+    }
+  }
+}
+"""
+
+# GraphQL errors that mean a query was too expensive (and should be split)
+_QUERY_COST_ERROR_TYPES: Final[frozenset[str]] = frozenset(
+    {"MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED"}
+)
+# HTTP statuses that GitHub returns when a query times out
+_QUERY_TIMEOUT_STATUSES: Final[frozenset[int]] = frozenset({502, 504})
+
+# Tree entry types, mapped to their REST contents API equivalents
+_ENTRY_TYPES: Final[Mapping[str, str]] = MappingProxyType(
+    {"blob": "file", "tree": "dir", "commit": "submodule"}
+)
+_SYMLINK_MODE: Final[int] = 0o120000
+
+
+class GraphQLRepository(NamedTuple):
+    """Repository data fetched with GraphQL, in the same shape as the REST API models."""
+
+    full_repository: ScoringRepository
+    content_tree_list: ContentTreeList
+
+
+class _QueryCostError(Exception):
+    """Raised when a query is too expensive for GitHub to execute."""
+
+
+class GitHubGraphQLClient:
+    """
+    Minimal GitHub GraphQL API client for fetching many repositories per request.
+    Reference: https://docs.github.com/en/graphql
+    """
+
+    GRAPHQL_URL: Final[str] = "https://api.github.com/graphql"
+    # Rough estimate of the number of nodes that a single repository alias costs
+    ESTIMATED_REPO_COST: Final[int] = 100
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        personal_access_token: str | TokenProvider,
+        *,
+        graphql_url: str = GRAPHQL_URL,
+        max_query_cost: int = 5_000,
+    ) -> None:
+        """
+        Initialize client.
+        NOTE: max_query_cost bounds the estimated cost of a single query, which bounds
+              the number of repositories that are packed into it.
+        """
+
+        self._http_client = http_client
+        self._personal_access_token = personal_access_token
+        self._graphql_url = graphql_url
+        self._max_query_cost = max_query_cost
+
+    async def get_headers(self) -> MappingProxyType[str, str]:
+        """Get request headers (the token is fetched from its provider, if any)."""
+
+        if isinstance(self._personal_access_token, str):
+            token = self._personal_access_token
+        else:
+            token = await self._personal_access_token.get_token()
+
+        return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+    @property
+    def max_repos_per_query(self) -> int:
+        """Get maximum number of repositories that are packed into a single query."""
+
+        return max(1, self._max_query_cost // self.ESTIMATED_REPO_COST)
+
+    async def get_repos(
+        self, repo_identifiers: Sequence[RepoIdentifier]
+    ) -> list[GraphQLRepository | GitHubAPIError]:
+        """
+        Get many repositories, packing as many of them into each query as the cost allows.
+        Returns one repository (or error) per repo identifier, in input order.
+        NOTE: Queries that turn out to be too expensive are split in half and retried.
+        """
+
+        results: list[GraphQLRepository | GitHubAPIError] = []
+
+        for batch in itertools.batched(repo_identifiers, self.max_repos_per_query):
+            results.extend(await self._get_repos_with_splitting(batch))
+
+        return results
+
+    async def _get_repos_with_splitting(
+        self, repo_identifiers: Sequence[RepoIdentifier]
+    ) -> list[GraphQLRepository | GitHubAPIError]:
+        """Get repositories with a single query, splitting the query if it's too expensive."""
+
+        try:
+            return await self._get_repos(repo_identifiers)
+        except _QueryCostError as error:
+            if len(repo_identifiers) == 1:
+                return [GitHubAPIError(str(error))]
+
+        middle = len(repo_identifiers) // 2
+        first_half = await self._get_repos_with_splitting(repo_identifiers[:middle])
+        second_half = await self._get_repos_with_splitting(repo_identifiers[middle:])
+
+        return first_half + second_half
+
+    async def _get_repos(
+        self, repo_identifiers: Sequence[RepoIdentifier]
+    ) -> list[GraphQLRepository | GitHubAPIError]:
+        """Get repositories with a single query (one alias per repository)."""
+
+        query, variables = _build_query(repo_identifiers)
+        response = await self._perform_post_request(
+            {"query": query, "variables": variables}
+        )
+        data = response.get("data") or {}
+        errors_by_alias: dict[str, str] = {}
+
+        for error in response.get("errors") or []:
+            error_path = error.get("path") or []
+
+            if error.get("type") in _QUERY_COST_ERROR_TYPES:
+                raise _QueryCostError(error.get("message", "Query is too expensive"))
+            if not error_path:
+                raise GitHubAPIError(
+                    f"Received GraphQL error with message: {error.get('message')}"
+                )
+
+            errors_by_alias[error_path[0]] = error.get("message", "")
+
+        results: list[GraphQLRepository | GitHubAPIError] = []
+
+        for index, repo_identifier in enumerate(repo_identifiers):
+            alias = _get_alias(index)
+            repository = data.get(alias)
+
+            if repository is None:
+                message = errors_by_alias.get(alias, "Repository not found")
+                results.append(
+                    GitHubAPIError(f"Received GraphQL error with message: {message}")
+                )
+            else:
+                try:
+                    results.append(_to_graphql_repository(repo_identifier, repository))
+                except (KeyError, TypeError, ValueError) as error:
+                    # NOTE: An unexpected repository fails on its own, not the whole query
+                    results.append(
+                        GitHubAPIError(
+                            f"Received an invalid GraphQL repository: {error!r}"
+                        )
+                    )
+
+        return results
+
+    async def _perform_post_request(self, payload: Any) -> Any:
+        """Perform GraphQL request and handle errors."""
+
+        try:
+            return await self._http_client.post(
+                url=self._graphql_url,
+                json=payload,
+                headers=await self.get_headers(),
+            )
+        except aiohttp.ClientResponseError as error:
+            if error.status in _QUERY_TIMEOUT_STATUSES:
+                raise _QueryCostError(f"Received {error.status} response")
+
+            raise GitHubAPIError(
+                f"Received {error.status} response with message: {error.message}"
+            )
+
+
+def _get_alias(index: int) -> str:
+    """Get query alias for the repository at index."""
+
+    return f"repo{index}"
+
+
+def _build_query(
+    repo_identifiers: Sequence[RepoIdentifier],
+) -> tuple[str, dict[str, str]]:
+    """Build a query (and its variables) with one aliased repository field per repo identifier."""
+
+    variable_definitions = []
+    repository_fields = []
+    variables = {}
+
+    for index, repo_identifier in enumerate(repo_identifiers):
+        variable_definitions.append(f"$owner{index}: String!, $name{index}: String!")
+        repository_fields.append(
+            f"{_get_alias(index)}: repository(owner: $owner{index}, name: $name{index}) {{ ...RepositoryFields }}"
+        )
+        variables[f"owner{index}"] = repo_identifier.repo_owner
+        variables[f"name{index}"] = repo_identifier.repo_name
+
+    query = (
+        f"query({', '.join(variable_definitions)}) {{\n"
+        + "\n".join(repository_fields)
+        + "\n}\n"
+        + _REPOSITORY_FRAGMENT
+    )
+
+    return query, variables
+
+
+def _to_graphql_repository(
+    repo_identifier: RepoIdentifier, repository: Mapping[str, Any]
+) -> GraphQLRepository:
+    """Map a GraphQL repository to the (scoring view) REST API models."""
+
+    license_info = repository.get("licenseInfo")
+    full_repository = ScoringRepository(
+        name=repository["name"],
+        full_name=repository.get(
+            "nameWithOwner",
+            f"{repo_identifier.repo_owner}/{repo_identifier.repo_name}",
+        ),
+        description=repository.get("description"),
+        stargazers_count=repository["stargazerCount"],
+        # NOTE: The REST API's watchers_count is the number of stargazers
+        watchers_count=repository["stargazerCount"],
+        forks_count=repository["forkCount"],
+        # NOTE: The REST API's open_issues_count includes open pull requests
+        open_issues_count=repository["issues"]["totalCount"]
+        + repository["pullRequests"]["totalCount"],
+        archived=repository["isArchived"],
+        disabled=repository["isDisabled"],
+        # NOTE: Empty repos have never been pushed to
+        pushed_at=(
+            datetime.datetime.fromisoformat(repository["pushedAt"])
+            if repository["pushedAt"] is not None
+            else None
+        ),
+        license=(
+            ScoringLicense(
+                key=license_info["key"],
+                name=license_info["name"],
+                spdx_id=license_info.get("spdxId"),
+            )
+            if license_info is not None
+            else None
+        ),
+    )
+
+    tree = repository.get("object") or {}
+    content_tree_list = ContentTreeList(
+        content_tree_list=[
+            ScoringContentTree(
+                type=(
+                    "symlink"
+                    if entry.get("mode") == _SYMLINK_MODE
+                    else _ENTRY_TYPES.get(entry["type"], entry["type"])
+                ),
+                size=(entry.get("object") or {}).get("byteSize", 0),
+                name=entry["name"],
+                path=entry["path"],
+                sha=entry["oid"],
+            )
+            for entry in tree.get("entries") or []
+        ]
+    )
+
+    return GraphQLRepository(
+        full_repository=full_repository,
+        content_tree_list=content_tree_list,
+    )
@@ -1,16 +1,56 @@
+import json
+import time
 from types import TracebackType
-from typing import Mapping, Any, Self, Type
+from typing import Awaitable, Callable, Mapping, Any, NamedTuple, Self, Type
 
 import aiohttp
 
+from rely.clients.response_store import ResponseStore, create_stored_response
+
+
+class HTTPResponse(NamedTuple):
+    """
+    Status, headers, and raw (JSON) body of a response.
+    NOTE: The body is kept as bytes, so that it can be validated with a single pass (in pydantic's Rust core).
+    """
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
 
 class HTTPClient:
     """Async HTTP client for performing requests."""
 
-    def __init__(self) -> None:
-        """Initialize with reusable client session (enables connection pooling)."""
+    def __init__(
+        self,
+        *,
+        pool_size: int = 100,
+        keepalive_timeout: float = 15.0,
+        response_store: ResponseStore | None = None,
+        max_age: float | None = None,
+    ) -> None:
+        """
+        Initialize with reusable client session (enables connection pooling).
+        NOTE: pool_size caps simultaneous connections, keepalive_timeout controls how long
+              idle connections are kept open for reuse.
+              If a response store is given, responses are stored along with their
+              ETag/Last-Modified validators and later fetches become conditional requests.
+              If max_age is also given, stored responses younger than max_age seconds are
+              returned without performing a request at all.
+        """
+
+        self._response_store = response_store
+        self._max_age = max_age
 
-        self._client_session = aiohttp.ClientSession(raise_for_status=True)
+        connector = aiohttp.TCPConnector(
+            limit=pool_size,
+            keepalive_timeout=keepalive_timeout,
+        )
+        self._client_session = aiohttp.ClientSession(
+            connector=connector,
+            raise_for_status=True,
+        )
 
     async def _close_client_session(self) -> None:
         """Clost client session."""
@@ -26,7 +66,7 @@ class HTTPClient:
         self,
         exception_type: Type[BaseException] | None,
         exception: BaseException | None,
-        traceback: TracebackType,
+        traceback: TracebackType | None,
     ) -> bool | None:
         """Clost client session when exiting context manager."""
 
@@ -41,9 +81,122 @@ class HTTPClient:
         headers: Mapping[str, str] | None = None,
     ) -> Any:
         """
-        Perform an HTTP GET request.
+        Perform an HTTP GET request and decode the JSON body.
         NOTE: Raises an exception if the response status code is >= 400
         """
 
+        response = await self.get_response(url=url, headers=headers)
+
+        return json.loads(response.body)
+
+    async def get_response(
+        self,
+        *,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        before_request: Callable[[], Awaitable[None]] | None = None,
+    ) -> HTTPResponse:
+        """
+        Perform an HTTP GET request and return status, headers and raw body.
+        NOTE: Raises an exception if the response status code is >= 400.
+              A 304 (Not Modified) response is never raised (even with raise_for_status),
+              and is answered with the stored body.
+              before_request is awaited right before a request is actually sent (it is
+              skipped for fresh stored responses), which is useful for rate limiting.
+        """
+
+        stored_response = (
+            self._response_store.get(url) if self._response_store is not None else None
+        )
+
+        if (
+            stored_response is not None
+            and self._max_age is not None
+            and time.time() - stored_response.fetched_at <= self._max_age
+        ):
+            return HTTPResponse(status=200, headers={}, body=stored_response.body)
+
+        if stored_response is not None:
+            headers = _with_conditional_headers(
+                headers, stored_response.etag, stored_response.last_modified
+            )
+
+        if before_request is not None:
+            await before_request()
+
         async with self._client_session.get(url, headers=headers) as response:
+            if stored_response is not None and response.status == 304:
+                self._store_response(
+                    url,
+                    stored_response.body,
+                    response.headers.get("ETag", stored_response.etag),
+                    response.headers.get(
+                        "Last-Modified", stored_response.last_modified
+                    ),
+                )
+
+                return HTTPResponse(
+                    status=response.status,
+                    headers=response.headers,
+                    body=stored_response.body,
+                )
+
+            body = await response.read()
+
+            if self._response_store is not None:
+                self._store_response(
+                    url,
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+
+            return HTTPResponse(
+                status=response.status,
+                headers=response.headers,
+                body=body,
+            )
+
+    async def post(
+        self,
+        *,
+        url: str,
+        json: Any,
+        headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        """
+        Perform an HTTP POST request with a JSON body.
+        NOTE: Raises an exception if the response status code is >= 400
+        """
+
+        async with self._client_session.post(
+            url, json=json, headers=headers
+        ) as response:
             return await response.json()
+
+    def _store_response(
+        self, url: str, body: bytes, etag: str | None, last_modified: str | None
+    ) -> None:
+        """Store a response body (along with its validators)."""
+
+        if self._response_store is None:
+            return
+
+        self._response_store.set(url, create_stored_response(body, etag, last_modified))
+
+
+def _with_conditional_headers(
+    headers: Mapping[str, str] | None,
+    etag: str | None,
+    last_modified: str | None,
+) -> dict[str, str]:
+    """Add conditional request headers (If-None-Match / If-Modified-Since) to headers."""
+
+    conditional_headers = dict(headers or {})
+
+    if etag is not None:
+        conditional_headers["If-None-Match"] = etag
+    if last_modified is not None:
+        conditional_headers["If-Modified-Since"] = last_modified
+
+    return conditional_headers
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
-from rely.clients.models.content_tree import ContentTree
+from rely.clients.models.scoring_content_tree import ScoringContentTree
 
 
 class ContentTreeList(BaseModel):
-    content_tree_list: list[ContentTree]
+    content_tree_list: list[ScoringContentTree]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class ScoringContentTree(BaseModel):
+    """
+    Scoring view of a content tree entry (a slim projection of ContentTree).
+    NOTE: Only the fields that metrics read are validated, and all other fields (like links) are ignored.
+    """
+
+    type: str
+    size: int
+    name: str
+    path: str
+    sha: str
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ScoringLicense(BaseModel):
+    key: str
+    name: str
+    spdx_id: Optional[str] = None
+
+
+class ScoringRepository(BaseModel):
+    """
+    Scoring view of a repository (a slim projection of FullRepository).
+    NOTE: Only the fields that metrics read are validated, and all other fields are ignored.
+          Validating the full model (with its nested owner, parent, source and organization
+          blocks) costs far more time and memory than scoring itself.
+    """
+
+    name: str
+    full_name: str
+    description: Optional[str]
+    stargazers_count: int
+    watchers_count: int
+    forks_count: int
+    open_issues_count: int
+    archived: bool
+    disabled: bool
+    # NOTE: Empty repos have never been pushed to
+    pushed_at: Optional[datetime]
+    license: Optional[ScoringLicense]
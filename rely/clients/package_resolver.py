@@ -0,0 +1,246 @@
+import re
+import urllib.parse
+from typing import Any, Final, NamedTuple, Protocol
+
+import aiohttp
+
+from rely.clients.http_client import HTTPClient
+from rely.clients.response_cache import CacheStats, ResponseCache
+from rely.core.manifest_parser import is_local_npm_specifier, parse_requirement
+from rely.core.models.dependency import Dependency, Ecosystem, create_npm_dependency
+
+
+# Matches the owner and name of a GitHub repo in URLs (like "git+https://github.com/OWNER/REPO.git")
+_GITHUB_REPO_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"github\.com[/:]([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)", re.IGNORECASE
+)
+# Matches npm's shorthand for GitHub repos (like "github:OWNER/REPO" or "OWNER/REPO")
+_NPM_SHORTHAND_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^(?:github:)?([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)$"
+)
+# Matches environment markers that only apply to an extra
+_EXTRA_MARKER_PATTERN: Final[re.Pattern[str]] = re.compile(r"\bextra\s*==")
+# GitHub paths that look like OWNER/REPO, but aren't repos
+_NON_REPO_OWNERS: Final[frozenset[str]] = frozenset(
+    {"sponsors", "orgs", "apps", "marketplace", "topics"}
+)
+# Project URL labels that usually point to the source repo (checked first)
+_SOURCE_URL_LABELS: Final[tuple[str, ...]] = (
+    "source",
+    "source code",
+    "repository",
+    "code",
+    "github",
+    "homepage",
+)
+
+
+class PackageResolutionError(Exception):
+    """Raised when a package registry can't be queried."""
+
+
+class PackageResolution(NamedTuple):
+    """
+    Resolved GitHub repo URL of a package (None if it has no GitHub repo),
+    along with the packages that it depends on (if its registry reports them).
+    """
+
+    repo_url: str | None
+    dependencies: tuple[Dependency, ...] = ()
+
+
+class PackageResolver(Protocol):
+    """Resolver of packages to their GitHub repos."""
+
+    async def resolve(self, dependency: Dependency) -> PackageResolution:
+        """Resolve a package to its GitHub repo."""
+        ...
+
+
+class RegistryPackageResolver:
+    """
+    Resolver that looks up packages in their registries (PyPI and npm).
+    NOTE: Packages that don't exist in their registry (404) resolve to no repo.
+    """
+
+    PYPI_BASE_URL: Final[str] = "https://pypi.org"
+    NPM_BASE_URL: Final[str] = "https://registry.npmjs.org"
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        *,
+        pypi_base_url: str = PYPI_BASE_URL,
+        npm_base_url: str = NPM_BASE_URL,
+    ) -> None:
+        self._http_client = http_client
+        self._pypi_base_url = pypi_base_url
+        self._npm_base_url = npm_base_url
+
+    async def resolve(self, dependency: Dependency) -> PackageResolution:
+        """Resolve a package to its GitHub repo (from its registry metadata)."""
+
+        if dependency.ecosystem == Ecosystem.PYPI:
+            return await self._resolve_pypi_package(dependency.name)
+
+        return await self._resolve_npm_package(dependency.name)
+
+    async def _resolve_pypi_package(self, name: str) -> PackageResolution:
+        """
+        Resolve a PyPI package (from its project URLs, or its home page).
+        Reference: https://docs.pypi.org/api/json/
+        """
+
+        metadata = await self._get_metadata(
+            f"{self._pypi_base_url}/pypi/{urllib.parse.quote(name)}/json"
+        )
+
+        if metadata is None:
+            return PackageResolution(repo_url=None)
+
+        info = metadata.get("info") or {}
+        dependencies = _parse_requires_dist(info.get("requires_dist") or [])
+        project_urls: dict[str, str] = info.get("project_urls") or {}
+        labeled_urls = {label.lower(): url for label, url in project_urls.items()}
+        candidate_urls = [
+            labeled_urls[label] for label in _SOURCE_URL_LABELS if label in labeled_urls
+        ]
+        candidate_urls.extend(project_urls.values())
+        candidate_urls.append(info.get("home_page") or "")
+
+        for candidate_url in candidate_urls:
+            repo_url = parse_github_repo_url(candidate_url)
+
+            if repo_url is not None:
+                return PackageResolution(repo_url=repo_url, dependencies=dependencies)
+
+        return PackageResolution(repo_url=None, dependencies=dependencies)
+
+    async def _resolve_npm_package(self, name: str) -> PackageResolution:
+        """
+        Resolve an npm package (from the repository field of its latest version).
+        Reference: https://github.com/npm/registry/blob/main/docs/REGISTRY-API.md
+        NOTE: Only the latest version is fetched, since full package documents can be huge.
+        """
+
+        metadata = await self._get_metadata(
+            f"{self._npm_base_url}/{urllib.parse.quote(name, safe='@/')}/latest"
+        )
+
+        if metadata is None:
+            return PackageResolution(repo_url=None)
+
+        dependencies = tuple(
+            create_npm_dependency(name)
+            for name, specifier in (metadata.get("dependencies") or {}).items()
+            if not is_local_npm_specifier(str(specifier))
+        )
+        repository = metadata.get("repository")
+
+        if isinstance(repository, dict):
+            repository = repository.get("url")
+
+        if not isinstance(repository, str):
+            return PackageResolution(repo_url=None, dependencies=dependencies)
+
+        shorthand_match = _NPM_SHORTHAND_PATTERN.match(repository)
+
+        if shorthand_match is not None:
+            return PackageResolution(
+                repo_url=f"https://github.com/{shorthand_match.group(1)}/{shorthand_match.group(2)}",
+                dependencies=dependencies,
+            )
+
+        return PackageResolution(
+            repo_url=parse_github_repo_url(repository), dependencies=dependencies
+        )
+
+    async def _get_metadata(self, url: str) -> Any:
+        """Get package metadata (None if the package doesn't exist)."""
+
+        try:
+            return await self._http_client.get(url=url)
+        except aiohttp.ClientResponseError as error:
+            if error.status == 404:
+                return None
+
+            raise PackageResolutionError(
+                f"Received {error.status} response with message: {error.message}"
+            )
+        except aiohttp.ClientError as error:
+            raise PackageResolutionError(f"Could not query {url}: {error}")
+
+
+class CachedPackageResolver:
+    """
+    Resolver that caches the resolutions of another resolver.
+    NOTE: Packages without a GitHub repo are cached too, so they aren't looked up again.
+          Failed lookups are not cached.
+    """
+
+    def __init__(
+        self,
+        package_resolver: PackageResolver,
+        cache: ResponseCache[PackageResolution],
+        *,
+        ttl: float = 86_400.0,
+    ) -> None:
+        self._package_resolver = package_resolver
+        self._cache = cache
+        self._ttl = ttl
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Get resolution cache counters."""
+
+        return self._cache.stats
+
+    async def resolve(self, dependency: Dependency) -> PackageResolution:
+        """Resolve a package to its GitHub repo (from the cache, if possible)."""
+
+        cache_key = f"{dependency.ecosystem.value}:{dependency.name}"
+        package_resolution = self._cache.get(cache_key)
+
+        if package_resolution is None:
+            package_resolution = await self._package_resolver.resolve(dependency)
+            self._cache.set(cache_key, package_resolution, self._ttl)
+
+        return package_resolution
+
+
+def _parse_requires_dist(requires_dist: list[str]) -> tuple[Dependency, ...]:
+    """
+    Parse the (unconditional) dependencies of a PyPI package from its Requires-Dist metadata.
+    NOTE: Dependencies of extras (like 'PySocks; extra == "socks"') aren't installed by default, so they are skipped.
+    """
+
+    dependencies: list[Dependency] = []
+
+    for requirement in requires_dist:
+        marker = requirement.partition(";")[2]
+
+        if _EXTRA_MARKER_PATTERN.search(marker):
+            continue
+
+        dependency = parse_requirement(requirement)
+
+        if dependency is not None:
+            dependencies.append(dependency)
+
+    return tuple(dict.fromkeys(dependencies))
+
+
+def parse_github_repo_url(url: str) -> str | None:
+    """Parse a GitHub repo URL (like https://github.com/OWNER/REPO) out of any URL that points into a repo."""
+
+    match = _GITHUB_REPO_PATTERN.search(url)
+
+    if match is None or match.group(1).lower() in _NON_REPO_OWNERS:
+        return None
+
+    repo_name = match.group(2).removesuffix(".git")
+
+    if not repo_name:
+        return None
+
+    return f"https://github.com/{match.group(1)}/{repo_name}"
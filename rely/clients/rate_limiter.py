@@ -0,0 +1,209 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Final, Mapping
+
+from pydantic import BaseModel
+
+
+# Statuses that are worth retrying for idempotent requests (besides rate limits)
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({500, 502, 503, 504})
+
+
+class RateLimitState(BaseModel):
+    """Model for storing the current rate limit budget (as reported by GitHub)."""
+
+    limit: int | None
+    remaining: int | None
+    used: int | None
+    # Unix timestamps (in seconds)
+    reset_at: float | None
+    paused_until: float | None
+
+
+class RateLimiter:
+    """
+    Rate-limit-aware request scheduler.
+    Paces requests with a token bucket, tracks the remaining budget from response headers,
+    and waits for the budget to reset (or for a backoff to end) before letting requests through.
+    Reference: https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api?apiVersion=2022-11-28
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float = 10.0,
+        burst: int = 20,
+        secondary_rate_limit_backoff: float = 60.0,
+        retry_backoff: float = 1.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """
+        Initialize rate limiter.
+        NOTE: GitHub recommends waiting at least a minute after a secondary rate limit,
+              if no Retry-After header is sent (secondary_rate_limit_backoff).
+        """
+
+        self._requests_per_second = requests_per_second
+        self._burst = burst
+        self._secondary_rate_limit_backoff = secondary_rate_limit_backoff
+        self._retry_backoff = retry_backoff
+        self._clock = clock
+        self._sleep = sleep
+        # Waiters acquire the lock in FIFO order, so requests are let through in order
+        self._lock = asyncio.Lock()
+        self._tokens = float(burst)
+        self._last_refill_at = clock()
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._used: int | None = None
+        self._reset_at: float | None = None
+        self._paused_until: float | None = None
+
+    @property
+    def state(self) -> RateLimitState:
+        """Get current rate limit budget."""
+
+        return RateLimitState(
+            limit=self._limit,
+            remaining=self._remaining,
+            used=self._used,
+            reset_at=self._reset_at,
+            paused_until=self._paused_until,
+        )
+
+    def is_available(self) -> bool:
+        """Check whether a request could be performed without waiting for a pause or reset to end."""
+
+        return self.get_available_at() <= self._clock()
+
+    def get_available_at(self) -> float:
+        """Get the (Unix) time at which requests stop waiting for a pause or reset to end."""
+
+        available_at = self._clock()
+
+        if self._paused_until is not None:
+            available_at = max(available_at, self._paused_until)
+        if self._remaining == 0 and self._reset_at is not None:
+            available_at = max(available_at, self._reset_at)
+
+        return available_at
+
+    async def acquire(self) -> None:
+        """Wait until a request can be performed without exceeding the rate limit."""
+
+        async with self._lock:
+            while (delay := self._get_delay()) > 0:
+                await self._sleep(delay)
+
+            self._tokens -= 1
+
+            # Optimistically spend budget until the response headers report the actual value
+            if self._remaining is not None:
+                self._remaining = max(0, self._remaining - 1)
+
+    def update(self, headers: Mapping[str, str] | None) -> None:
+        """Update the remaining budget from response headers."""
+
+        if headers is None:
+            return
+
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        reset_at = _parse_int(headers.get("X-RateLimit-Reset"))
+
+        if remaining is None or reset_at is None:
+            return
+
+        # Responses can arrive out of order, so keep the lowest budget within a window
+        if self._reset_at == reset_at and self._remaining is not None:
+            remaining = min(remaining, self._remaining)
+
+        self._limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        self._used = _parse_int(headers.get("X-RateLimit-Used"))
+        self._remaining = remaining
+        self._reset_at = float(reset_at)
+
+    def back_off(
+        self, status: int | None, headers: Mapping[str, str] | None, attempt: int
+    ) -> None:
+        """
+        Pause all requests after a rate limited (or failed) response.
+        NOTE: Retry-After is honored if present, otherwise the delay grows exponentially
+              (with jitter, so that concurrent requests don't retry in lockstep).
+              A status of None means that no response was received (like a timeout or connection error).
+        """
+
+        self.update(headers)
+
+        retry_after = _parse_int((headers or {}).get("Retry-After"))
+
+        if retry_after is not None:
+            delay = float(retry_after)
+        elif status is None or status in RETRYABLE_STATUSES:
+            delay = self._retry_backoff * 2**attempt
+        elif self._remaining == 0 and self._reset_at is not None:
+            # Primary rate limit, acquire() already waits for the reset
+            delay = 0.0
+        else:
+            delay = self._secondary_rate_limit_backoff * 2**attempt
+
+        delay += random.uniform(0, self._retry_backoff)
+        paused_until = self._clock() + delay
+
+        if self._paused_until is None or paused_until > self._paused_until:
+            self._paused_until = paused_until
+
+    def _get_delay(self) -> float:
+        """Get number of seconds to wait before the next request can be performed."""
+
+        now = self._clock()
+
+        # Refill token bucket
+        self._tokens = min(
+            float(self._burst),
+            self._tokens + (now - self._last_refill_at) * self._requests_per_second,
+        )
+        self._last_refill_at = now
+
+        delays = [(1 - self._tokens) / self._requests_per_second]
+
+        if self._paused_until is not None:
+            if self._paused_until <= now:
+                self._paused_until = None
+            else:
+                delays.append(self._paused_until - now)
+        if self._remaining == 0 and self._reset_at is not None:
+            if self._reset_at <= now:
+                # The window has reset, the next response will report the new budget
+                self._remaining = None
+            else:
+                delays.append(self._reset_at - now)
+
+        return max(delays)
+
+
+def is_rate_limited(status: int, headers: Mapping[str, str] | None) -> bool:
+    """
+    Check whether an error response was caused by a (primary or secondary) rate limit.
+    NOTE: GitHub responds with 403 or 429 when a rate limit is exceeded.
+    """
+
+    if status == 429:
+        return True
+    if status != 403 or headers is None:
+        return False
+
+    return headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers
+
+
+def _parse_int(value: str | None) -> int | None:
+    """Parse an integer header value."""
+
+    if value is None:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
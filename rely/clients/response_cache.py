@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """Model for storing cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class _CacheEntry[V](NamedTuple):
+    value: V
+    expires_at: float
+
+
+class ResponseCache[V]:
+    """
+    Size-bounded, in-memory LRU cache with per-entry TTLs.
+    NOTE: Expired entries are dropped lazily (when they are looked up or evicted).
+    """
+
+    def __init__(
+        self, max_size: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry[V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get cache counters."""
+
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
+
+    def get(self, key: str) -> V | None:
+        """Get a value if it exists and hasn't expired, otherwise return None."""
+
+        entry = self._entries.get(key)
+
+        if entry is None or entry.expires_at <= self._clock():
+            self._entries.pop(key, None)
+            self._misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return entry.value
+
+    def set(self, key: str, value: V, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the least recently used entry if full."""
+
+        if self._max_size <= 0:
+            return
+
+        self._entries[key] = _CacheEntry(value, self._clock() + ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+
+        self._entries.clear()
@@ -0,0 +1,51 @@
+import math
+import time
+from typing import NamedTuple, Protocol
+
+from rely.clients.response_cache import ResponseCache
+
+
+class StoredResponse(NamedTuple):
+    """A previously fetched (raw) response body, along with its cache validators."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+
+class ResponseStore(Protocol):
+    """Storage for previously fetched responses (keyed by URL)."""
+
+    def get(self, url: str) -> StoredResponse | None: ...
+
+    def set(self, url: str, stored_response: StoredResponse) -> None: ...
+
+
+class MemoryResponseStore:
+    """
+    In-memory response store, bounded by LRU eviction.
+    NOTE: Entries never expire, since they are revalidated with conditional requests.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._response_cache: ResponseCache[StoredResponse] = ResponseCache(max_size)
+
+    def get(self, url: str) -> StoredResponse | None:
+        return self._response_cache.get(url)
+
+    def set(self, url: str, stored_response: StoredResponse) -> None:
+        self._response_cache.set(url, stored_response, ttl=math.inf)
+
+
+def create_stored_response(
+    body: bytes, etag: str | None, last_modified: str | None
+) -> StoredResponse:
+    """Create a StoredResponse that was fetched now."""
+
+    return StoredResponse(
+        body=body,
+        etag=etag,
+        last_modified=last_modified,
+        fetched_at=time.time(),
+    )
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Callable, Coroutine, Hashable
+
+from pydantic import BaseModel
+
+
+class SingleFlightStats(BaseModel):
+    """Model for storing single-flight counters."""
+
+    # Calls that started a new task, and calls that joined a task already in flight
+    calls: int
+    coalesced: int
+    in_flight: int
+
+
+class _Flight[V]:
+    """An in-flight task, along with the number of callers waiting for it."""
+
+    def __init__(self, task: asyncio.Task[V]) -> None:
+        self.task = task
+        self.waiter_count = 0
+
+
+class SingleFlight[K: Hashable, V]:
+    """
+    Coalescer of concurrent calls with the same key into a single in-flight task.
+    NOTE: Every caller awaits the same task, so they all get the same result (or the same error).
+          Nothing is cached: once the task finishes, the next call with its key starts a new one.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[K, _Flight[V]] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """Get single-flight counters."""
+
+        return SingleFlightStats(
+            calls=self._calls,
+            coalesced=self._coalesced,
+            in_flight=len(self._flights),
+        )
+
+    async def run(
+        self, key: K, create_coroutine: Callable[[], Coroutine[Any, Any, V]]
+    ) -> V:
+        """
+        Await the in-flight task for a key (starting one if there is none).
+        NOTE: The task is shielded while other callers wait for it, so that a cancelled caller
+              (like a disconnected client) doesn't cancel it for everyone else.  Once every
+              caller is cancelled, the task is cancelled too.
+        """
+
+        flight = self._flights.get(key)
+
+        if flight is None:
+            self._calls += 1
+            flight = _Flight(asyncio.create_task(create_coroutine()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self._coalesced += 1
+
+        flight.waiter_count += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiter_count == 1 and not flight.task.done():
+                # NOTE: Forgotten right away, so that later calls don't join a cancelled task
+                self._forget(key, flight)
+                flight.task.cancel()
+
+            raise
+        finally:
+            flight.waiter_count -= 1
+
+    def _forget(self, key: K, flight: _Flight[V]) -> None:
+        """Forget a flight (and mark its exception as retrieved, in case every caller was cancelled)."""
+
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+        if flight.task.done() and not flight.task.cancelled():
+            flight.task.exception()
@@ -0,0 +1,199 @@
+import math
+from typing import Callable, Iterable, Protocol, Sequence
+
+from pydantic import BaseModel
+
+from rely.clients.rate_limiter import RateLimiter, RateLimitState
+
+
+class TokenUsage(BaseModel):
+    """Model for storing the usage of a single token in a token pool."""
+
+    # Only the last few characters of a token are reported
+    token_hint: str
+    requests: int
+    rate_limit: RateLimitState
+
+
+class TokenProvider(Protocol):
+    """Provider of short-lived tokens (like GitHub App installation tokens)."""
+
+    @property
+    def token_hint(self) -> str:
+        """Get a hint that identifies the provider without revealing its tokens."""
+        ...
+
+    async def get_token(self) -> str:
+        """Get a currently valid token."""
+        ...
+
+
+class PooledToken:
+    """A token in a token pool, with its own rate limiter (GitHub tracks budgets per token)."""
+
+    def __init__(
+        self, credential: str | TokenProvider, rate_limiter: RateLimiter
+    ) -> None:
+        self.credential = credential
+        self.rate_limiter = rate_limiter
+        self.request_count = 0
+
+    @property
+    def token_hint(self) -> str:
+        """Get a hint that identifies this token without revealing it."""
+
+        if isinstance(self.credential, str):
+            return _get_token_hint(self.credential)
+
+        return self.credential.token_hint
+
+    @property
+    def usage(self) -> TokenUsage:
+        """Get usage of this token."""
+
+        return TokenUsage(
+            token_hint=self.token_hint,
+            requests=self.request_count,
+            rate_limit=self.rate_limiter.state,
+        )
+
+    async def get_token(self) -> str:
+        """Get the token to authorize a request with."""
+
+        if isinstance(self.credential, str):
+            return self.credential
+
+        return await self.credential.get_token()
+
+    async def acquire(self) -> None:
+        """Wait until a request can be performed with this token, and count it."""
+
+        await self.rate_limiter.acquire()
+        self.request_count += 1
+
+
+class TokenPool:
+    """
+    Pool of GitHub tokens that requests are spread across.
+    Each request uses the token with the most remaining budget (as reported by its
+    rate limit headers), and exhausted (or paused) tokens are skipped until they reset.
+    """
+
+    def __init__(
+        self,
+        tokens: Sequence[str | TokenProvider],
+        *,
+        create_rate_limiter: Callable[[], RateLimiter] = RateLimiter,
+    ) -> None:
+        """
+        Initialize token pool.
+        NOTE: Duplicate tokens share a budget on GitHub's side, so they are only pooled once.
+              Token providers (like GitHub App installations) are pooled like any other token.
+        """
+
+        unique_tokens = list(dict.fromkeys(tokens))
+
+        if not unique_tokens:
+            raise ValueError("Token pool requires at least one token")
+
+        self._pooled_tokens = [
+            PooledToken(credential, create_rate_limiter())
+            for credential in unique_tokens
+        ]
+
+    def __len__(self) -> int:
+        return len(self._pooled_tokens)
+
+    @property
+    def usage(self) -> list[TokenUsage]:
+        """Get usage of every token in the pool."""
+
+        return [pooled_token.usage for pooled_token in self._pooled_tokens]
+
+    @property
+    def state(self) -> RateLimitState:
+        """
+        Get combined rate limit budget of all tokens in the pool.
+        NOTE: The pool is only paused if every token is paused, and it resets as soon as any token does.
+        """
+
+        states = [
+            pooled_token.rate_limiter.state for pooled_token in self._pooled_tokens
+        ]
+        paused_untils = [state.paused_until for state in states]
+
+        return RateLimitState(
+            limit=_sum_known(state.limit for state in states),
+            remaining=_sum_known(state.remaining for state in states),
+            used=_sum_known(state.used for state in states),
+            reset_at=_min_known(state.reset_at for state in states),
+            paused_until=(
+                _min_known(paused_untils) if None not in paused_untils else None
+            ),
+        )
+
+    def is_available(self) -> bool:
+        """Check whether any token could perform a request without waiting for a pause or reset to end."""
+
+        return any(
+            pooled_token.rate_limiter.is_available()
+            for pooled_token in self._pooled_tokens
+        )
+
+    def select(self) -> PooledToken:
+        """
+        Select the token to perform the next request with.
+        NOTE: Tokens with an unknown budget (no response yet) are preferred, so that every token
+              is probed, and ties are broken by the number of requests performed with each token.
+              If every token is exhausted, the one that becomes available first is selected.
+        """
+
+        available_tokens = [
+            pooled_token
+            for pooled_token in self._pooled_tokens
+            if pooled_token.rate_limiter.is_available()
+        ]
+
+        if not available_tokens:
+            return min(
+                self._pooled_tokens,
+                key=lambda pooled_token: pooled_token.rate_limiter.get_available_at(),
+            )
+
+        return max(
+            available_tokens,
+            key=lambda pooled_token: (
+                _get_remaining_budget(pooled_token),
+                -pooled_token.request_count,
+            ),
+        )
+
+
+def _get_remaining_budget(pooled_token: PooledToken) -> float:
+    """Get remaining budget of a token (infinite if it's not known yet)."""
+
+    remaining = pooled_token.rate_limiter.state.remaining
+
+    return math.inf if remaining is None else remaining
+
+
+def _get_token_hint(token: str) -> str:
+    """Get a hint that identifies a token without revealing it."""
+
+    return f"...{token[-4:]}"
+
+
+def _sum_known(values: Iterable[int | None]) -> int | None:
+    """Sum the known values (None if no value is known)."""
+
+    known_values = [value for value in values if value is not None]
+
+    return sum(known_values) if known_values else None
+
+
+def _min_known(values: Iterable[float | None]) -> float | None:
+    """Get the minimum of the known values (None if no value is known)."""
+
+    known_values = [value for value in values if value is not None]
+
+    return min(known_values) if known_values else None
@@ -1,9 +1,118 @@
+from pathlib import Path
+from typing import Annotated
+
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from pydantic import (
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    field_validator,
+    model_validator,
+)
+from pydantic_settings import BaseSettings, NoDecode
 
 
 load_dotenv()
 
 
 class Settings(BaseSettings):
-    github_personal_access_token: str
+    github_personal_access_token: str | None = None
+    # Additional (comma-separated) tokens that requests are spread across, to raise the rate limit
+    github_personal_access_tokens: Annotated[list[str], NoDecode] = []
+    # GitHub App installation to authenticate as (instead of, or in addition to, personal access tokens)
+    github_app_id: str | None = None
+    github_app_private_key: str | None = None
+    github_app_installation_id: PositiveInt | None = None
+    # Seconds before expiry that installation tokens are refreshed (in the background)
+    github_app_token_refresh_margin: PositiveFloat = 300.0
+    # Maximum number of repos that are scored concurrently in batch mode
+    max_concurrency: PositiveInt = 10
+    # Maximum number of simultaneous connections in the HTTP connection pool
+    http_pool_size: PositiveInt = 100
+    # Seconds that an idle pooled connection is kept alive for reuse
+    http_keepalive_timeout: PositiveFloat = 30.0
+    # Maximum number of validated GitHub responses kept in memory (0 disables caching)
+    response_cache_max_size: NonNegativeInt = 1024
+    # Seconds that cached repo metadata and contents listings stay fresh
+    repo_cache_ttl: PositiveFloat = 300.0
+    contents_cache_ttl: PositiveFloat = 900.0
+    # Maximum number of package-to-repo resolutions kept in memory, and seconds they stay fresh
+    package_resolution_cache_max_size: NonNegativeInt = 4096
+    package_resolution_cache_ttl: PositiveFloat = 86_400.0
+    # Maximum number of scored results kept by the API (0 disables result caching)
+    result_cache_max_size: NonNegativeInt = 4096
+    # Seconds that results stay fresh, then seconds that stale results are served while they are
+    # refreshed in the background, or while GitHub is rate limiting (or unavailable)
+    result_max_age: NonNegativeFloat = 300.0
+    result_stale_while_revalidate: NonNegativeFloat = 3600.0
+    result_stale_if_error: NonNegativeFloat = 86_400.0
+    # Seconds that a request waits for a refresh before serving a stale result instead
+    result_refresh_timeout: PositiveFloat = 5.0
+    # File of repo URLs (one per line) whose results the API keeps up to date in the background
+    watched_repos_file: Path | None = None
+    # Seconds that each pass over the watched repos is spread across (GitHub's rate limit window)
+    watched_repos_refresh_interval: PositiveFloat = 3600.0
+    # Maximum number of responses kept for conditional (ETag) requests (0 disables them)
+    conditional_request_store_size: NonNegativeInt = 10_000
+    # Seconds that responses in the CLI's on-disk cache are used without revalidation
+    disk_cache_max_age: NonNegativeFloat = 3600.0
+    # Maximum estimated cost of a single bulk GraphQL query (bounds repos per query)
+    graphql_max_query_cost: PositiveInt = 5_000
+    # Token bucket that paces GitHub requests (sustained rate and maximum burst)
+    rate_limit_requests_per_second: PositiveFloat = 10.0
+    rate_limit_burst: PositiveInt = 20
+    # Number of times a rate limited (or failed) GET request is retried
+    max_retries: NonNegativeInt = 3
+
+    @field_validator("github_personal_access_tokens", mode="before")
+    @classmethod
+    def split_tokens(cls, value: object) -> object:
+        """Split a comma-separated list of tokens."""
+
+        if isinstance(value, str):
+            return [token.strip() for token in value.split(",") if token.strip()]
+
+        return value
+
+    @field_validator("github_app_private_key")
+    @classmethod
+    def unescape_private_key(cls, value: str | None) -> str | None:
+        """Unescape newlines in a private key (PEM files are often squashed into one line)."""
+
+        return value.replace("\\n", "\n") if value is not None else None
+
+    @model_validator(mode="after")
+    def validate_credentials(self) -> "Settings":
+        """Ensure that GitHub credentials are configured (and that App settings are complete)."""
+
+        app_settings = [
+            self.github_app_id,
+            self.github_app_private_key,
+            self.github_app_installation_id,
+        ]
+
+        if (
+            any(app_setting is not None for app_setting in app_settings)
+            and None in app_settings
+        ):
+            raise ValueError(
+                "GitHub App authentication requires github_app_id, github_app_private_key and github_app_installation_id"
+            )
+        if not self.personal_access_tokens and self.github_app_id is None:
+            raise ValueError(
+                "Either a GitHub personal access token or a GitHub App must be configured"
+            )
+
+        return self
+
+    @property
+    def personal_access_tokens(self) -> list[str]:
+        """Get all personal access tokens (without duplicates)."""
+
+        tokens = list(self.github_personal_access_tokens)
+
+        if self.github_personal_access_token is not None:
+            tokens.insert(0, self.github_personal_access_token)
+
+        return list(dict.fromkeys(tokens))
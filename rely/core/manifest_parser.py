@@ -0,0 +1,200 @@
+import fnmatch
+import json
+import re
+import tomllib
+from pathlib import Path
+from typing import Any, Callable, Final, Iterable, Mapping
+
+from rely.core.models.dependency import (
+    Dependency,
+    create_npm_dependency,
+    create_pypi_dependency,
+)
+
+
+# Matches the package name at the start of a PEP 508 requirement (like "pydantic[email]>=2")
+_REQUIREMENT_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)"
+)
+# Sections of package.json that list dependencies
+_PACKAGE_JSON_SECTIONS: Final[tuple[str, ...]] = (
+    "dependencies",
+    "devDependencies",
+    "optionalDependencies",
+    "peerDependencies",
+)
+# npm version specifiers that point to local packages (which aren't published anywhere)
+_LOCAL_NPM_SPECIFIER_PREFIXES: Final[tuple[str, ...]] = ("file:", "link:", "workspace:")
+
+
+class ManifestError(Exception):
+    """Raised when a manifest can't be parsed."""
+
+
+def parse_pyproject_toml(content: str) -> list[Dependency]:
+    """
+    Parse dependencies of a pyproject.toml (project dependencies, optional dependencies and dependency groups).
+    Reference: https://packaging.python.org/en/latest/specifications/pyproject-toml/
+    """
+
+    pyproject = tomllib.loads(content)
+    project = pyproject.get("project", {})
+    requirements: list[Any] = list(project.get("dependencies", []))
+
+    for optional_requirements in project.get("optional-dependencies", {}).values():
+        requirements.extend(optional_requirements)
+
+    for group_requirements in pyproject.get("dependency-groups", {}).values():
+        requirements.extend(group_requirements)
+
+    # NOTE: Dependency groups can include other groups (as tables), which are skipped
+    return _parse_requirements(
+        requirement for requirement in requirements if isinstance(requirement, str)
+    )
+
+
+def parse_uv_lock(content: str) -> list[Dependency]:
+    """
+    Parse locked packages of a uv.lock (including transitive ones).
+    NOTE: Packages that aren't installed from a registry (like the project itself) are skipped.
+    """
+
+    uv_lock = tomllib.loads(content)
+
+    return [
+        create_pypi_dependency(package["name"])
+        for package in uv_lock.get("package", [])
+        if "registry" in package.get("source", {})
+    ]
+
+
+def parse_requirements_txt(content: str) -> list[Dependency]:
+    """
+    Parse dependencies of a requirements file.
+    Reference: https://pip.pypa.io/en/stable/reference/requirements-file-format/
+    NOTE: Options (like -r or -e), and requirements that are URLs or paths, are skipped.
+    """
+
+    # Join continued lines, and drop comments
+    lines = content.replace("\\\n", "").splitlines()
+    requirements = (re.sub(r"(^|\s)#.*$", "", line).strip() for line in lines)
+
+    return _parse_requirements(
+        requirement
+        for requirement in requirements
+        if requirement
+        and not requirement.startswith(("-", ".", "/"))
+        and "://" not in requirement.split("@")[0]
+    )
+
+
+def parse_package_json(content: str) -> list[Dependency]:
+    """
+    Parse dependencies of a package.json (all dependency sections).
+    Reference: https://docs.npmjs.com/cli/configuring-npm/package-json
+    NOTE: Local packages (file:, link: and workspace: specifiers) are skipped.
+    """
+
+    package_json = json.loads(content)
+    dependencies: list[Dependency] = []
+
+    for section in _PACKAGE_JSON_SECTIONS:
+        section_dependencies: Mapping[str, str] = package_json.get(section) or {}
+
+        for name, specifier in section_dependencies.items():
+            if not is_local_npm_specifier(str(specifier)):
+                dependencies.append(create_npm_dependency(name))
+
+    return dependencies
+
+
+# Manifest parsers per file name pattern
+MANIFEST_PARSERS: Final[Mapping[str, Callable[[str], list[Dependency]]]] = {
+    "pyproject.toml": parse_pyproject_toml,
+    "uv.lock": parse_uv_lock,
+    "requirements*.txt": parse_requirements_txt,
+    "package.json": parse_package_json,
+}
+
+
+def is_manifest(path: Path) -> bool:
+    """Check whether a file is a supported manifest (based on its name)."""
+
+    return any(
+        fnmatch.fnmatch(path.name, file_name_pattern)
+        for file_name_pattern in MANIFEST_PARSERS
+    )
+
+
+def find_manifests(path: Path) -> list[Path]:
+    """
+    Find supported manifests (a file, or the manifests at the top level of a directory).
+    NOTE: Raises a ManifestError if a file isn't a supported manifest.
+    """
+
+    if path.is_file():
+        if not is_manifest(path):
+            raise ManifestError(f"{path} is not a supported manifest")
+
+        return [path]
+
+    return sorted(
+        child_path
+        for child_path in path.iterdir()
+        if child_path.is_file() and is_manifest(child_path)
+    )
+
+
+def parse_manifest(path: Path) -> list[Dependency]:
+    """Parse dependencies of a manifest (raises a ManifestError if it is invalid)."""
+
+    for file_name_pattern, parse in MANIFEST_PARSERS.items():
+        if fnmatch.fnmatch(path.name, file_name_pattern):
+            try:
+                return parse(path.read_text())
+            except (tomllib.TOMLDecodeError, json.JSONDecodeError) as error:
+                raise ManifestError(f"Could not parse {path}: {error}")
+
+    raise ManifestError(f"{path} is not a supported manifest")
+
+
+def parse_manifests(path: Path) -> list[Dependency]:
+    """
+    Parse the dependencies of all manifests in a path (a manifest, or a project directory).
+    NOTE: Dependencies are deduplicated (keeping the order they are first found in).
+    """
+
+    return list(
+        dict.fromkeys(
+            dependency
+            for manifest_path in find_manifests(path)
+            for dependency in parse_manifest(manifest_path)
+        )
+    )
+
+
+def parse_requirement(requirement: str) -> Dependency | None:
+    """Parse the package of a PEP 508 requirement (None if it doesn't start with a name)."""
+
+    match = _REQUIREMENT_NAME_PATTERN.match(requirement)
+
+    if match is None:
+        return None
+
+    return create_pypi_dependency(match.group(1))
+
+
+def is_local_npm_specifier(specifier: str) -> bool:
+    """Check whether an npm version specifier points to a local package (which isn't published anywhere)."""
+
+    return specifier.startswith(_LOCAL_NPM_SPECIFIER_PREFIXES)
+
+
+def _parse_requirements(requirements: Iterable[str]) -> list[Dependency]:
+    """Parse packages of PEP 508 requirements (skipping ones without a name)."""
+
+    return [
+        dependency
+        for dependency in map(parse_requirement, requirements)
+        if dependency is not None
+    ]
@@ -1,8 +1,8 @@
-import functools
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Type, MutableMapping, ClassVar
+from typing import Collection, Type, MutableMapping, ClassVar
 
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import (
     MetricName,
     MetricScore,
@@ -10,7 +10,7 @@ from rely.core.metrics.types import (
     MetricWeight,
     SerializedMetric,
 )
-from rely.core.models.repo_context import RepoContext
+from rely.core.models.repo_context import DataSource, RepoContext
 
 
 type MetricRegistry = MutableMapping[str, Type["BaseMetric"]]
@@ -25,6 +25,10 @@ class BaseMetric(ABC):
     _registry: ClassVar[MetricRegistry] = {}
     _metric_name: ClassVar[MetricName]
     _metric_weight: ClassVar[MetricWeight]
+    # Most metrics only read the full repository, so this is the default
+    _data_sources: ClassVar[frozenset[DataSource]] = frozenset(
+        {DataSource.FULL_REPOSITORY}
+    )
 
     def __init__(self, repo_context: RepoContext) -> None:
         self.repo_context = repo_context
@@ -67,18 +71,25 @@ class BaseMetric(ABC):
 
         return cls._metric_weight
 
-    @functools.cache
+    @classmethod
+    def get_data_sources(cls) -> frozenset[DataSource]:
+        """Get data sources that are required for computing the metric."""
+
+        return cls._data_sources
+
+    @memoize_method
     @abstractmethod
-    def compute_metric_value(self) -> MetricValue:
+    def compute_metric_value(self) -> MetricValue | None:
         """
         Compute raw metric value.
         NOTE: This is an unaltered value that comes from the repo itself,
               like number of stars or time since last commit.
+              None means that the repo has no such value (like time since last commit of an empty repo).
         """
 
         pass
 
-    @functools.cache
+    @memoize_method
     @abstractmethod
     def compute_metric_score(self) -> MetricScore:
         """
@@ -89,6 +100,7 @@ class BaseMetric(ABC):
 
         pass
 
+    @memoize_method
     def compute_metric_weighted_score(self) -> Decimal:
         """
         Compute metric weighted score.
@@ -111,3 +123,13 @@ class BaseMetric(ABC):
             metric_score=self.compute_metric_score(),
             metric_weighted_score=float(self.compute_metric_weighted_score()),
         )
+
+
+def get_data_sources(
+    metric_classes: Collection[Type[BaseMetric]],
+) -> frozenset[DataSource]:
+    """Get data sources that are required for computing a collection of metrics."""
+
+    return frozenset().union(
+        *(metric_class.get_data_sources() for metric_class in metric_classes)
+    )
@@ -0,0 +1,324 @@
+"""
+Columnar (NumPy-vectorized) scoring engine for large batches of already known metric inputs.
+NOTE: Requires the "batch" extra (NumPy).
+"""
+
+import datetime
+import functools
+from decimal import Decimal
+from typing import Callable, Collection, Final, Mapping, NamedTuple, Sequence, Type
+
+import numpy as np
+from numpy.typing import NDArray
+
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.fork_count_metric import ForkCountMetric
+from rely.core.metrics.has_description_metric import HasDescriptionMetric
+from rely.core.metrics.has_license_metric import HasLicenseMetric
+from rely.core.metrics.has_readme_metric import HasReadmeMetric
+from rely.core.metrics.is_archived_metric import IsArchivedMetric
+from rely.core.metrics.is_disabled_metric import IsDisabledMetric
+from rely.core.metrics.last_commit_metric import LastCommitMetric
+from rely.core.metrics.metric_reducer import ScoringPlan, get_scoring_plan
+from rely.core.metrics.open_issue_count_metric import OpenIssueCountMetric
+from rely.core.metrics.star_count_metric import StarCountMetric
+from rely.core.metrics.types import MetricScore
+from rely.core.metrics.watcher_count_metric import WatcherCountMetric
+from rely.core.models.repo_context import RepoContext
+
+
+type ScoreArray = NDArray[np.int8]
+
+_MICROSECONDS_PER_DAY: Final[int] = 86_400 * 1_000_000
+
+
+class MetricColumns(NamedTuple):
+    """
+    Metric inputs for many repos, one array per field (all arrays have the same length).
+    NOTE: pushed_at is a datetime64 array in UTC (NaT for repos without any commit).
+    """
+
+    stargazers_count: NDArray[np.int64]
+    forks_count: NDArray[np.int64]
+    watchers_count: NDArray[np.int64]
+    open_issues_count: NDArray[np.int64]
+    pushed_at: NDArray[np.datetime64]
+    archived: NDArray[np.bool_]
+    disabled: NDArray[np.bool_]
+    has_license: NDArray[np.bool_]
+    has_description: NDArray[np.bool_]
+    has_readme: NDArray[np.bool_]
+
+
+class ColumnarScores(NamedTuple):
+    """Scores for many repos (in the same order as the metric columns)."""
+
+    # Metric scores per normalized metric name
+    metric_scores: dict[str, ScoreArray]
+    # Overall scores, exactly like RepoResult.overall_score_decimal and overall_score_int
+    overall_scores: NDArray[np.float64]
+    overall_scores_int: NDArray[np.int64]
+
+
+def _score_by_range(
+    values: NDArray[np.int64],
+    average_min: int,
+    average_max: int,
+    *,
+    higher_is_better: bool,
+) -> ScoreArray:
+    """Score values below, within or above an (inclusive) average range."""
+
+    below, above = (
+        (MetricScore.POOR, MetricScore.GOOD)
+        if higher_is_better
+        else (MetricScore.GOOD, MetricScore.POOR)
+    )
+
+    return np.where(
+        values < average_min,
+        below.value,
+        np.where(values <= average_max, MetricScore.AVERAGE.value, above.value),
+    ).astype(np.int8)
+
+
+def _score_by_flag(values: NDArray[np.bool_], *, good_if: bool) -> ScoreArray:
+    """Score flags (good if the flag equals good_if, otherwise poor)."""
+
+    return np.where(
+        values == good_if, MetricScore.GOOD.value, MetricScore.POOR.value
+    ).astype(np.int8)
+
+
+def _get_days_since(
+    pushed_at: NDArray[np.datetime64], now: datetime.datetime
+) -> NDArray[np.int64]:
+    """
+    Get whole days between timestamps and now (floored, like timedelta.days).
+    NOTE: Missing timestamps (NaT) are treated as infinitely old, so they get the worst score (like in LastCommitMetric).
+    """
+
+    now_utc = np.datetime64(
+        now.astimezone(datetime.timezone.utc).replace(tzinfo=None), "us"
+    )
+    elapsed_microseconds = (now_utc - pushed_at.astype("datetime64[us]")).astype(
+        np.int64
+    )
+    days: NDArray[np.int64] = np.where(
+        np.isnat(pushed_at),
+        np.iinfo(np.int64).max,
+        np.floor_divide(elapsed_microseconds, _MICROSECONDS_PER_DAY),
+    )
+
+    return days
+
+
+# Vectorized equivalents of each metric's compute_metric_score (sharing its thresholds)
+_COLUMNAR_SCORERS: Final[
+    Mapping[Type[BaseMetric], Callable[[MetricColumns, datetime.datetime], ScoreArray]]
+] = {
+    LastCommitMetric: lambda columns, now: _score_by_range(
+        _get_days_since(columns.pushed_at, now),
+        LastCommitMetric.AVERAGE_MIN,
+        LastCommitMetric.AVERAGE_MAX,
+        higher_is_better=False,
+    ),
+    StarCountMetric: lambda columns, now: _score_by_range(
+        columns.stargazers_count,
+        StarCountMetric.AVERAGE_MIN,
+        StarCountMetric.AVERAGE_MAX,
+        higher_is_better=True,
+    ),
+    ForkCountMetric: lambda columns, now: _score_by_range(
+        columns.forks_count,
+        ForkCountMetric.AVERAGE_MIN,
+        ForkCountMetric.AVERAGE_MAX,
+        higher_is_better=True,
+    ),
+    WatcherCountMetric: lambda columns, now: _score_by_range(
+        columns.watchers_count,
+        WatcherCountMetric.AVERAGE_MIN,
+        WatcherCountMetric.AVERAGE_MAX,
+        higher_is_better=True,
+    ),
+    OpenIssueCountMetric: lambda columns, now: _score_by_range(
+        columns.open_issues_count,
+        OpenIssueCountMetric.AVERAGE_MIN,
+        OpenIssueCountMetric.AVERAGE_MAX,
+        higher_is_better=True,
+    ),
+    IsArchivedMetric: lambda columns, now: _score_by_flag(
+        columns.archived, good_if=IsArchivedMetric.GOOD_IF
+    ),
+    IsDisabledMetric: lambda columns, now: _score_by_flag(
+        columns.disabled, good_if=IsDisabledMetric.GOOD_IF
+    ),
+    HasLicenseMetric: lambda columns, now: _score_by_flag(
+        columns.has_license, good_if=HasLicenseMetric.GOOD_IF
+    ),
+    HasDescriptionMetric: lambda columns, now: _score_by_flag(
+        columns.has_description, good_if=HasDescriptionMetric.GOOD_IF
+    ),
+    HasReadmeMetric: lambda columns, now: _score_by_flag(
+        columns.has_readme, good_if=HasReadmeMetric.GOOD_IF
+    ),
+}
+
+
+class _OverallScoreTables(NamedTuple):
+    """Overall scores for every possible weighted sum (in integer weight units)."""
+
+    weight_units: tuple[int, ...]
+    overall_scores: NDArray[np.float64]
+    overall_scores_int: NDArray[np.int64]
+
+
+@functools.lru_cache(maxsize=128)
+def _create_overall_score_tables(scoring_plan: ScoringPlan) -> _OverallScoreTables:
+    """
+    Create overall score lookup tables for a scoring plan.
+    NOTE: Weights are scaled to integers, so weighted sums are exact integers.  Every possible
+          weighted sum is then mapped to its overall score with the same Decimal arithmetic
+          as MetricReducer, so results match it exactly (not just approximately).
+    """
+
+    decimal_places = max(
+        [0]
+        + [
+            -int(metric_weight.as_tuple().exponent)
+            for metric_weight in scoring_plan.metric_weights
+        ]
+    )
+    scale = 10**decimal_places
+    weight_units = tuple(
+        int(metric_weight * scale) for metric_weight in scoring_plan.metric_weights
+    )
+    overall_scores = []
+    overall_scores_int = []
+
+    for weighted_units in range(MetricScore.GOOD.value * sum(weight_units) + 1):
+        overall_score = (
+            Decimal(weighted_units) / scale / scoring_plan.highest_possible_score
+        )
+        overall_scores.append(float(overall_score))
+        overall_scores_int.append(int(overall_score * 100))
+
+    return _OverallScoreTables(
+        weight_units=weight_units,
+        overall_scores=np.array(overall_scores, dtype=np.float64),
+        overall_scores_int=np.array(overall_scores_int, dtype=np.int64),
+    )
+
+
+def score_columns(
+    metric_columns: MetricColumns,
+    metric_classes: Collection[Type[BaseMetric]],
+    *,
+    now: datetime.datetime | None = None,
+) -> ColumnarScores:
+    """
+    Score many repos at once, with vectorized comparisons instead of per-repo metric instances.
+    NOTE: A single reference "now" is shared by all repos (it defaults to the current time).
+          Raises a ValueError for metrics without a vectorized equivalent.
+    """
+
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    scoring_plan = get_scoring_plan(metric_classes)
+    unsupported_metric_classes = [
+        metric_class
+        for metric_class in scoring_plan.metric_classes
+        if metric_class not in _COLUMNAR_SCORERS
+    ]
+
+    if unsupported_metric_classes:
+        raise ValueError(
+            "Metrics without a columnar implementation: "
+            + ", ".join(
+                metric_class.get_normalized_name()
+                for metric_class in unsupported_metric_classes
+            )
+        )
+
+    overall_score_tables = _create_overall_score_tables(scoring_plan)
+    metric_scores: dict[str, ScoreArray] = {}
+    weighted_units = np.zeros(len(metric_columns.stargazers_count), dtype=np.int64)
+
+    for metric_class, metric_weight_units in zip(
+        scoring_plan.metric_classes, overall_score_tables.weight_units
+    ):
+        scores = _COLUMNAR_SCORERS[metric_class](metric_columns, now)
+        metric_scores[metric_class.get_normalized_name()] = scores
+        weighted_units += scores.astype(np.int64) * metric_weight_units
+
+    return ColumnarScores(
+        metric_scores=metric_scores,
+        overall_scores=overall_score_tables.overall_scores[weighted_units],
+        overall_scores_int=overall_score_tables.overall_scores_int[weighted_units],
+    )
+
+
+def create_metric_columns(repo_contexts: Sequence[RepoContext]) -> MetricColumns:
+    """
+    Create metric columns from (fully loaded) repo contexts.
+    NOTE: Derived flags (description and README) are computed by their metrics, so they match exactly.
+    """
+
+    full_repositories = [
+        repo_context.get_full_repository() for repo_context in repo_contexts
+    ]
+
+    return MetricColumns(
+        stargazers_count=np.array(
+            [repository.stargazers_count for repository in full_repositories],
+            dtype=np.int64,
+        ),
+        forks_count=np.array(
+            [repository.forks_count for repository in full_repositories],
+            dtype=np.int64,
+        ),
+        watchers_count=np.array(
+            [repository.watchers_count for repository in full_repositories],
+            dtype=np.int64,
+        ),
+        open_issues_count=np.array(
+            [repository.open_issues_count for repository in full_repositories],
+            dtype=np.int64,
+        ),
+        pushed_at=np.array(
+            [
+                (
+                    repository.pushed_at.astimezone(datetime.timezone.utc).replace(
+                        tzinfo=None
+                    )
+                    if repository.pushed_at is not None
+                    else None
+                )
+                for repository in full_repositories
+            ],
+            dtype="datetime64[us]",
+        ),
+        archived=np.array(
+            [repository.archived for repository in full_repositories], dtype=np.bool_
+        ),
+        disabled=np.array(
+            [repository.disabled for repository in full_repositories], dtype=np.bool_
+        ),
+        has_license=np.array(
+            [repository.license is not None for repository in full_repositories],
+            dtype=np.bool_,
+        ),
+        has_description=np.array(
+            [
+                HasDescriptionMetric(repo_context).compute_metric_value()
+                for repo_context in repo_contexts
+            ],
+            dtype=np.bool_,
+        ),
+        has_readme=np.array(
+            [
+                HasReadmeMetric(repo_context).compute_metric_value()
+                for repo_context in repo_contexts
+            ],
+            dtype=np.bool_,
+        ),
+    )
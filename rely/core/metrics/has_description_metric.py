@@ -1,7 +1,8 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
 
 
@@ -10,19 +11,21 @@ class HasDescriptionMetric(BaseMetric):
 
     _metric_name = MetricName.HAS_DESCRIPTION_METRIC
     _metric_weight = Decimal("0.25")
+    # Value that gets a good score (any other value gets a poor score)
+    GOOD_IF: Final[bool] = True
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Return True if repo has description, otherwise return False."""
 
-        description = self.repo_context.full_repository.description
+        description = self.repo_context.get_full_repository().description
 
         return description is not None and description.strip() != ""
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Return good score if repo has description, otherwise return poor score."""
 
         has_description = self.compute_metric_value()
 
-        return MetricScore.GOOD if has_description else MetricScore.POOR
+        return MetricScore.GOOD if has_description == self.GOOD_IF else MetricScore.POOR
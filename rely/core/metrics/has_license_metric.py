@@ -1,7 +1,8 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
 
 
@@ -10,17 +11,19 @@ class HasLicenseMetric(BaseMetric):
 
     _metric_name = MetricName.HAS_LICENSE_METRIC
     _metric_weight = Decimal("0.5")
+    # Value that gets a good score (any other value gets a poor score)
+    GOOD_IF: Final[bool] = True
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Return True if repo has license, otherwise return False."""
 
-        return self.repo_context.full_repository.license is not None
+        return self.repo_context.get_full_repository().license is not None
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Return good score if repo has license, otherwise return poor score."""
 
         has_license = self.compute_metric_value()
 
-        return MetricScore.GOOD if has_license else MetricScore.POOR
+        return MetricScore.GOOD if has_license == self.GOOD_IF else MetricScore.POOR
@@ -1,9 +1,11 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.config.constants import SUPPORTED_README_EXTENSIONS
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
+from rely.core.models.repo_context import DataSource
 
 
 class HasReadmeMetric(BaseMetric):
@@ -11,12 +13,15 @@ class HasReadmeMetric(BaseMetric):
 
     _metric_name = MetricName.HAS_README_METRIC
     _metric_weight = Decimal("1.00")
+    _data_sources = frozenset({DataSource.CONTENT_TREE_LIST})
+    # Value that gets a good score (any other value gets a poor score)
+    GOOD_IF: Final[bool] = True
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Return True if repo has non-empty README in root directory, otherwise return False."""
 
-        content_tree_list = self.repo_context.content_tree_list
+        content_tree_list = self.repo_context.get_content_tree_list()
         possible_readme_paths = {
             f"readme.{extension}" for extension in SUPPORTED_README_EXTENSIONS
         }
@@ -30,10 +35,10 @@ class HasReadmeMetric(BaseMetric):
             for content_tree in content_tree_list.content_tree_list
         )
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Return good score if repo has non-empty README in root directory, otherwise return poor score."""
 
         has_readme = self.compute_metric_value()
 
-        return MetricScore.GOOD if has_readme else MetricScore.POOR
+        return MetricScore.GOOD if has_readme == self.GOOD_IF else MetricScore.POOR
@@ -1,7 +1,8 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
 
 
@@ -10,17 +11,19 @@ class IsArchivedMetric(BaseMetric):
 
     _metric_name = MetricName.IS_ARCHIVED_METRIC
     _metric_weight = Decimal("1.00")
+    # Value that gets a good score (any other value gets a poor score)
+    GOOD_IF: Final[bool] = False
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Return True if repo is archived, otherwise return False."""
 
-        return self.repo_context.full_repository.archived
+        return self.repo_context.get_full_repository().archived
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Return poor score if repo is archived, otherwise return good score."""
 
         is_archived = self.compute_metric_value()
 
-        return MetricScore.POOR if is_archived else MetricScore.GOOD
+        return MetricScore.GOOD if is_archived == self.GOOD_IF else MetricScore.POOR
@@ -1,7 +1,8 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
 
 
@@ -10,17 +11,19 @@ class IsDisabledMetric(BaseMetric):
 
     _metric_name = MetricName.IS_DISABLED_METRIC
     _metric_weight = Decimal("1.00")
+    # Value that gets a good score (any other value gets a poor score)
+    GOOD_IF: Final[bool] = False
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Return True if repo is disabled, otherwise return False."""
 
-        return self.repo_context.full_repository.disabled
+        return self.repo_context.get_full_repository().disabled
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Return poor score if repo is disabled, otherwise return good score."""
 
         is_disabled = self.compute_metric_value()
 
-        return MetricScore.POOR if is_disabled else MetricScore.GOOD
+        return MetricScore.GOOD if is_disabled == self.GOOD_IF else MetricScore.POOR
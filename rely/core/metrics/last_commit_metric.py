@@ -1,9 +1,10 @@
 import datetime
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
-from rely.core.metrics.types import MetricName, MetricValue, MetricScore
+from rely.core.metrics.memoization import memoize_method
+from rely.core.metrics.types import MetricName, MetricScore
 
 
 class LastCommitMetric(BaseMetric):
@@ -11,29 +12,42 @@ class LastCommitMetric(BaseMetric):
 
     _metric_name = MetricName.LAST_COMMIT_METRIC
     _metric_weight = Decimal("1.00")
+    # Values within this (inclusive) range get an average score
+    AVERAGE_MIN: Final[int] = 30
+    AVERAGE_MAX: Final[int] = 180
 
-    @functools.cache
-    def compute_metric_value(self) -> MetricValue:
-        """Compute number of days since last commit."""
+    @memoize_method
+    def compute_metric_value(self) -> int | None:
+        """
+        Compute number of days since last commit.
+        NOTE: Repos without any commit (like empty repos) have no value (None), and get the worst score.
+        """
+
+        pushed_at = self.repo_context.get_full_repository().pushed_at
+
+        if pushed_at is None:
+            return None
 
-        pushed_at = self.repo_context.full_repository.pushed_at
         delta = datetime.datetime.now(datetime.timezone.utc) - pushed_at
 
         return delta.days
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Compute score based on time since last commit (shorter time equals better score)."""
 
         days_since_last_commit = self.compute_metric_value()
 
-        # Less than 30 days
-        if days_since_last_commit < 30:
+        # No commit at all
+        if days_since_last_commit is None:
+            metric_score = MetricScore.POOR
+        # Below the average range
+        elif days_since_last_commit < self.AVERAGE_MIN:
             metric_score = MetricScore.GOOD
-        # Between 30 days and 180 days
-        elif 30 <= days_since_last_commit <= 180:
+        # Within the average range
+        elif self.AVERAGE_MIN <= days_since_last_commit <= self.AVERAGE_MAX:
             metric_score = MetricScore.AVERAGE
-        # Greater than 180 days
+        # Above the average range
         else:
             metric_score = MetricScore.POOR
 
@@ -0,0 +1,25 @@
+import functools
+from typing import Any, Callable
+
+
+def memoize_method[S, R](method: Callable[[S], R]) -> Callable[[S], R]:
+    """
+    Memoize a method without arguments on the instance it's called on.
+    NOTE: Unlike functools.cache, results are stored on the instance (not in a global cache
+          that keeps every instance alive), so they are released along with the instance.
+    """
+
+    @functools.wraps(method)
+    def _memoized_method(self: S) -> R:
+        memoized_results: dict[str, Any] = self.__dict__.setdefault(
+            "_memoized_results", {}
+        )
+
+        if method.__name__ not in memoized_results:
+            memoized_results[method.__name__] = method(self)
+
+        result: R = memoized_results[method.__name__]
+
+        return result
+
+    return _memoized_method
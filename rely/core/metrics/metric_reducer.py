@@ -1,44 +1,73 @@
+import functools
 from decimal import Decimal
 from typing import Type, Collection
-import functools
 
-from rely.core.models.repo_context import RepoContext
-from rely.core.metrics.types import MetricScore
-from rely.core.metrics.base_metric import BaseMetric
+from rely.core.models.repo_context import DataSource, RepoContext
+from rely.core.metrics.types import MetricScore, MetricWeight, SerializedMetric
+from rely.core.metrics.base_metric import BaseMetric, get_data_sources
+from rely.core.metrics.memoization import memoize_method
 
 
-class MetricReducer:
-    """Compute overall values for a collection of metrics."""
+class ScoringPlan:
+    """
+    Everything about a collection of metrics that doesn't depend on the repo being scored.
+    NOTE: Plans are compiled once (see get_scoring_plan) and evaluated against many repo contexts.
+    """
 
-    def __init__(
-        self, metric_classes: Collection[Type[BaseMetric]], repo_context: RepoContext
-    ) -> None:
-        self._metric_classes = metric_classes
-        self._repo_context = repo_context
+    def __init__(self, metric_classes: Collection[Type[BaseMetric]]) -> None:
+        self.metric_classes: tuple[Type[BaseMetric], ...] = tuple(metric_classes)
+        self.metric_weights: tuple[MetricWeight, ...] = tuple(
+            metric_class.get_metric_weight() for metric_class in self.metric_classes
+        )
+        self.data_sources: frozenset[DataSource] = get_data_sources(self.metric_classes)
+        # The highest possible score that a repo can have
+        self.highest_possible_score = Decimal(
+            sum(
+                [
+                    MetricScore.GOOD.value * metric_weight
+                    for metric_weight in self.metric_weights
+                ]
+            )
+        )
 
-    @property
-    def metric_instances(self) -> list[BaseMetric]:
-        """Create a list of metric instances."""
 
-        return [
-            metric_class(self._repo_context) for metric_class in self._metric_classes
-        ]
+@functools.lru_cache(maxsize=128)
+def _compile_scoring_plan(metric_classes: tuple[Type[BaseMetric], ...]) -> ScoringPlan:
+    """Compile a scoring plan (cached per ordered tuple of metric classes)."""
 
-    @property
-    def _highest_possible_score(self) -> Decimal:
-        """Compute the highest possible score that a repo can have."""
+    return ScoringPlan(metric_classes)
 
-        metric_weights = [
-            metric_instance.get_metric_weight()
-            for metric_instance in self.metric_instances
-        ]
-        highest_possible_score = sum(
-            [MetricScore.GOOD.value * metric_weight for metric_weight in metric_weights]
-        )
 
-        return Decimal(highest_possible_score)
+def get_scoring_plan(metric_classes: Collection[Type[BaseMetric]]) -> ScoringPlan:
+    """Get the (compiled once) scoring plan for a collection of metric classes."""
+
+    return _compile_scoring_plan(tuple(metric_classes))
 
-    @functools.cache
+
+class MetricReducer:
+    """
+    Compute overall values for a collection of metrics.
+    NOTE: Metric instances are created once per reducer, so every metric is evaluated
+          exactly once, and its results are reused for the overall score and serialization.
+    """
+
+    def __init__(
+        self,
+        metric_classes: Collection[Type[BaseMetric]] | ScoringPlan,
+        repo_context: RepoContext,
+    ) -> None:
+        self._scoring_plan = (
+            metric_classes
+            if isinstance(metric_classes, ScoringPlan)
+            else get_scoring_plan(metric_classes)
+        )
+        self._repo_context = repo_context
+        self.metric_instances: list[BaseMetric] = [
+            metric_class(repo_context)
+            for metric_class in self._scoring_plan.metric_classes
+        ]
+
+    @memoize_method
     def _compute_weighted_sum(self) -> Decimal:
         """Compute the sum of all weighted scores."""
 
@@ -59,4 +88,11 @@ class MetricReducer:
 
         weighted_sum = self._compute_weighted_sum()
 
-        return weighted_sum / self._highest_possible_score
+        return weighted_sum / self._scoring_plan.highest_possible_score
+
+    def serialize_metrics(self) -> list[SerializedMetric]:
+        """Serialize all computed metrics (in plan order)."""
+
+        return [
+            metric_instance.serialize() for metric_instance in self.metric_instances
+        ]
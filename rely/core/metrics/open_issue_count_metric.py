@@ -1,7 +1,8 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
 
 
@@ -10,26 +11,29 @@ class OpenIssueCountMetric(BaseMetric):
 
     _metric_name = MetricName.OPEN_ISSUE_COUNT_METRIC
     _metric_weight = Decimal("0.85")
+    # Values within this (inclusive) range get an average score
+    AVERAGE_MIN: Final[int] = 5
+    AVERAGE_MAX: Final[int] = 20
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Get number of open issues for repo."""
 
-        return self.repo_context.full_repository.open_issues_count
+        return self.repo_context.get_full_repository().open_issues_count
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Compute score based on number of open issues (more open issues equals better score)."""
 
         open_issue_count = self.compute_metric_value()
 
-        # Between 0 and 5
-        if open_issue_count < 5:
+        # Below the average range
+        if open_issue_count < self.AVERAGE_MIN:
             metric_score = MetricScore.POOR
-        # Between 5 and 20
-        elif 5 <= open_issue_count <= 20:
+        # Within the average range
+        elif self.AVERAGE_MIN <= open_issue_count <= self.AVERAGE_MAX:
             metric_score = MetricScore.AVERAGE
-        # Over 20
+        # Above the average range
         else:
             metric_score = MetricScore.GOOD
 
@@ -1,7 +1,8 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
 
 
@@ -10,26 +11,29 @@ class StarCountMetric(BaseMetric):
 
     _metric_name = MetricName.STAR_COUNT_METRIC
     _metric_weight = Decimal("0.65")
+    # Values within this (inclusive) range get an average score
+    AVERAGE_MIN: Final[int] = 50
+    AVERAGE_MAX: Final[int] = 500
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Get number of stars for repo."""
 
-        return self.repo_context.full_repository.stargazers_count
+        return self.repo_context.get_full_repository().stargazers_count
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Compute score based on number of stars (more stars equals better score)."""
 
         star_count = self.compute_metric_value()
 
-        # Between 0 and 50
-        if star_count < 50:
+        # Below the average range
+        if star_count < self.AVERAGE_MIN:
             metric_score = MetricScore.POOR
-        # Between 50 and 500
-        elif 50 <= star_count <= 500:
+        # Within the average range
+        elif self.AVERAGE_MIN <= star_count <= self.AVERAGE_MAX:
             metric_score = MetricScore.AVERAGE
-        # Over 500
+        # Above the average range
         else:
             metric_score = MetricScore.GOOD
 
@@ -46,6 +46,7 @@ class SerializedMetric(BaseModel):
     normalized_name: str
     prettified_name: str
     metric_weight: float
-    metric_value: int | float | bool
+    # None if the repo has no such value (like time since last commit of an empty repo)
+    metric_value: int | float | bool | None
     metric_score: int
     metric_weighted_score: float
@@ -1,7 +1,8 @@
-import functools
 from decimal import Decimal
+from typing import Final
 
 from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.memoization import memoize_method
 from rely.core.metrics.types import MetricName, MetricValue, MetricScore
 
 
@@ -10,26 +11,29 @@ class WatcherCountMetric(BaseMetric):
 
     _metric_name = MetricName.WATCHER_COUNT_METRIC
     _metric_weight = Decimal("0.5")
+    # Values within this (inclusive) range get an average score
+    AVERAGE_MIN: Final[int] = 20
+    AVERAGE_MAX: Final[int] = 200
 
-    @functools.cache
+    @memoize_method
     def compute_metric_value(self) -> MetricValue:
         """Get number of watchers for repo."""
 
-        return self.repo_context.full_repository.watchers_count
+        return self.repo_context.get_full_repository().watchers_count
 
-    @functools.cache
+    @memoize_method
     def compute_metric_score(self) -> MetricScore:
         """Compute score based on number of watchers (more watchers equals better score)."""
 
         watcher_count = self.compute_metric_value()
 
-        # Between 0 and 20
-        if watcher_count < 20:
+        # Below the average range
+        if watcher_count < self.AVERAGE_MIN:
             metric_score = MetricScore.POOR
-        # Between 20 and 200
-        elif 20 <= watcher_count <= 200:
+        # Within the average range
+        elif self.AVERAGE_MIN <= watcher_count <= self.AVERAGE_MAX:
             metric_score = MetricScore.AVERAGE
-        # Over 200
+        # Above the average range
         else:
             metric_score = MetricScore.GOOD
 
@@ -0,0 +1,43 @@
+import enum
+import re
+from typing import Final
+
+from pydantic import BaseModel, ConfigDict
+
+
+# Runs of characters that PyPI treats as equivalent in package names (PEP 503)
+_PYPI_NAME_SEPARATOR_PATTERN: Final[re.Pattern[str]] = re.compile(r"[-_.]+")
+
+
+class Ecosystem(enum.Enum):
+    """Package ecosystems that dependencies can come from."""
+
+    PYPI = "pypi"
+    NPM = "npm"
+
+
+class Dependency(BaseModel):
+    """
+    Model for storing a package that a project depends on.
+    NOTE: Dependencies are hashable (and names are normalized), so they can be deduplicated.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ecosystem: Ecosystem
+    name: str
+
+
+def create_pypi_dependency(name: str) -> Dependency:
+    """Create a PyPI dependency (with its name normalized as in PEP 503)."""
+
+    return Dependency(
+        ecosystem=Ecosystem.PYPI,
+        name=_PYPI_NAME_SEPARATOR_PATTERN.sub("-", name).lower(),
+    )
+
+
+def create_npm_dependency(name: str) -> Dependency:
+    """Create an npm dependency."""
+
+    return Dependency(ecosystem=Ecosystem.NPM, name=name)
@@ -1,32 +1,172 @@
+import asyncio
+import enum
+from typing import Collection, Final, Sequence
+
 from pydantic import BaseModel
 
-from rely.clients.models.full_repository import FullRepository
+from rely.clients.models.scoring_repository import ScoringRepository
 from rely.clients.models.content_tree_list import ContentTreeList
-from rely.clients.github_api_client import GitHubAPIClient
+from rely.clients.github_api_client import GitHubAPIClient, GitHubAPIError
+from rely.clients.github_graphql_client import GitHubGraphQLClient
 from rely.core.models.repo_identifier import RepoIdentifier
 
 
+class DataSource(enum.Enum):
+    """Data sources that metrics can require (each one is a separate API request)."""
+
+    FULL_REPOSITORY = "full_repository"
+    CONTENT_TREE_LIST = "content_tree_list"
+
+
+ALL_DATA_SOURCES: Final[frozenset[DataSource]] = frozenset(DataSource)
+
+
+class MissingDataSourceError(Exception):
+    """Raised when a metric reads a data source that wasn't loaded into the context."""
+
+
 class RepoContext(BaseModel):
-    """Model for storing all context required for computing repository metrics."""
+    """
+    Model for storing all context required for computing repository metrics.
+    NOTE: Data sources that no metric requires may not be loaded (they are None).
+    """
 
     repo_identifier: RepoIdentifier
-    full_repository: FullRepository
-    content_tree_list: ContentTreeList
+    full_repository: ScoringRepository | None = None
+    content_tree_list: ContentTreeList | None = None
+
+    def get_full_repository(self) -> ScoringRepository:
+        """Get full repository (raises an error if it wasn't loaded)."""
+
+        if self.full_repository is None:
+            raise MissingDataSourceError(
+                f"{DataSource.FULL_REPOSITORY.value} was not loaded"
+            )
+
+        return self.full_repository
+
+    def get_content_tree_list(self) -> ContentTreeList:
+        """Get content tree list (raises an error if it wasn't loaded)."""
+
+        if self.content_tree_list is None:
+            raise MissingDataSourceError(
+                f"{DataSource.CONTENT_TREE_LIST.value} was not loaded"
+            )
+
+        return self.content_tree_list
+
+
+class LazyRepoContext:
+    """
+    Context whose data sources are fetched on first access, and then memoized.
+    NOTE: Each data source is fetched at most once, even if it is accessed concurrently.
+    """
+
+    def __init__(
+        self,
+        repo_identifier: RepoIdentifier,
+        github_api_client: GitHubAPIClient,
+        *,
+        full_repository: ScoringRepository | None = None,
+    ) -> None:
+        """
+        Initialize lazy context.
+        NOTE: If a full repository is given (like one from a repository listing), it is never fetched.
+        """
+
+        self.repo_identifier = repo_identifier
+        self._github_api_client = github_api_client
+        self._full_repository = full_repository
+        self._full_repository_task: asyncio.Task[ScoringRepository] | None = None
+        self._content_tree_list_task: asyncio.Task[ContentTreeList] | None = None
+
+    async def get_full_repository(self) -> ScoringRepository:
+        """Get full repository (fetched on first access, unless it was given)."""
+
+        if self._full_repository is not None:
+            return self._full_repository
+
+        if self._full_repository_task is None:
+            self._full_repository_task = asyncio.ensure_future(
+                self._github_api_client.get_repo(self.repo_identifier)
+            )
+
+        return await self._full_repository_task
+
+    async def get_content_tree_list(self) -> ContentTreeList:
+        """Get content tree list of the root directory (fetched on first access)."""
+
+        if self._content_tree_list_task is None:
+            self._content_tree_list_task = asyncio.ensure_future(
+                self._github_api_client.get_repo_root_contents(self.repo_identifier)
+            )
+
+        return await self._content_tree_list_task
+
+    async def load(self, data_sources: Collection[DataSource]) -> RepoContext:
+        """
+        Load data sources (concurrently) into a RepoContext.
+        NOTE: Data sources that aren't given are not fetched (they are None in the RepoContext).
+        """
+
+        async def _get_full_repository() -> ScoringRepository | None:
+            if DataSource.FULL_REPOSITORY not in data_sources:
+                return None
+
+            return await self.get_full_repository()
+
+        async def _get_content_tree_list() -> ContentTreeList | None:
+            if DataSource.CONTENT_TREE_LIST not in data_sources:
+                return None
+
+            return await self.get_content_tree_list()
+
+        full_repository, content_tree_list = await asyncio.gather(
+            _get_full_repository(), _get_content_tree_list()
+        )
+
+        return RepoContext(
+            repo_identifier=self.repo_identifier,
+            full_repository=full_repository,
+            content_tree_list=content_tree_list,
+        )
 
 
 async def create_repo_context(
     repo_identifier: RepoIdentifier,
     github_api_client: GitHubAPIClient,
+    data_sources: Collection[DataSource] = ALL_DATA_SOURCES,
 ) -> RepoContext:
-    """Create a RepoContext instance."""
-
-    full_repository = await github_api_client.get_repo(repo_identifier)
-    content_tree_list = await github_api_client.get_repo_contents(
-        full_repository.contents_url
-    )
-
-    return RepoContext(
-        repo_identifier=repo_identifier,
-        full_repository=full_repository,
-        content_tree_list=content_tree_list,
-    )
+    """
+    Create a RepoContext instance.
+    NOTE: Only the given data sources are fetched, and they are fetched concurrently.
+    """
+
+    lazy_repo_context = LazyRepoContext(repo_identifier, github_api_client)
+
+    return await lazy_repo_context.load(data_sources)
+
+
+async def create_repo_contexts(
+    repo_identifiers: Sequence[RepoIdentifier],
+    github_graphql_client: GitHubGraphQLClient,
+) -> list[RepoContext | GitHubAPIError]:
+    """
+    Create many RepoContext instances with bulk GraphQL queries.
+    Returns one RepoContext (or error) per repo identifier, in input order.
+    """
+
+    graphql_repositories = await github_graphql_client.get_repos(repo_identifiers)
+
+    return [
+        graphql_repository
+        if isinstance(graphql_repository, GitHubAPIError)
+        else RepoContext(
+            repo_identifier=repo_identifier,
+            full_repository=graphql_repository.full_repository,
+            content_tree_list=graphql_repository.content_tree_list,
+        )
+        for repo_identifier, graphql_repository in zip(
+            repo_identifiers, graphql_repositories
+        )
+    ]
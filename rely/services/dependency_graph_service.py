@@ -0,0 +1,246 @@
+import asyncio
+from typing import Collection, Iterable, Type
+
+from pydantic import BaseModel
+
+from rely.clients.github_api_client import GitHubAPIClient
+from rely.clients.package_resolver import PackageResolutionError, PackageResolver
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.models.dependency import Dependency
+from rely.services.score_repos_service import RepoOutcome, score_repo_outcome
+
+
+class DependencyNode(BaseModel):
+    """Model to store a scored package in a dependency graph (along with the packages it depends on)."""
+
+    dependency: Dependency
+    # None if the package couldn't be resolved to a GitHub repo
+    repo_url: str | None = None
+    overall_score_decimal: float | None = None
+    overall_score_int: int | None = None
+    error: str | None = None
+    dependencies: list[Dependency] = []
+
+
+class DependencyTreeSummary(BaseModel):
+    """Model to store the aggregate score of a top-level dependency and everything it (transitively) depends on."""
+
+    dependency: Dependency
+    # Lowest overall score in the tree (its weakest link), and the package it belongs to
+    weakest_score_decimal: float | None
+    weakest_score_int: int | None
+    weakest_dependency: Dependency | None
+    # Number of packages in the tree (including the top-level dependency), and how many couldn't be scored
+    package_count: int
+    error_count: int
+
+
+class DependencyGraphResult(BaseModel):
+    """Model to store a scored dependency graph."""
+
+    summaries: list[DependencyTreeSummary]
+    nodes: list[DependencyNode]
+
+
+async def score_dependency_graph(
+    dependencies: Iterable[Dependency],
+    package_resolver: PackageResolver,
+    github_api_client: GitHubAPIClient,
+    max_concurrency: int,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+    *,
+    max_depth: int | None = None,
+) -> DependencyGraphResult:
+    """
+    Walk the transitive dependency graph of top-level dependencies, and score every unique repo once.
+    Each top-level dependency is summarized by the weakest link of its tree.
+    NOTE: Traversal and scoring overlap (a package's dependencies are resolved while its repo is
+          scored), and at most max_concurrency resolutions and scorings are in flight at any time.
+          Packages are resolved once, and walked at the shallowest depth they are reached at
+          (top-level dependencies are at depth 0), however quickly each path resolves.
+          Dependencies are taken from the latest version of each package.
+    """
+
+    dependency_graph = _DependencyGraph(
+        package_resolver,
+        github_api_client,
+        asyncio.Semaphore(max_concurrency),
+        metric_classes,
+        max_depth,
+    )
+    top_level_dependencies = list(dict.fromkeys(dependencies))
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            for dependency in top_level_dependencies:
+                dependency_graph.visit(task_group, dependency, depth=0)
+    finally:
+        dependency_graph.cancel_scorings()
+
+    return DependencyGraphResult(
+        summaries=[
+            dependency_graph.summarize(dependency)
+            for dependency in top_level_dependencies
+        ],
+        nodes=list(dependency_graph.nodes.values()),
+    )
+
+
+class _DependencyGraph:
+    """State of a dependency graph walk (nodes per package, and scorings per repo)."""
+
+    def __init__(
+        self,
+        package_resolver: PackageResolver,
+        github_api_client: GitHubAPIClient,
+        semaphore: asyncio.Semaphore,
+        metric_classes: Collection[Type[BaseMetric]] | None,
+        max_depth: int | None,
+    ) -> None:
+        self.nodes: dict[Dependency, DependencyNode] = {}
+        # Shallowest depth each package was reached at, and the packages that were resolved
+        self._depths: dict[Dependency, int] = {}
+        self._resolved_dependencies: set[Dependency] = set()
+        self._package_resolver = package_resolver
+        self._github_api_client = github_api_client
+        self._semaphore = semaphore
+        self._metric_classes = metric_classes
+        self._max_depth = max_depth
+        # Scorings per (case-insensitive) repo URL, shared by every package that resolves to it
+        self._repo_outcome_tasks: dict[str, asyncio.Future[RepoOutcome]] = {}
+
+    def visit(
+        self, task_group: asyncio.TaskGroup, dependency: Dependency, depth: int
+    ) -> None:
+        """
+        Start walking a package (unless it was already reached at the same depth, or a shallower one).
+        NOTE: If a resolved package is reached at a shallower depth, its dependencies are visited again
+              (at their new depth), which walks any that were beyond the maximum depth before.
+        """
+
+        if dependency in self._depths and self._depths[dependency] <= depth:
+            return
+
+        self._depths[dependency] = depth
+
+        if dependency not in self.nodes:
+            self.nodes[dependency] = DependencyNode(dependency=dependency)
+            task_group.create_task(self._walk(task_group, dependency))
+        elif dependency in self._resolved_dependencies:
+            self._visit_dependencies(task_group, dependency)
+
+    def _visit_dependencies(
+        self, task_group: asyncio.TaskGroup, dependency: Dependency
+    ) -> None:
+        """Visit the dependencies of a resolved package (unless it is at the maximum depth)."""
+
+        depth = self._depths[dependency]
+
+        if self._max_depth is None or depth < self._max_depth:
+            for child_dependency in self.nodes[dependency].dependencies:
+                self.visit(task_group, child_dependency, depth + 1)
+
+    async def _walk(
+        self, task_group: asyncio.TaskGroup, dependency: Dependency
+    ) -> None:
+        """Resolve a package, start walking its dependencies, and then score its repo."""
+
+        node = self.nodes[dependency]
+
+        try:
+            async with self._semaphore:
+                package_resolution = await self._package_resolver.resolve(dependency)
+        except PackageResolutionError as error:
+            node.error = str(error)
+
+            return
+
+        node.repo_url = package_resolution.repo_url
+        node.dependencies = list(package_resolution.dependencies)
+        self._resolved_dependencies.add(dependency)
+        self._visit_dependencies(task_group, dependency)
+
+        if node.repo_url is None:
+            node.error = "Could not find a GitHub repo"
+
+            return
+
+        repo_outcome = await self._score_repo(node.repo_url)
+
+        if repo_outcome.result is None:
+            node.error = repo_outcome.error
+
+            return
+
+        node.overall_score_decimal = repo_outcome.result.overall_score_decimal
+        node.overall_score_int = repo_outcome.result.overall_score_int
+
+    async def _score_repo(self, repo_url: str) -> RepoOutcome:
+        """Score a repo (only once, however many packages resolve to it)."""
+
+        repo_outcome_task = self._repo_outcome_tasks.get(repo_url.lower())
+
+        if repo_outcome_task is None:
+            repo_outcome_task = asyncio.ensure_future(
+                self._score_repo_with_semaphore(repo_url)
+            )
+            self._repo_outcome_tasks[repo_url.lower()] = repo_outcome_task
+
+        return await repo_outcome_task
+
+    async def _score_repo_with_semaphore(self, repo_url: str) -> RepoOutcome:
+        async with self._semaphore:
+            return await score_repo_outcome(
+                repo_url, self._github_api_client, self._metric_classes
+            )
+
+    def cancel_scorings(self) -> None:
+        """Cancel scorings that are still pending (like when the walk fails or is cancelled)."""
+
+        for repo_outcome_task in self._repo_outcome_tasks.values():
+            repo_outcome_task.cancel()
+
+    def summarize(self, dependency: Dependency) -> DependencyTreeSummary:
+        """Summarize the tree of a package (everything it transitively depends on) by its weakest link."""
+
+        tree_nodes = self._collect_tree(dependency)
+        scored_nodes = [
+            node for node in tree_nodes if node.overall_score_decimal is not None
+        ]
+        weakest_node = min(
+            scored_nodes,
+            key=lambda node: node.overall_score_decimal or 0.0,
+            default=None,
+        )
+
+        return DependencyTreeSummary(
+            dependency=dependency,
+            weakest_score_decimal=(
+                weakest_node.overall_score_decimal if weakest_node else None
+            ),
+            weakest_score_int=weakest_node.overall_score_int if weakest_node else None,
+            weakest_dependency=weakest_node.dependency if weakest_node else None,
+            package_count=len(tree_nodes),
+            error_count=len(tree_nodes) - len(scored_nodes),
+        )
+
+    def _collect_tree(self, dependency: Dependency) -> list[DependencyNode]:
+        """
+        Collect the nodes of a package and everything it transitively depends on.
+        NOTE: Dependencies that weren't walked (beyond the maximum depth) are left out, and cycles are visited once.
+        """
+
+        tree_nodes: dict[Dependency, DependencyNode] = {}
+        pending_dependencies = [dependency]
+
+        while pending_dependencies:
+            pending_dependency = pending_dependencies.pop()
+            node = self.nodes.get(pending_dependency)
+
+            if node is None or pending_dependency in tree_nodes:
+                continue
+
+            tree_nodes[pending_dependency] = node
+            pending_dependencies.extend(node.dependencies)
+
+        return list(tree_nodes.values())
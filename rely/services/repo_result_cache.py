@@ -0,0 +1,248 @@
+import asyncio
+import time
+from collections import OrderedDict
+from enum import StrEnum
+from typing import Any, Callable, Collection, Coroutine, NamedTuple, Type
+
+import aiohttp
+from pydantic import HttpUrl
+
+from rely.clients.github_api_client import GitHubAPIClient, GitHubUnavailableError
+from rely.clients.single_flight import SingleFlight
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.models.repo_identifier import RepoIdentifier
+from rely.services.score_repo_service import (
+    RepoResult,
+    ScoringKey,
+    create_scoring_key,
+    get_metric_classes,
+    score_repo_identifier,
+)
+
+
+class Freshness(StrEnum):
+    """Freshness of a served result."""
+
+    # Scored within the maximum age
+    FRESH = "fresh"
+    # Older than the maximum age, served while it is refreshed in the background
+    STALE = "stale"
+    # Older than the maximum age, served because GitHub is rate limiting (or unavailable)
+    STALE_IF_ERROR = "stale_if_error"
+
+
+class CachedRepoResult(NamedTuple):
+    """A result along with its freshness and age (in seconds)."""
+
+    repo_result: RepoResult
+    freshness: Freshness
+    age: float
+
+
+class _ResultEntry(NamedTuple):
+    repo_result: RepoResult
+    scored_at: float
+
+
+class RepoResultCache:
+    """
+    Size-bounded LRU cache of scored results, with stale-while-revalidate and stale-if-error serving.
+    Reference: https://www.rfc-editor.org/rfc/rfc5861
+    """
+
+    def __init__(
+        self,
+        single_flight: SingleFlight[ScoringKey, RepoResult],
+        *,
+        max_size: int,
+        max_age: float,
+        stale_while_revalidate: float,
+        stale_if_error: float,
+        refresh_timeout: float,
+        is_rate_limited: Callable[[], bool] = lambda: False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize result cache.
+        NOTE: Results are fresh for max_age seconds.  For stale_while_revalidate seconds after that,
+              the stale result is returned immediately and refreshed in the background.  For
+              stale_if_error seconds after that, it is returned if GitHub is rate limiting
+              (is_rate_limited), if the refresh fails because GitHub is unavailable, or if the
+              refresh takes longer than refresh_timeout seconds (like when it waits for a rate
+              limit to reset).  The refresh then continues in the background.
+              Scorings go through single_flight, so refreshes are shared with concurrent requests.
+        """
+
+        self._single_flight = single_flight
+        self._max_size = max_size
+        self._max_age = max_age
+        self._stale_while_revalidate = stale_while_revalidate
+        self._stale_if_error = stale_if_error
+        self._refresh_timeout = refresh_timeout
+        self._is_rate_limited = is_rate_limited
+        self._clock = clock
+        self._entries: OrderedDict[ScoringKey, _ResultEntry] = OrderedDict()
+        self._background_refreshes: dict[ScoringKey, asyncio.Task[RepoResult]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def cache_control(self) -> str:
+        """Get the Cache-Control header value that describes this cache's freshness policy."""
+
+        return (
+            f"max-age={int(self._max_age)}, "
+            f"stale-while-revalidate={int(self._stale_while_revalidate)}, "
+            f"stale-if-error={int(self._stale_if_error)}"
+        )
+
+    async def get_or_score(
+        self,
+        scoring_key: ScoringKey,
+        score: Callable[[], Coroutine[Any, Any, RepoResult]],
+    ) -> CachedRepoResult:
+        """
+        Get a cached result (refreshing it in the background if it's stale), or score it.
+        NOTE: Errors other than rate limits (or GitHub being unavailable) are always raised.
+        """
+
+        entry = self._get_entry(scoring_key)
+        age = self._clock() - entry.scored_at if entry is not None else 0.0
+
+        if entry is not None and age < self._max_age:
+            return CachedRepoResult(entry.repo_result, Freshness.FRESH, age)
+
+        if entry is not None and age < self._max_age + self._stale_while_revalidate:
+            self._start_background_refresh(scoring_key, score)
+
+            return CachedRepoResult(entry.repo_result, Freshness.STALE, age)
+
+        if entry is None:
+            repo_result = await self._refresh(scoring_key, score)
+
+            return CachedRepoResult(repo_result, Freshness.FRESH, 0.0)
+
+        # NOTE: Within the stale-if-error window, requests never wait long for GitHub
+        background_refresh = self._start_background_refresh(scoring_key, score)
+
+        if self._is_rate_limited():
+            return CachedRepoResult(entry.repo_result, Freshness.STALE_IF_ERROR, age)
+
+        try:
+            async with asyncio.timeout(self._refresh_timeout):
+                repo_result = await asyncio.shield(background_refresh)
+        except (
+            GitHubUnavailableError,
+            aiohttp.ClientConnectionError,
+            TimeoutError,
+        ):
+            return CachedRepoResult(entry.repo_result, Freshness.STALE_IF_ERROR, age)
+
+        return CachedRepoResult(repo_result, Freshness.FRESH, 0.0)
+
+    async def close(self) -> None:
+        """Cancel background refreshes (and wait for them to finish)."""
+
+        background_refreshes = list(self._background_refreshes.values())
+
+        for background_refresh in background_refreshes:
+            background_refresh.cancel()
+
+        await asyncio.gather(*background_refreshes, return_exceptions=True)
+
+    def _get_entry(self, scoring_key: ScoringKey) -> _ResultEntry | None:
+        """Get an entry that can still be served (in any way), dropping it otherwise."""
+
+        entry = self._entries.get(scoring_key)
+
+        if entry is None:
+            return None
+
+        max_stale = max(self._stale_while_revalidate, self._stale_if_error)
+
+        if self._clock() - entry.scored_at >= self._max_age + max_stale:
+            del self._entries[scoring_key]
+
+            return None
+
+        self._entries.move_to_end(scoring_key)
+
+        return entry
+
+    def _set_entry(self, scoring_key: ScoringKey, repo_result: RepoResult) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+
+        if self._max_size <= 0:
+            return
+
+        self._entries[scoring_key] = _ResultEntry(repo_result, self._clock())
+        self._entries.move_to_end(scoring_key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def _refresh(
+        self,
+        scoring_key: ScoringKey,
+        score: Callable[[], Coroutine[Any, Any, RepoResult]],
+    ) -> RepoResult:
+        """Score a result (sharing the scoring with concurrent callers), and store it."""
+
+        async def _score_and_store() -> RepoResult:
+            repo_result = await score()
+            self._set_entry(scoring_key, repo_result)
+
+            return repo_result
+
+        return await self._single_flight.run(scoring_key, _score_and_store)
+
+    def _start_background_refresh(
+        self,
+        scoring_key: ScoringKey,
+        score: Callable[[], Coroutine[Any, Any, RepoResult]],
+    ) -> asyncio.Task[RepoResult]:
+        """Start refreshing a result in the background, unless it's already being refreshed."""
+
+        background_refresh = self._background_refreshes.get(scoring_key)
+
+        if background_refresh is None:
+            background_refresh = asyncio.create_task(self._refresh(scoring_key, score))
+            self._background_refreshes[scoring_key] = background_refresh
+            background_refresh.add_done_callback(
+                lambda _: self._forget_background_refresh(scoring_key)
+            )
+
+        return background_refresh
+
+    def _forget_background_refresh(self, scoring_key: ScoringKey) -> None:
+        """
+        Forget a finished background refresh.
+        NOTE: Failed refreshes are dropped (the stale result keeps being served, and the next request retries).
+        """
+
+        background_refresh = self._background_refreshes.pop(scoring_key)
+
+        if not background_refresh.cancelled():
+            background_refresh.exception()
+
+
+async def score_repo_cached(
+    repo_url: str,
+    github_api_client: GitHubAPIClient,
+    repo_result_cache: RepoResultCache,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> CachedRepoResult:
+    """Compute metrics for a repo, serving cached (possibly stale) results when possible."""
+
+    if metric_classes is None:
+        metric_classes = get_metric_classes()
+
+    repo_identifier = RepoIdentifier(url=HttpUrl(repo_url))
+
+    return await repo_result_cache.get_or_score(
+        create_scoring_key(repo_identifier, metric_classes),
+        lambda: score_repo_identifier(
+            repo_identifier, github_api_client, metric_classes
+        ),
+    )
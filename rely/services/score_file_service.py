@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import Collection, Iterable, Iterator, Type
+
+from pydantic import ValidationError
+
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.models.repo_context import MissingDataSourceError, RepoContext
+from rely.services.score_repo_service import get_metric_classes, score_repo_context
+from rely.services.score_repos_service import RepoOutcome
+
+
+def read_repo_contexts(
+    lines: Iterable[str | bytes],
+) -> Iterator[tuple[int, RepoContext | ValidationError]]:
+    """
+    Read repo contexts from NDJSON lines (one archived RepoContext per line, like the test fixtures).
+    Yields the line number along with the validated RepoContext (or the validation error).
+    NOTE: Lines are validated one at a time, so memory use doesn't grow with the number of lines.
+          Blank lines are skipped.
+    """
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            yield line_number, RepoContext.model_validate_json(line)
+        except ValidationError as error:
+            yield line_number, error
+
+
+def score_repo_context_lines(
+    lines: Iterable[str | bytes],
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> Iterator[RepoOutcome]:
+    """
+    Score archived repo contexts from NDJSON lines, without any network access.
+    Outcomes are yielded in input order, as soon as each line is scored.
+    NOTE: Lines that can't be validated (or that lack data the metrics read) become error outcomes,
+          identified by their line number.
+    """
+
+    if metric_classes is None:
+        metric_classes = get_metric_classes()
+
+    for line_number, repo_context in read_repo_contexts(lines):
+        if isinstance(repo_context, ValidationError):
+            yield RepoOutcome(
+                repo_url=f"line {line_number}",
+                error=f"Invalid repo context: {repo_context}",
+            )
+
+            continue
+
+        repo_url = str(repo_context.repo_identifier.url)
+
+        try:
+            repo_result = score_repo_context(repo_context, metric_classes)
+        except MissingDataSourceError as error:
+            yield RepoOutcome(repo_url=repo_url, error=str(error))
+
+            continue
+
+        yield RepoOutcome(repo_url=repo_url, result=repo_result)
+
+
+def score_file(
+    file_path: Path,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> Iterator[RepoOutcome]:
+    """Score archived repo contexts from an NDJSON file (streamed line by line)."""
+
+    with file_path.open("rb") as file:
+        yield from score_repo_context_lines(file, metric_classes)
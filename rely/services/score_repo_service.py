@@ -1,13 +1,24 @@
+import contextlib
+import functools
+from typing import AsyncIterator, Collection, Type
+
 from pydantic import BaseModel, HttpUrl
 
 from rely.config.settings import Settings
 from rely.clients.http_client import HTTPClient
 from rely.clients.github_api_client import GitHubAPIClient
+from rely.clients.github_graphql_client import GitHubGraphQLClient
+from rely.clients.rate_limiter import RateLimiter
+from rely.clients.response_cache import ResponseCache
+from rely.clients.response_store import MemoryResponseStore, ResponseStore
+from rely.clients.single_flight import SingleFlight
+from rely.clients.github_app_auth import GitHubAppTokenProvider
+from rely.clients.token_pool import TokenPool, TokenProvider
 from rely.core.models.repo_identifier import RepoIdentifier
-from rely.core.models.repo_context import create_repo_context
+from rely.core.models.repo_context import LazyRepoContext, RepoContext
 from rely.core.metrics.types import SerializedMetric, MetricScore
 from rely.core.metrics.base_metric import BaseMetric
-from rely.core.metrics.metric_reducer import MetricReducer
+from rely.core.metrics.metric_reducer import MetricReducer, get_scoring_plan
 
 # NOTE: We import these here in order to populate the registry
 # TODO: Explore other solutions besides registry that are more explicit
@@ -23,6 +34,10 @@ from rely.core.metrics.has_description_metric import HasDescriptionMetric  # noq
 from rely.core.metrics.has_readme_metric import HasReadmeMetric  # noqa
 
 
+# Normalized repo (OWNER/REPO, lowercased) and sorted metric names
+type ScoringKey = tuple[str, tuple[str, ...]]
+
+
 class RepoResult(BaseModel):
     """Model to store the overall result output for a repo."""
 
@@ -32,30 +47,234 @@ class RepoResult(BaseModel):
     metrics: list[SerializedMetric]
 
 
-async def score_repo(repo_url: str) -> RepoResult:
-    """Patch components together and compute metrics for a repo, based on a URL."""
+@contextlib.asynccontextmanager
+async def create_github_api_client(
+    settings: Settings,
+    *,
+    response_store: ResponseStore | None = None,
+    max_age: float | None = None,
+) -> AsyncIterator[GitHubAPIClient]:
+    """
+    Create a GitHubAPIClient backed by a single (pooled) HTTP client session.
+    NOTE: If no response store is given, an in-memory store is used for conditional requests.
+          Requests are spread across all configured tokens, each paced by its own rate limiter.
+    """
 
-    settings = Settings()
-    repo_identifier = RepoIdentifier(url=HttpUrl(repo_url))
+    if response_store is None and settings.conditional_request_store_size > 0:
+        response_store = MemoryResponseStore(settings.conditional_request_store_size)
+
+    async with HTTPClient(
+        pool_size=settings.http_pool_size,
+        keepalive_timeout=settings.http_keepalive_timeout,
+        response_store=response_store,
+        max_age=max_age,
+    ) as http_client:
+        yield GitHubAPIClient(
+            http_client=http_client,
+            token_pool=TokenPool(
+                _create_credentials(settings, http_client),
+                create_rate_limiter=functools.partial(
+                    RateLimiter,
+                    requests_per_second=settings.rate_limit_requests_per_second,
+                    burst=settings.rate_limit_burst,
+                ),
+            ),
+            response_cache=(
+                ResponseCache(settings.response_cache_max_size)
+                if settings.response_cache_max_size > 0
+                else None
+            ),
+            repo_cache_ttl=settings.repo_cache_ttl,
+            contents_cache_ttl=settings.contents_cache_ttl,
+            max_retries=settings.max_retries,
+        )
+
+
+@contextlib.asynccontextmanager
+async def create_github_graphql_client(
+    settings: Settings,
+) -> AsyncIterator[GitHubGraphQLClient]:
+    """Create a GitHubGraphQLClient backed by a single (pooled) HTTP client session."""
 
-    async with HTTPClient() as http_client:
-        github_api_client = GitHubAPIClient(
+    async with HTTPClient(
+        pool_size=settings.http_pool_size,
+        keepalive_timeout=settings.http_keepalive_timeout,
+    ) as http_client:
+        yield GitHubGraphQLClient(
             http_client=http_client,
-            personal_access_token=settings.github_personal_access_token,
+            # NOTE: GraphQL queries use a single token (the App installation's, if configured)
+            personal_access_token=_create_credentials(settings, http_client)[0],
+            max_query_cost=settings.graphql_max_query_cost,
+        )
+
+
+def _create_credentials(
+    settings: Settings, http_client: HTTPClient
+) -> list[str | TokenProvider]:
+    """Create credentials for all configured personal access tokens and GitHub App installations."""
+
+    credentials: list[str | TokenProvider] = []
+
+    if (
+        settings.github_app_id is not None
+        and settings.github_app_private_key is not None
+        and settings.github_app_installation_id is not None
+    ):
+        credentials.append(
+            GitHubAppTokenProvider(
+                http_client,
+                settings.github_app_id,
+                settings.github_app_private_key,
+                settings.github_app_installation_id,
+                refresh_margin=settings.github_app_token_refresh_margin,
+            )
         )
-        repo_context = await create_repo_context(repo_identifier, github_api_client)
+
+    credentials.extend(settings.personal_access_tokens)
+
+    return credentials
+
+
+def parse_metric_names(metric_names: str) -> list[str]:
+    """Parse a comma-separated list of normalized metric names."""
+
+    return [
+        metric_name.strip()
+        for metric_name in metric_names.split(",")
+        if metric_name.strip()
+    ]
+
+
+def get_metric_classes(
+    metric_names: Collection[str] | None = None,
+) -> list[Type[BaseMetric]]:
+    """
+    Get registered metric classes (all of them, or only the ones with the given normalized names).
+    NOTE: Raises a ValueError if no metric name is given, or if any metric name is unknown.
+    """
 
     registry = BaseMetric.get_registry()
-    metric_class_list = registry.values()
-    metric_reducer = MetricReducer(metric_class_list, repo_context)
+
+    if metric_names is None:
+        return list(registry.values())
+
+    if not metric_names:
+        raise ValueError("At least one metric must be selected")
+
+    unknown_metric_names = set(metric_names) - registry.keys()
+
+    if unknown_metric_names:
+        raise ValueError(
+            f"Unknown metrics: {', '.join(sorted(unknown_metric_names))} "
+            f"(valid metrics are: {', '.join(registry.keys())})"
+        )
+
+    return [
+        metric_class
+        for metric_name, metric_class in registry.items()
+        if metric_name in metric_names
+    ]
+
+
+async def score_repo_with_client(
+    repo_url: str,
+    github_api_client: GitHubAPIClient,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> RepoResult:
+    """
+    Compute metrics for a repo, based on a URL, using an existing GitHubAPIClient.
+    NOTE: Only the data sources that the metrics read are fetched.
+    """
+
+    if metric_classes is None:
+        metric_classes = get_metric_classes()
+
+    repo_identifier = RepoIdentifier(url=HttpUrl(repo_url))
+
+    return await score_repo_identifier(
+        repo_identifier, github_api_client, metric_classes
+    )
+
+
+async def score_repo_coalesced(
+    repo_url: str,
+    github_api_client: GitHubAPIClient,
+    single_flight: SingleFlight[ScoringKey, RepoResult],
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> RepoResult:
+    """
+    Compute metrics for a repo, like score_repo_with_client, but concurrent calls for the same
+    repo (ignoring case) and metrics share a single fetch and scoring.
+    NOTE: Errors are raised to every caller that shares the scoring.
+    """
+
+    if metric_classes is None:
+        metric_classes = get_metric_classes()
+
+    repo_identifier = RepoIdentifier(url=HttpUrl(repo_url))
+
+    return await single_flight.run(
+        create_scoring_key(repo_identifier, metric_classes),
+        lambda: score_repo_identifier(
+            repo_identifier, github_api_client, metric_classes
+        ),
+    )
+
+
+def create_scoring_key(
+    repo_identifier: RepoIdentifier, metric_classes: Collection[Type[BaseMetric]]
+) -> ScoringKey:
+    """Create the key that identifies a scoring (the repo, ignoring case, and the metrics)."""
+
+    return (
+        f"{repo_identifier.repo_owner}/{repo_identifier.repo_name}".lower(),
+        tuple(
+            sorted(
+                metric_class.get_normalized_name() for metric_class in metric_classes
+            )
+        ),
+    )
+
+
+async def score_repo_identifier(
+    repo_identifier: RepoIdentifier,
+    github_api_client: GitHubAPIClient,
+    metric_classes: Collection[Type[BaseMetric]],
+) -> RepoResult:
+    """Compute metrics for a repo, fetching only the data sources that the metrics read."""
+
+    lazy_repo_context = LazyRepoContext(repo_identifier, github_api_client)
+    repo_context = await lazy_repo_context.load(
+        get_scoring_plan(metric_classes).data_sources
+    )
+
+    return score_repo_context(repo_context, metric_classes)
+
+
+def score_repo_context(
+    repo_context: RepoContext,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> RepoResult:
+    """Compute metrics (all of them by default) for a repo, based on an already loaded RepoContext."""
+
+    if metric_classes is None:
+        metric_classes = get_metric_classes()
+
+    metric_reducer = MetricReducer(get_scoring_plan(metric_classes), repo_context)
     overall_score = metric_reducer.compute_overall_score()
 
     return RepoResult(
         overall_score_decimal=float(overall_score),
         overall_score_int=int(overall_score * 100),
         maximum_metric_score=MetricScore.GOOD.value,
-        metrics=[
-            metric_instance.serialize()
-            for metric_instance in metric_reducer.metric_instances
-        ],
+        metrics=metric_reducer.serialize_metrics(),
     )
+
+
+async def score_repo(repo_url: str) -> RepoResult:
+    """Patch components together and compute metrics for a repo, based on a URL."""
+
+    settings = Settings()
+
+    async with create_github_api_client(settings) as github_api_client:
+        return await score_repo_with_client(repo_url, github_api_client)
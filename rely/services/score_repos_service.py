@@ -0,0 +1,382 @@
+import asyncio
+import itertools
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Sequence,
+    Type,
+)
+
+import aiohttp
+from pydantic import BaseModel, HttpUrl
+
+from rely.clients.github_api_client import (
+    GitHubAPIClient,
+    GitHubAPIError,
+    InvalidRepository,
+)
+from rely.clients.github_graphql_client import GitHubGraphQLClient
+from rely.clients.package_resolver import PackageResolutionError, PackageResolver
+from rely.clients.models.scoring_repository import ScoringRepository
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.metrics.metric_reducer import get_scoring_plan
+from rely.core.models.dependency import Dependency
+from rely.core.models.repo_identifier import RepoIdentifier
+from rely.core.models.repo_context import LazyRepoContext, create_repo_contexts
+from rely.services.score_repo_service import (
+    RepoResult,
+    get_metric_classes,
+    score_repo_context,
+    score_repo_with_client,
+)
+
+
+class RepoOutcome(BaseModel):
+    """Model to store the outcome (result or error) of scoring a single repo in a batch."""
+
+    repo_url: str
+    result: RepoResult | None = None
+    error: str | None = None
+
+
+class DependencyOutcome(BaseModel):
+    """Model to store the outcome (result or error) of scoring a dependency's GitHub repo."""
+
+    dependency: Dependency
+    # None if the dependency couldn't be resolved to a GitHub repo
+    repo_url: str | None = None
+    result: RepoResult | None = None
+    error: str | None = None
+
+
+async def score_repo_outcome(
+    repo_url: str,
+    github_api_client: GitHubAPIClient,
+    metric_classes: Collection[Type[BaseMetric]] | None,
+) -> RepoOutcome:
+    """
+    Score a single repo and capture any error in the outcome.
+    NOTE: A single bad repo should never fail the whole batch.
+    """
+
+    try:
+        repo_result = await score_repo_with_client(
+            repo_url, github_api_client, metric_classes
+        )
+    except (GitHubAPIError, aiohttp.ClientError, ValueError) as error:
+        return RepoOutcome(repo_url=repo_url, error=str(error))
+
+    return RepoOutcome(repo_url=repo_url, result=repo_result)
+
+
+async def _score_repo_outcomes_with_graphql(
+    repo_urls: Sequence[str],
+    github_graphql_client: GitHubGraphQLClient,
+    metric_classes: Collection[Type[BaseMetric]] | None,
+) -> list[RepoOutcome]:
+    """Score a batch of repos that are fetched with bulk GraphQL queries, and capture any errors in the outcomes."""
+
+    outcomes: list[RepoOutcome] = []
+    repo_identifiers: list[RepoIdentifier] = []
+    valid_repo_urls: list[str] = []
+
+    for repo_url in repo_urls:
+        try:
+            repo_identifiers.append(RepoIdentifier(url=HttpUrl(repo_url)))
+            valid_repo_urls.append(repo_url)
+        except ValueError as error:
+            outcomes.append(RepoOutcome(repo_url=repo_url, error=str(error)))
+
+    try:
+        repo_contexts = await create_repo_contexts(
+            repo_identifiers, github_graphql_client
+        )
+    except (GitHubAPIError, aiohttp.ClientError, ValueError) as error:
+        return outcomes + [
+            RepoOutcome(repo_url=repo_url, error=str(error))
+            for repo_url in valid_repo_urls
+        ]
+
+    for repo_url, repo_context in zip(valid_repo_urls, repo_contexts):
+        if isinstance(repo_context, GitHubAPIError):
+            outcomes.append(RepoOutcome(repo_url=repo_url, error=str(repo_context)))
+        else:
+            outcomes.append(
+                RepoOutcome(
+                    repo_url=repo_url,
+                    result=score_repo_context(repo_context, metric_classes),
+                )
+            )
+
+    return outcomes
+
+
+async def _run_workers[T, O](
+    work_items: Iterable[T] | AsyncIterable[T],
+    handle_work_item: Callable[[T], Awaitable[list[O]]],
+    max_concurrency: int,
+) -> AsyncIterator[O]:
+    """
+    Handle work items with a pool of workers, yielding outcomes as soon as they are available.
+    NOTE: At most max_concurrency work items are in flight at any time.  Work items are
+          pulled lazily, so they can be a stream.  Streams that block while waiting for their
+          producer (like stdin) must be async iterables, so that in-flight work keeps running.
+    """
+
+    # None is used as a sentinel to signal that a worker has finished
+    outcome_queue: asyncio.Queue[O | None] = asyncio.Queue()
+
+    if isinstance(work_items, AsyncIterable):
+        async_work_item_iterator = aiter(work_items)
+        # NOTE: Async iterators (like async generators) can't be advanced concurrently
+        lock = asyncio.Lock()
+
+        async def _next_work_items() -> AsyncIterator[T]:
+            while True:
+                async with lock:
+                    try:
+                        work_item = await anext(async_work_item_iterator)
+                    except StopAsyncIteration:
+                        return
+
+                yield work_item
+
+    else:
+        work_item_iterator = iter(work_items)
+
+        async def _next_work_items() -> AsyncIterator[T]:
+            # NOTE: Sharing a plain iterator between workers is safe because next() never awaits
+            for work_item in work_item_iterator:
+                yield work_item
+
+    async def _worker() -> None:
+        try:
+            async for work_item in _next_work_items():
+                for outcome in await handle_work_item(work_item):
+                    outcome_queue.put_nowait(outcome)
+        finally:
+            outcome_queue.put_nowait(None)
+
+    workers = [asyncio.create_task(_worker()) for _ in range(max_concurrency)]
+
+    try:
+        running_workers = len(workers)
+
+        while running_workers > 0:
+            outcome = await outcome_queue.get()
+
+            if outcome is None:
+                running_workers -= 1
+            else:
+                yield outcome
+
+        # Surface unexpected errors (expected errors are captured in outcomes)
+        await asyncio.gather(*workers)
+    finally:
+        # Cancel pending work if the consumer stops early (or is cancelled itself)
+        for worker in workers:
+            worker.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def score_repos(
+    repo_urls: Iterable[str] | AsyncIterable[str],
+    github_api_client: GitHubAPIClient,
+    max_concurrency: int,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> AsyncIterator[RepoOutcome]:
+    """
+    Score many repos concurrently over a shared GitHubAPIClient.
+    Outcomes are yielded in completion order (not input order), as soon as each repo finishes.
+    """
+
+    async def _handle_repo_url(repo_url: str) -> list[RepoOutcome]:
+        return [await score_repo_outcome(repo_url, github_api_client, metric_classes)]
+
+    async for outcome in _run_workers(repo_urls, _handle_repo_url, max_concurrency):
+        yield outcome
+
+
+async def score_repos_with_graphql(
+    repo_urls: Iterable[str] | AsyncIterable[str],
+    github_graphql_client: GitHubGraphQLClient,
+    max_concurrency: int,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> AsyncIterator[RepoOutcome]:
+    """
+    Score many repos, packing many of them into each (bulk) GraphQL query.
+    Outcomes are yielded in completion order (not input order), as soon as each batch finishes.
+    NOTE: At most max_concurrency queries are in flight at any time.
+    """
+
+    async def _handle_repo_url_batch(
+        repo_url_batch: Sequence[str],
+    ) -> list[RepoOutcome]:
+        return await _score_repo_outcomes_with_graphql(
+            repo_url_batch, github_graphql_client, metric_classes
+        )
+
+    repo_url_batches = (
+        _batched_async(repo_urls, github_graphql_client.max_repos_per_query)
+        if isinstance(repo_urls, AsyncIterable)
+        else itertools.batched(repo_urls, github_graphql_client.max_repos_per_query)
+    )
+
+    async for outcome in _run_workers(
+        repo_url_batches, _handle_repo_url_batch, max_concurrency
+    ):
+        yield outcome
+
+
+async def _batched_async[T](
+    items: AsyncIterable[T], batch_size: int
+) -> AsyncIterator[tuple[T, ...]]:
+    """Batch items into tuples of batch_size items (the last one may be shorter), like itertools.batched."""
+
+    batch: list[T] = []
+
+    async for item in items:
+        batch.append(item)
+
+        if len(batch) == batch_size:
+            yield tuple(batch)
+            batch = []
+
+    if batch:
+        yield tuple(batch)
+
+
+async def scan_org(
+    org: str,
+    github_api_client: GitHubAPIClient,
+    max_concurrency: int,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+    *,
+    is_user: bool = False,
+) -> AsyncIterator[RepoOutcome]:
+    """
+    Score every repo of an organization (or a user), building contexts from the repository listing.
+    Outcomes are yielded in completion order, as soon as each repo finishes.
+    NOTE: Listing costs one request per 100 repos (instead of one per repo).  Only data that the
+          listing doesn't include (the contents listing) is fetched per repo, if the metrics read it.
+          Repos that fail validation get an error outcome.  Raises a GitHubAPIError if the repos
+          can't be listed.
+    """
+
+    if metric_classes is None:
+        metric_classes = get_metric_classes()
+
+    data_sources = get_scoring_plan(metric_classes).data_sources
+    full_repositories = await github_api_client.list_owner_repos(
+        org, is_user=is_user, max_concurrency=max_concurrency
+    )
+
+    async def _handle_full_repository(
+        full_repository: ScoringRepository | InvalidRepository,
+    ) -> list[RepoOutcome]:
+        repo_url = f"https://github.com/{full_repository.full_name}"
+
+        if isinstance(full_repository, InvalidRepository):
+            return [RepoOutcome(repo_url=repo_url, error=full_repository.error)]
+
+        try:
+            lazy_repo_context = LazyRepoContext(
+                RepoIdentifier(url=HttpUrl(repo_url)),
+                github_api_client,
+                full_repository=full_repository,
+            )
+            repo_context = await lazy_repo_context.load(data_sources)
+        except (GitHubAPIError, aiohttp.ClientError, ValueError) as error:
+            return [RepoOutcome(repo_url=repo_url, error=str(error))]
+
+        return [
+            RepoOutcome(
+                repo_url=repo_url,
+                result=score_repo_context(repo_context, metric_classes),
+            )
+        ]
+
+    async for outcome in _run_workers(
+        full_repositories, _handle_full_repository, max_concurrency
+    ):
+        yield outcome
+
+
+async def scan_dependencies(
+    dependencies: Iterable[Dependency],
+    package_resolver: PackageResolver,
+    github_api_client: GitHubAPIClient,
+    max_concurrency: int,
+    metric_classes: Collection[Type[BaseMetric]] | None = None,
+) -> AsyncIterator[DependencyOutcome]:
+    """
+    Resolve dependencies to their GitHub repos, and score every unique repo once.
+    Outcomes are yielded in completion order, as soon as each dependency is scored.
+    NOTE: Resolution and scoring run as a pipeline (each worker scores a repo as soon as it is
+          resolved, while the other workers keep resolving).  Dependencies that resolve to the
+          same repo share a single scoring.
+    """
+
+    # Scorings per (case-insensitive) repo URL, shared by every dependency that resolves to it
+    repo_outcome_tasks: dict[str, asyncio.Future[RepoOutcome]] = {}
+
+    async def _handle_dependency(dependency: Dependency) -> list[DependencyOutcome]:
+        try:
+            package_resolution = await package_resolver.resolve(dependency)
+        except PackageResolutionError as error:
+            return [DependencyOutcome(dependency=dependency, error=str(error))]
+
+        repo_url = package_resolution.repo_url
+
+        if repo_url is None:
+            return [
+                DependencyOutcome(
+                    dependency=dependency, error="Could not find a GitHub repo"
+                )
+            ]
+
+        repo_outcome_task = repo_outcome_tasks.get(repo_url.lower())
+
+        if repo_outcome_task is None:
+            repo_outcome_task = asyncio.ensure_future(
+                score_repo_outcome(repo_url, github_api_client, metric_classes)
+            )
+            repo_outcome_tasks[repo_url.lower()] = repo_outcome_task
+
+        repo_outcome = await repo_outcome_task
+
+        return [
+            DependencyOutcome(
+                dependency=dependency,
+                repo_url=repo_url,
+                result=repo_outcome.result,
+                error=repo_outcome.error,
+            )
+        ]
+
+    try:
+        async for outcome in _run_workers(
+            _iterate_unique(dependencies), _handle_dependency, max_concurrency
+        ):
+            yield outcome
+    finally:
+        for repo_outcome_task in repo_outcome_tasks.values():
+            repo_outcome_task.cancel()
+
+
+def _iterate_unique[T](items: Iterable[T]) -> Iterator[T]:
+    """Yield items lazily, skipping the ones that were already yielded."""
+
+    seen_items: set[T] = set()
+
+    for item in items:
+        if item not in seen_items:
+            seen_items.add(item)
+
+            yield item
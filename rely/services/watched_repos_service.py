@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Collection, Iterable, NamedTuple, Type
+
+import aiohttp
+from pydantic import BaseModel, HttpUrl
+
+from rely.clients.github_api_client import GitHubAPIClient, GitHubAPIError
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.models.repo_context import ALL_DATA_SOURCES, LazyRepoContext, RepoContext
+from rely.core.models.repo_identifier import RepoIdentifier
+from rely.services.repo_result_cache import CachedRepoResult, Freshness
+from rely.services.score_repo_service import (
+    RepoResult,
+    get_metric_classes,
+    score_repo_context,
+)
+
+
+_logger = logging.getLogger(__name__)
+
+
+class WatchedReposStats(BaseModel):
+    """Model for storing watched repo counters."""
+
+    repo_count: int
+    # Watched repos that have been scored at least once (and can be looked up)
+    loaded_count: int
+    refresh_count: int
+    error_count: int
+
+
+class _WatchedEntry(NamedTuple):
+    repo_context: RepoContext
+    # Result for all metrics (other metric selections are scored from the repo context)
+    repo_result: RepoResult
+    scored_at: float
+
+
+class WatchedRepos:
+    """
+    Fixed set of repos whose results are kept up to date in the background.
+    Lookups are dictionary reads (plus scoring, for a selection of metrics), so they never
+    touch GitHub.
+    """
+
+    def __init__(
+        self,
+        repo_urls: Iterable[str],
+        *,
+        refresh_interval: float,
+        max_concurrency: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """
+        Initialize watched repos.
+        NOTE: Every pass over the repos (except the first one, which loads them as fast as the
+              rate limiter allows) is spread evenly across refresh_interval seconds, so that
+              refreshes use the rate limit budget at a steady pace.
+              Raises a ValueError for invalid repo URLs.
+        """
+
+        repo_identifiers = [
+            RepoIdentifier(url=HttpUrl(repo_url)) for repo_url in repo_urls
+        ]
+        self._repo_identifiers = list(
+            {
+                _get_repo_key(repo_identifier): repo_identifier
+                for repo_identifier in repo_identifiers
+            }.values()
+        )
+        self._refresh_interval = refresh_interval
+        self._max_concurrency = max_concurrency
+        self._clock = clock
+        self._sleep = sleep
+        self._metric_classes = get_metric_classes()
+        self._entries: dict[str, _WatchedEntry] = {}
+        self._refresh_count = 0
+        self._error_count = 0
+
+    def __len__(self) -> int:
+        return len(self._repo_identifiers)
+
+    @property
+    def stats(self) -> WatchedReposStats:
+        """Get watched repo counters."""
+
+        return WatchedReposStats(
+            repo_count=len(self._repo_identifiers),
+            loaded_count=len(self._entries),
+            refresh_count=self._refresh_count,
+            error_count=self._error_count,
+        )
+
+    @property
+    def cache_control(self) -> str:
+        """Get the Cache-Control header value for watched results (fresh until their next refresh)."""
+
+        return f"max-age={int(self._refresh_interval)}"
+
+    def get(
+        self,
+        repo_identifier: RepoIdentifier,
+        metric_classes: Collection[Type[BaseMetric]] | None = None,
+    ) -> CachedRepoResult | None:
+        """
+        Get the result of a watched repo (None if the repo isn't watched, or hasn't been scored yet).
+        NOTE: Results are stale if they are older than the refresh interval (like when refreshes fail).
+        """
+
+        entry = self._entries.get(_get_repo_key(repo_identifier))
+
+        if entry is None:
+            return None
+
+        if metric_classes is None or set(metric_classes) == set(self._metric_classes):
+            repo_result = entry.repo_result
+        else:
+            repo_result = score_repo_context(entry.repo_context, metric_classes)
+
+        age = self._clock() - entry.scored_at
+        freshness = Freshness.FRESH if age < self._refresh_interval else Freshness.STALE
+
+        return CachedRepoResult(repo_result, freshness, age)
+
+    async def run(self, github_api_client: GitHubAPIClient) -> None:
+        """Refresh the watched repos forever (until cancelled)."""
+
+        if not self._repo_identifiers:
+            return
+
+        await self.refresh_all(github_api_client, refresh_interval=0.0)
+
+        while True:
+            await self.refresh_all(
+                github_api_client, refresh_interval=self._refresh_interval
+            )
+
+    async def refresh_all(
+        self, github_api_client: GitHubAPIClient, *, refresh_interval: float
+    ) -> None:
+        """
+        Refresh every watched repo once, starting refreshes evenly across refresh_interval seconds.
+        NOTE: At most max_concurrency refreshes run at once, so a slow pass falls behind
+              its schedule instead of piling up requests.
+        """
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        delay = refresh_interval / len(self._repo_identifiers)
+
+        async def _refresh(repo_identifier: RepoIdentifier) -> None:
+            try:
+                await self.refresh(repo_identifier, github_api_client)
+            finally:
+                semaphore.release()
+
+        async with asyncio.TaskGroup() as task_group:
+            for repo_identifier in self._repo_identifiers:
+                started_at = self._clock()
+                await semaphore.acquire()
+                task_group.create_task(_refresh(repo_identifier))
+                await self._sleep(max(0.0, delay - (self._clock() - started_at)))
+
+    async def refresh(
+        self, repo_identifier: RepoIdentifier, github_api_client: GitHubAPIClient
+    ) -> None:
+        """
+        Load (every data source of) a watched repo, and score it.
+        NOTE: If the refresh fails, the previous result is kept (and retried on the next pass).
+              Unexpected errors are logged (with their traceback), but never stop the refresher.
+        """
+
+        try:
+            repo_context = await LazyRepoContext(
+                repo_identifier, github_api_client
+            ).load(ALL_DATA_SOURCES)
+            repo_result = score_repo_context(repo_context, self._metric_classes)
+        except (GitHubAPIError, aiohttp.ClientError, ValueError) as error:
+            self._error_count += 1
+            _logger.warning("Failed to refresh %s: %s", repo_identifier.url, error)
+
+            return
+        except Exception:
+            self._error_count += 1
+            _logger.exception("Failed to refresh %s", repo_identifier.url)
+
+            return
+
+        self._entries[_get_repo_key(repo_identifier)] = _WatchedEntry(
+            repo_context=repo_context,
+            repo_result=repo_result,
+            scored_at=self._clock(),
+        )
+        self._refresh_count += 1
+
+
+def read_watched_repo_urls(path: Path) -> list[str]:
+    """Read repo URLs (one per line, ignoring blank lines and "#" comments)."""
+
+    repo_urls = []
+
+    for line in path.read_text().splitlines():
+        repo_url = line.split("#", 1)[0].strip()
+
+        if repo_url:
+            repo_urls.append(repo_url)
+
+    return repo_urls
+
+
+def _get_repo_key(repo_identifier: RepoIdentifier) -> str:
+    """Get the key of a watched repo (OWNER/REPO, ignoring case)."""
+
+    return f"{repo_identifier.repo_owner}/{repo_identifier.repo_name}".lower()
@@ -0,0 +1,5 @@
+#!/bin/sh
+
+for benchmark in benchmarks/bench_*.py; do
+    uv run python -m "benchmarks.$(basename "$benchmark" .py)"
+done
@@ -0,0 +1,447 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Collection, Iterator, Type
+
+import pytest
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+from starlette.types import Message, Scope
+
+from rely.api import app
+from rely.clients.github_api_client import (
+    GitHubAPIClient,
+    GitHubAPIError,
+    GitHubUnavailableError,
+)
+from rely.config.settings import Settings
+from rely.core.metrics.base_metric import BaseMetric
+from rely.services.score_repo_service import RepoResult
+
+
+@pytest.fixture
+def test_client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """Fixture to create a FastAPI test client (runs the application lifespan)."""
+
+    monkeypatch.setenv("GITHUB_PERSONAL_ACCESS_TOKEN", "test")
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def repo_result() -> RepoResult:
+    """Fixture to create a RepoResult instance."""
+
+    return RepoResult(
+        overall_score_decimal=1.0,
+        overall_score_int=100,
+        maximum_metric_score=3,
+        metrics=[],
+    )
+
+
+def test_score_repos_endpoint(
+    mocker: MockerFixture, test_client: TestClient, repo_result: RepoResult
+) -> None:
+    """Ensure that the score repos endpoint drops duplicates and isolates errors."""
+
+    async def _score_repo_with_client(
+        repo_url: str,
+        github_api_client: GitHubAPIClient,
+        metric_classes: Collection[Type[BaseMetric]] | None,
+    ) -> RepoResult:
+        if repo_url.endswith("bad"):
+            raise GitHubAPIError("Received 404 response with message: Not Found")
+
+        return repo_result
+
+    m = mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_repo_with_client,
+    )
+
+    response = test_client.post(
+        "/score_repos",
+        json={
+            "repo_urls": [
+                "https://github.com/a/good",
+                "https://github.com/a/bad",
+                "https://github.com/a/good",
+            ]
+        },
+    )
+    results = response.json()["results"]
+
+    assert response.status_code == 200
+    assert m.call_count == 2
+    assert [result["repo_url"] for result in results] == [
+        "https://github.com/a/good",
+        "https://github.com/a/bad",
+    ]
+    assert results[0]["result"]["overall_score_int"] == 100
+    assert results[1]["result"] is None
+    assert "404" in results[1]["error"]
+
+
+def test_lifespan_shares_github_api_client(
+    mocker: MockerFixture, test_client: TestClient, repo_result: RepoResult
+) -> None:
+    """Ensure that every request reuses the application-lifetime GitHubAPIClient."""
+
+    m = mocker.patch(
+        "rely.services.repo_result_cache.score_repo_identifier",
+        return_value=repo_result,
+    )
+
+    test_client.get("/score_repo", params={"repo_url": "https://github.com/a/b"})
+    test_client.get("/score_repo", params={"repo_url": "https://github.com/a/c"})
+
+    first_client = m.call_args_list[0].args[1]
+    second_client = m.call_args_list[1].args[1]
+
+    assert first_client is second_client
+    assert first_client is app.state.github_api_client
+
+
+def test_coalescing_endpoint(
+    mocker: MockerFixture, test_client: TestClient, repo_result: RepoResult
+) -> None:
+    """Ensure that the coalescing endpoint reports the fetch and scoring counters."""
+
+    mocker.patch(
+        "rely.services.repo_result_cache.score_repo_identifier",
+        return_value=repo_result,
+    )
+
+    response = test_client.get(
+        "/score_repo", params={"repo_url": "https://github.com/a/b"}
+    )
+
+    assert response.status_code == 200
+
+    response = test_client.get("/coalescing")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "fetches": {"calls": 0, "coalesced": 0, "in_flight": 0},
+        "scorings": {"calls": 1, "coalesced": 0, "in_flight": 0},
+    }
+
+
+def test_score_repo_endpoint_reports_freshness(
+    mocker: MockerFixture, test_client: TestClient, repo_result: RepoResult
+) -> None:
+    """Ensure that the score repo endpoint reports freshness, and serves cached results."""
+
+    m = mocker.patch(
+        "rely.services.repo_result_cache.score_repo_identifier",
+        return_value=repo_result,
+    )
+    params = {"repo_url": "https://github.com/a/b"}
+
+    test_client.get("/score_repo", params=params)
+    response = test_client.get("/score_repo", params=params)
+
+    assert response.status_code == 200
+    assert m.call_count == 1
+    assert response.headers["Cache-Control"] == (
+        "max-age=300, stale-while-revalidate=3600, stale-if-error=86400"
+    )
+    assert response.headers["Age"] == "0"
+    assert response.json()["freshness"] == "fresh"
+    assert response.json()["age"] == 0
+    assert response.json()["overall_score_int"] == 100
+
+
+def test_score_repo_endpoint_serves_stale_results_if_github_is_unavailable(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, repo_result: RepoResult
+) -> None:
+    """Ensure that a stale result is served (and flagged) while GitHub is rate limiting."""
+
+    monkeypatch.setenv("GITHUB_PERSONAL_ACCESS_TOKEN", "test")
+    # Results are stale as soon as they are scored, and are never served while revalidating
+    monkeypatch.setenv("RESULT_MAX_AGE", "0")
+    monkeypatch.setenv("RESULT_STALE_WHILE_REVALIDATE", "0")
+    m = mocker.patch(
+        "rely.services.repo_result_cache.score_repo_identifier",
+        return_value=repo_result,
+    )
+    params = {"repo_url": "https://github.com/a/b"}
+
+    with TestClient(app) as test_client:
+        assert test_client.get("/score_repo", params=params).json()["freshness"] == (
+            "fresh"
+        )
+
+        m.side_effect = GitHubUnavailableError(
+            "Received 429 response with message: Too Many Requests"
+        )
+        response = test_client.get("/score_repo", params=params)
+
+        assert response.status_code == 200
+        assert response.json()["freshness"] == "stale_if_error"
+        assert response.json()["overall_score_int"] == 100
+
+        # Without a cached result, the error is reported
+        response = test_client.get(
+            "/score_repo", params={"repo_url": "https://github.com/a/c"}
+        )
+
+        assert response.status_code == 502
+        assert "429" in response.json()["detail"]
+
+        # Other errors (like a missing repo) are never hidden by a stale result
+        m.side_effect = GitHubAPIError("Received 404 response with message: Not Found")
+
+        assert test_client.get("/score_repo", params=params).status_code == 502
+
+
+def test_score_repo_endpoint_serves_watched_repos(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    repo_result: RepoResult,
+) -> None:
+    """Ensure that watched repos are refreshed in the background and served without scoring."""
+
+    watched_repos_file = tmp_path / "watched_repos.txt"
+    watched_repos_file.write_text("https://github.com/a/watched\n")
+    monkeypatch.setenv("GITHUB_PERSONAL_ACCESS_TOKEN", "test")
+    monkeypatch.setenv("WATCHED_REPOS_FILE", str(watched_repos_file))
+    monkeypatch.setenv("WATCHED_REPOS_REFRESH_INTERVAL", "600")
+    mocker.patch("rely.services.watched_repos_service.LazyRepoContext.load")
+    mocker.patch(
+        "rely.services.watched_repos_service.score_repo_context",
+        return_value=repo_result,
+    )
+    m = mocker.patch("rely.services.repo_result_cache.score_repo_identifier")
+
+    with TestClient(app) as test_client:
+        for _ in range(100):
+            if test_client.get("/watched").json()["loaded_count"] == 1:
+                break
+
+            time.sleep(0.01)
+
+        response = test_client.get(
+            "/score_repo", params={"repo_url": "https://github.com/A/Watched"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "max-age=600"
+    assert response.json()["freshness"] == "fresh"
+    assert response.json()["overall_score_int"] == 100
+    m.assert_not_called()
+
+
+def test_score_repo_endpoint_rejects_unknown_metrics(test_client: TestClient) -> None:
+    """Ensure that the score repo endpoint responds with an error for unknown metrics."""
+
+    response = test_client.get(
+        "/score_repo",
+        params={"repo_url": "https://github.com/a/b", "metrics": "unknown_metric"},
+    )
+
+    assert response.status_code == 422
+    assert "unknown_metric" in response.json()["detail"]
+
+
+def test_score_repo_endpoint_rejects_empty_metrics(test_client: TestClient) -> None:
+    """Ensure that the score repo endpoint responds with an error if no metric is selected."""
+
+    response = test_client.get(
+        "/score_repo", params={"repo_url": "https://github.com/a/b", "metrics": ","}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "At least one metric must be selected"
+
+
+def test_score_repos_endpoint_rejects_empty_metrics(test_client: TestClient) -> None:
+    """Ensure that the score repos endpoint responds with an error if no metric is selected."""
+
+    response = test_client.post(
+        "/score_repos",
+        json={"repo_urls": ["https://github.com/a/b"], "metrics": []},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "At least one metric must be selected"
+
+
+async def _score_good_or_bad_repo(
+    repo_url: str,
+    github_api_client: GitHubAPIClient,
+    metric_classes: Collection[Type[BaseMetric]] | None,
+) -> RepoResult:
+    if repo_url.endswith("bad"):
+        raise GitHubAPIError("Received 404 response with message: Not Found")
+
+    return RepoResult(
+        overall_score_decimal=1.0,
+        overall_score_int=100,
+        maximum_metric_score=3,
+        metrics=[],
+    )
+
+
+def test_score_repos_stream_endpoint_streams_ndjson(
+    mocker: MockerFixture, test_client: TestClient
+) -> None:
+    """Ensure that the streaming score repos endpoint sends one NDJSON record per unique repo, then a summary."""
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_good_or_bad_repo,
+    )
+
+    with test_client.stream(
+        "POST",
+        "/score_repos/stream",
+        json={
+            "repo_urls": [
+                "https://github.com/a/good",
+                "https://github.com/a/bad",
+                "https://github.com/a/good",
+            ]
+        },
+    ) as response:
+        records = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert sorted(record["repo_url"] for record in records[:-1]) == [
+        "https://github.com/a/bad",
+        "https://github.com/a/good",
+    ]
+    assert records[-1] == {"summary": {"repo_count": 2, "error_count": 1}}
+
+
+def test_score_repos_stream_endpoint_streams_server_sent_events(
+    mocker: MockerFixture, test_client: TestClient
+) -> None:
+    """Ensure that the streaming score repos endpoint sends Server-Sent Events if asked to."""
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_good_or_bad_repo,
+    )
+
+    response = test_client.post(
+        "/score_repos/stream",
+        json={"repo_urls": ["https://github.com/a/good"]},
+        headers={"Accept": "text/event-stream"},
+    )
+    events = response.text.strip().split("\n\n")
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert events[0].startswith("event: outcome\ndata: ")
+    assert (
+        json.loads(events[0].split("data: ")[1])["result"]["overall_score_int"] == 100
+    )
+    assert events[1] == 'event: summary\ndata: {"repo_count":1,"error_count":0}'
+
+
+@pytest.mark.asyncio
+async def test_score_repos_stream_endpoint_cancels_pending_fetches_on_disconnect(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure that pending fetches are cancelled once the client disconnects."""
+
+    monkeypatch.setenv("GITHUB_PERSONAL_ACCESS_TOKEN", "test")
+    monkeypatch.setattr(app.state, "settings", Settings(), raising=False)
+    monkeypatch.setattr(app.state, "github_api_client", mocker.Mock(), raising=False)
+
+    has_first_record = asyncio.Event()
+    cancelled_repo_urls: list[str] = []
+
+    async def _score_repo_with_client(
+        repo_url: str,
+        github_api_client: GitHubAPIClient,
+        metric_classes: Collection[Type[BaseMetric]] | None,
+    ) -> RepoResult:
+        if repo_url.endswith("fast"):
+            return await _score_good_or_bad_repo(
+                repo_url, github_api_client, metric_classes
+            )
+
+        try:
+            # Never finishes (like a fetch that is still pending)
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled_repo_urls.append(repo_url)
+
+            raise
+
+        raise AssertionError("unreachable")
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_repo_with_client,
+    )
+
+    repo_urls = ["https://github.com/a/fast"] + [
+        f"https://github.com/a/slow_{index}" for index in range(3)
+    ]
+    request_body = json.dumps({"repo_urls": repo_urls}).encode()
+    messages: list[Message] = []
+    is_request_sent = False
+
+    async def _receive() -> Message:
+        nonlocal is_request_sent
+
+        if not is_request_sent:
+            is_request_sent = True
+
+            return {"type": "http.request", "body": request_body, "more_body": False}
+
+        await has_first_record.wait()
+
+        return {"type": "http.disconnect"}
+
+    async def _send(message: Message) -> None:
+        messages.append(message)
+
+        if message.get("body"):
+            has_first_record.set()
+
+    scope: Scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/score_repos/stream",
+        "raw_path": b"/score_repos/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+
+    await asyncio.wait_for(app(scope, _receive, _send), timeout=5)
+
+    body = b"".join(message.get("body", b"") for message in messages)
+
+    assert json.loads(body)["repo_url"] == "https://github.com/a/fast"
+    assert sorted(cancelled_repo_urls) == repo_urls[1:]
+
+
+def test_scan_org_endpoint_responds_with_error_if_repos_cannot_be_listed(
+    mocker: MockerFixture, test_client: TestClient
+) -> None:
+    """Ensure that the scan org endpoint responds with a 502 if the org's repos can't be listed."""
+
+    mocker.patch.object(
+        GitHubAPIClient,
+        "list_owner_repos",
+        side_effect=GitHubAPIError("Received 404 response with message: Not Found"),
+    )
+
+    response = test_client.get("/scan_org", params={"org": "unknown_org"})
+
+    assert response.status_code == 502
+    assert "404" in response.json()["detail"]
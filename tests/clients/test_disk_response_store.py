@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from rely.clients.disk_response_store import DiskResponseStore
+from rely.clients.response_store import StoredResponse
+
+
+def test_disk_response_store_round_trip(tmp_path: Path) -> None:
+    """Ensure that stored responses survive reopening the store."""
+
+    cache_path = tmp_path / "rely" / "responses.sqlite3"
+    stored_response = StoredResponse(
+        body=b'{"name":"rely","stargazers_count":1}',
+        etag='"abc"',
+        last_modified=None,
+        fetched_at=123.0,
+    )
+
+    disk_response_store = DiskResponseStore(cache_path)
+    disk_response_store.set("https://test.com", stored_response)
+    disk_response_store.close()
+
+    disk_response_store = DiskResponseStore(cache_path)
+
+    assert disk_response_store.get("https://test.com") == stored_response
+    assert disk_response_store.get("https://other.com") is None
+
+    disk_response_store.close()
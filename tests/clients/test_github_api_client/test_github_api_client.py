@@ -1,14 +1,24 @@
+import asyncio
 import json
 from unittest import mock
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any, Callable
 
+import aiohttp
 import pytest
 from pytest_mock import MockerFixture
 
 from rely.clients.http_client import HTTPClient
-from rely.clients.github_api_client import GitHubAPIClient
+from rely.clients.github_api_client import (
+    GitHubAPIClient,
+    GitHubAPIError,
+    GitHubUnavailableError,
+    InvalidRepository,
+)
+from rely.clients.rate_limiter import RateLimiter
+from rely.clients.token_pool import TokenPool
+from rely.clients.response_cache import ResponseCache
 from rely.core.models.repo_identifier import RepoIdentifier
 
 
@@ -36,7 +46,11 @@ def mock_get_with_response() -> Callable[[MockerFixture, Any], mock.AsyncMock]:
 
     def _mock_get(mocker: MockerFixture, mock_response_dict: Any) -> mock.AsyncMock:
         mock_return_value = mock.AsyncMock()
-        mock_return_value.__aenter__.return_value.json.return_value = mock_response_dict
+        mock_return_value.__aenter__.return_value.status = 200
+        mock_return_value.__aenter__.return_value.headers = {}
+        mock_return_value.__aenter__.return_value.read.return_value = json.dumps(
+            mock_response_dict
+        ).encode()
 
         return mocker.patch(
             "aiohttp.ClientSession.get",
@@ -104,3 +118,501 @@ async def test_github_api_client_get_repo_contents(
 
     m.assert_called_once_with(test_contents_url, headers=expected_headers)
     assert len(content_tree_list.content_tree_list) == 15
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_get_repo_uses_response_cache(
+    mocker: MockerFixture,
+    mock_get_with_response: Callable[[MockerFixture, Any], mock.AsyncMock],
+    repo_identifier: RepoIdentifier,
+    get_repo_response: Any,
+) -> None:
+    """Ensure that repeat GitHubAPIClient.get_repo calls are served from the response cache."""
+
+    m = mock_get_with_response(mocker, get_repo_response)
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(
+            http_client, "test", response_cache=ResponseCache(max_size=8)
+        )
+        first_full_repository = await github_api_client.get_repo(repo_identifier)
+        second_full_repository = await github_api_client.get_repo(repo_identifier)
+
+    m.assert_called_once()
+    assert first_full_repository is second_full_repository
+    assert github_api_client.cache_stats is not None
+    assert github_api_client.cache_stats.hits == 1
+    assert github_api_client.cache_stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_response_cache_ignores_case(
+    mocker: MockerFixture,
+    mock_get_with_response: Callable[[MockerFixture, Any], mock.AsyncMock],
+    get_repo_response: Any,
+) -> None:
+    """Ensure that sequential GitHubAPIClient.get_repo calls differing only in case share a cache entry."""
+
+    m = mock_get_with_response(mocker, get_repo_response)
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(
+            http_client, "test", response_cache=ResponseCache(max_size=8)
+        )
+
+        for path in ["1cph93/rely", "1CPH93/Rely"]:
+            await github_api_client.get_repo(
+                RepoIdentifier.model_validate({"url": f"https://github.com/{path}"})
+            )
+
+    m.assert_called_once()
+    assert github_api_client.cache_stats is not None
+    assert github_api_client.cache_stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_coalesces_concurrent_requests(
+    mocker: MockerFixture,
+    mock_get_with_response: Callable[[MockerFixture, Any], mock.AsyncMock],
+    get_repo_response: Any,
+) -> None:
+    """Ensure that concurrent GitHubAPIClient.get_repo calls for the same repo share a request."""
+
+    m = mock_get_with_response(mocker, get_repo_response)
+    repo_identifiers = [
+        RepoIdentifier.model_validate({"url": f"https://github.com/{path}"})
+        for path in ["1cph93/rely", "1CPH93/Rely", "1cph93/rely"]
+    ]
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test")
+        full_repositories = await asyncio.gather(
+            *(
+                github_api_client.get_repo(repo_identifier)
+                for repo_identifier in repo_identifiers
+            )
+        )
+
+    m.assert_called_once()
+    assert all(
+        full_repository is full_repositories[0] for full_repository in full_repositories
+    )
+    assert github_api_client.coalescing_stats.calls == 1
+    assert github_api_client.coalescing_stats.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_cancels_fetch_without_callers(
+    mocker: MockerFixture,
+    repo_identifier: RepoIdentifier,
+) -> None:
+    """Ensure that a fetch is cancelled once every caller waiting for it is cancelled."""
+
+    is_started = asyncio.Event()
+    is_cancelled = False
+
+    async def _read() -> bytes:
+        nonlocal is_cancelled
+        is_started.set()
+
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            is_cancelled = True
+            raise
+
+        return b"{}"
+
+    mock_response = mock.AsyncMock()
+    mock_response.__aenter__.return_value.status = 200
+    mock_response.__aenter__.return_value.headers = {}
+    mock_response.__aenter__.return_value.read.side_effect = _read
+    mocker.patch("aiohttp.ClientSession.get", return_value=mock_response)
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test")
+        caller = asyncio.create_task(github_api_client.get_repo(repo_identifier))
+        await is_started.wait()
+        caller.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        await asyncio.sleep(0)
+
+    assert is_cancelled
+    assert github_api_client.coalescing_stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_raises_coalesced_errors_to_every_caller(
+    mocker: MockerFixture,
+    repo_identifier: RepoIdentifier,
+) -> None:
+    """Ensure that a failed request is raised to every caller that shares it."""
+
+    not_found_error = aiohttp.ClientResponseError(
+        request_info=mock.Mock(),
+        history=(),
+        status=404,
+        message="Not Found",
+    )
+    m = mocker.patch("aiohttp.ClientSession.get", side_effect=not_found_error)
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test")
+        results = await asyncio.gather(
+            *(github_api_client.get_repo(repo_identifier) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    m.assert_called_once()
+    assert all(isinstance(result, GitHubAPIError) for result in results)
+    assert github_api_client.coalescing_stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_retries_rate_limited_requests(
+    mocker: MockerFixture,
+    repo_identifier: RepoIdentifier,
+    get_repo_response: Any,
+) -> None:
+    """Ensure that GitHubAPIClient retries rate limited GET requests and tracks the budget."""
+
+    rate_limited_error = aiohttp.ClientResponseError(
+        request_info=mock.Mock(),
+        history=(),
+        status=429,
+        message="Too Many Requests",
+        headers={"Retry-After": "0"},  # type: ignore[arg-type]
+    )
+    mock_response = mock.AsyncMock()
+    mock_response.__aenter__.return_value.status = 200
+    mock_response.__aenter__.return_value.headers = {
+        "X-RateLimit-Remaining": "4999",
+        "X-RateLimit-Reset": "1700000000",
+    }
+    mock_response.__aenter__.return_value.read.return_value = json.dumps(
+        get_repo_response
+    ).encode()
+    m = mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[rate_limited_error, mock_response],
+    )
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(
+            http_client,
+            token_pool=TokenPool(
+                ["test"], create_rate_limiter=lambda: RateLimiter(retry_backoff=0)
+            ),
+        )
+        full_repository = await github_api_client.get_repo(repo_identifier)
+
+    assert m.call_count == 2
+    assert full_repository.name == "rely"
+    assert github_api_client.rate_limit_state.remaining == 4999
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_raises_unavailable_error_after_retries(
+    mocker: MockerFixture,
+    repo_identifier: RepoIdentifier,
+) -> None:
+    """Ensure that a request that keeps failing with a retryable status raises a GitHubUnavailableError."""
+
+    unavailable_error = aiohttp.ClientResponseError(
+        request_info=mock.Mock(),
+        history=(),
+        status=503,
+        message="Service Unavailable",
+    )
+    m = mocker.patch("aiohttp.ClientSession.get", side_effect=unavailable_error)
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test", max_retries=0)
+
+        with pytest.raises(GitHubUnavailableError):
+            await github_api_client.get_repo(repo_identifier)
+
+    m.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "network_error",
+    [TimeoutError(), aiohttp.ServerDisconnectedError()],
+)
+async def test_github_api_client_retries_network_errors(
+    mocker: MockerFixture,
+    repo_identifier: RepoIdentifier,
+    get_repo_response: Any,
+    network_error: Exception,
+) -> None:
+    """Ensure that GitHubAPIClient retries GET requests that time out (or can't connect)."""
+
+    mock_response = mock.AsyncMock()
+    mock_response.__aenter__.return_value.status = 200
+    mock_response.__aenter__.return_value.headers = {}
+    mock_response.__aenter__.return_value.read.return_value = json.dumps(
+        get_repo_response
+    ).encode()
+    m = mocker.patch(
+        "aiohttp.ClientSession.get", side_effect=[network_error, mock_response]
+    )
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(
+            http_client,
+            token_pool=TokenPool(
+                ["test"], create_rate_limiter=lambda: RateLimiter(retry_backoff=0)
+            ),
+        )
+        full_repository = await github_api_client.get_repo(repo_identifier)
+
+    assert m.call_count == 2
+    assert full_repository.name == "rely"
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_raises_unavailable_error_after_network_errors(
+    mocker: MockerFixture,
+    repo_identifier: RepoIdentifier,
+) -> None:
+    """Ensure that a request that keeps timing out raises a GitHubUnavailableError."""
+
+    m = mocker.patch("aiohttp.ClientSession.get", side_effect=TimeoutError())
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(
+            http_client,
+            token_pool=TokenPool(
+                ["test"], create_rate_limiter=lambda: RateLimiter(retry_backoff=0)
+            ),
+            max_retries=1,
+        )
+
+        with pytest.raises(GitHubUnavailableError, match="TimeoutError"):
+            await github_api_client.get_repo(repo_identifier)
+
+    assert m.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_retries_with_another_token(
+    mocker: MockerFixture,
+    repo_identifier: RepoIdentifier,
+    get_repo_response: Any,
+) -> None:
+    """Ensure that a request that exhausts one token is retried with another token."""
+
+    rate_limited_error = aiohttp.ClientResponseError(
+        request_info=mock.Mock(),
+        history=(),
+        status=403,
+        message="API rate limit exceeded",
+        headers={  # type: ignore[arg-type]
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "9999999999",
+        },
+    )
+    mock_response = mock.AsyncMock()
+    mock_response.__aenter__.return_value.status = 200
+    mock_response.__aenter__.return_value.headers = {}
+    mock_response.__aenter__.return_value.read.return_value = json.dumps(
+        get_repo_response
+    ).encode()
+    m = mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[rate_limited_error, mock_response],
+    )
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(
+            http_client,
+            token_pool=TokenPool(
+                ["first", "second"],
+                create_rate_limiter=lambda: RateLimiter(retry_backoff=0),
+            ),
+        )
+        await github_api_client.get_repo(repo_identifier)
+
+    authorizations = [
+        call.kwargs["headers"]["Authorization"] for call in m.call_args_list
+    ]
+
+    assert authorizations == ["Bearer first", "Bearer second"]
+    assert [usage.requests for usage in github_api_client.token_usage] == [1, 1]
+    assert github_api_client.token_usage[0].rate_limit.remaining == 0
+
+
+def _mock_list_repos_pages(
+    mocker: MockerFixture,
+    get_repo_response: Any,
+    repo_count: int,
+    *,
+    has_link_header: bool,
+) -> mock.MagicMock:
+    """Mock aiohttp.ClientSession.get with pages of a repository listing (100 repos per page)."""
+
+    last_page = max(1, -(-repo_count // GitHubAPIClient.REPOS_PER_PAGE))
+
+    def _get(url: str, headers: Any) -> mock.AsyncMock:
+        page = int(url.rsplit("page=", 1)[1])
+        first_index = (page - 1) * GitHubAPIClient.REPOS_PER_PAGE
+        last_index = min(repo_count, first_index + GitHubAPIClient.REPOS_PER_PAGE)
+        mock_response = mock.AsyncMock()
+        mock_response.__aenter__.return_value.status = 200
+        mock_response.__aenter__.return_value.headers = (
+            {
+                "Link": f'<https://api.github.com/organizations/1/repos?per_page=100&page={page + 1}>; rel="next", '
+                f'<https://api.github.com/organizations/1/repos?per_page=100&page={last_page}>; rel="last"'
+            }
+            if has_link_header and last_page > 1
+            else {}
+        )
+        mock_response.__aenter__.return_value.read.return_value = json.dumps(
+            [
+                {**get_repo_response, "full_name": f"test_org/repo_{index}"}
+                for index in range(first_index, last_index)
+            ]
+        ).encode()
+
+        return mock_response
+
+    return mocker.patch("aiohttp.ClientSession.get", side_effect=_get)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "repo_count, has_link_header, expected_page_count",
+    [
+        (250, True, 3),
+        (250, False, 3),
+        # Without a Link header, a full last page is only known to be the last one after an empty page
+        (200, False, 3),
+        (0, True, 1),
+    ],
+)
+async def test_github_api_client_list_owner_repos(
+    mocker: MockerFixture,
+    get_repo_response: Any,
+    repo_count: int,
+    has_link_header: bool,
+    expected_page_count: int,
+) -> None:
+    """Ensure that GitHubAPIClient.list_owner_repos fetches every page (and keeps their order)."""
+
+    m = _mock_list_repos_pages(
+        mocker, get_repo_response, repo_count, has_link_header=has_link_header
+    )
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test")
+        full_repositories = await github_api_client.list_owner_repos("test_org")
+
+    assert [call.args[0] for call in m.call_args_list] == [
+        f"{GitHubAPIClient.API_BASE_URL}/orgs/test_org/repos?per_page=100&page={page}"
+        for page in range(1, expected_page_count + 1)
+    ]
+    assert [full_repository.full_name for full_repository in full_repositories] == [
+        f"test_org/repo_{index}" for index in range(repo_count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_list_owner_repos_fetches_pages_concurrently(
+    mocker: MockerFixture, get_repo_response: Any
+) -> None:
+    """Ensure that pages after the first one are fetched concurrently, once the Link header reports the page count."""
+
+    m = _mock_list_repos_pages(mocker, get_repo_response, 1_000, has_link_header=True)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _acquire() -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+
+    mocker.patch("rely.clients.token_pool.PooledToken.acquire", side_effect=_acquire)
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test")
+        full_repositories = await github_api_client.list_owner_repos(
+            "test_user", is_user=True, max_concurrency=4
+        )
+
+    assert len(full_repositories) == 1_000
+    assert (
+        m.call_args_list[0]
+        .args[0]
+        .startswith(f"{GitHubAPIClient.API_BASE_URL}/users/test_user/repos")
+    )
+    assert max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_list_owner_repos_isolates_invalid_repos(
+    mocker: MockerFixture,
+    mock_get_with_response: Callable[[MockerFixture, Any], mock.AsyncMock],
+    get_repo_response: Any,
+) -> None:
+    """Ensure that a repo that fails validation doesn't fail the whole listing."""
+
+    invalid_repo_response = {**get_repo_response, "full_name": "test_org/invalid"}
+    del invalid_repo_response["stargazers_count"]
+    mock_get_with_response(
+        mocker,
+        [
+            {**get_repo_response, "full_name": "test_org/empty", "pushed_at": None},
+            invalid_repo_response,
+        ],
+    )
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test")
+        full_repositories = await github_api_client.list_owner_repos("test_org")
+
+    empty_repository, invalid_repository = full_repositories
+
+    assert not isinstance(empty_repository, InvalidRepository)
+    assert empty_repository.pushed_at is None
+    assert isinstance(invalid_repository, InvalidRepository)
+    assert invalid_repository.full_name == "test_org/invalid"
+    assert "stargazers_count" in invalid_repository.error
+
+
+@pytest.mark.asyncio
+async def test_github_api_client_list_owner_repos_raises_on_invalid_listing(
+    mocker: MockerFixture,
+    mock_get_with_response: Callable[[MockerFixture, Any], mock.AsyncMock],
+) -> None:
+    """Ensure that a listing that can't be decoded raises a GitHubAPIError."""
+
+    mock_get_with_response(mocker, {"message": "Not a listing"})
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test")
+
+        with pytest.raises(GitHubAPIError):
+            await github_api_client.list_owner_repos("test_org")
+
+
+@pytest.mark.parametrize(
+    "personal_access_token, token_pool",
+    [(None, None), ("test", TokenPool(["test"]))],
+)
+def test_github_api_client_requires_one_credential(
+    personal_access_token: str | None, token_pool: TokenPool | None
+) -> None:
+    """Ensure that GitHubAPIClient requires either a personal access token or a token pool."""
+
+    with pytest.raises(ValueError):
+        GitHubAPIClient(
+            mock.AsyncMock(),
+            personal_access_token=personal_access_token,
+            token_pool=token_pool,
+        )
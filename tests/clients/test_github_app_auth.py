@@ -0,0 +1,224 @@
+import asyncio
+import datetime
+from typing import AsyncIterator
+
+import jwt
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import BaseTestServer, TestServer
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from rely.clients.http_client import HTTPClient
+from rely.clients.github_api_client import GitHubAPIError
+from rely.clients.github_app_auth import GitHubAppTokenProvider
+
+
+APP_ID = "12345"
+INSTALLATION_ID = 67890
+# Installation tokens issued by the stand-in server expire this many seconds after the clock
+TOKEN_LIFETIME = 3600.0
+
+
+class FakeTime:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def clock(self) -> float:
+        return self.now
+
+
+class TokenServer:
+    """Stand-in token endpoint that verifies App JWTs and issues numbered installation tokens."""
+
+    def __init__(self, public_key: rsa.RSAPublicKey, fake_time: FakeTime) -> None:
+        self.public_key = public_key
+        self.fake_time = fake_time
+        self.token_count = 0
+        # Cleared to hold responses (like a slow token endpoint)
+        self.is_open = asyncio.Event()
+        self.is_open.set()
+
+    async def handle_access_tokens(self, request: web.Request) -> web.Response:
+        if request.match_info["installation_id"] != str(INSTALLATION_ID):
+            return web.json_response({"message": "Not Found"}, status=404)
+
+        claims = jwt.decode(
+            request.headers["Authorization"].removeprefix("Bearer "),
+            self.public_key,
+            algorithms=["RS256"],
+            # NOTE: The fake clock is not the real clock
+            options={"verify_exp": False, "verify_iat": False},
+        )
+
+        assert claims["iss"] == APP_ID
+        assert claims["exp"] - claims["iat"] <= 600
+
+        await self.is_open.wait()
+
+        self.token_count += 1
+        expires_at = datetime.datetime.fromtimestamp(
+            self.fake_time.now + TOKEN_LIFETIME, tz=datetime.UTC
+        )
+
+        return web.json_response(
+            {
+                "token": f"ghs_{self.token_count}",
+                "expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            },
+            status=201,
+        )
+
+
+@pytest.fixture
+def private_key() -> rsa.RSAPrivateKey:
+    """Fixture to create an App private key."""
+
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def fake_time() -> FakeTime:
+    return FakeTime()
+
+
+@pytest_asyncio.fixture
+async def token_server(
+    private_key: rsa.RSAPrivateKey, fake_time: FakeTime
+) -> AsyncIterator[tuple[TokenServer, BaseTestServer]]:
+    """Fixture to run a local stand-in token endpoint."""
+
+    token_server = TokenServer(private_key.public_key(), fake_time)
+    app = web.Application()
+    app.router.add_post(
+        "/app/installations/{installation_id}/access_tokens",
+        token_server.handle_access_tokens,
+    )
+
+    async with TestServer(app) as test_server:
+        yield token_server, test_server
+
+
+def _create_provider(
+    http_client: HTTPClient,
+    private_key: rsa.RSAPrivateKey,
+    test_server: BaseTestServer,
+    fake_time: FakeTime,
+    installation_id: int = INSTALLATION_ID,
+) -> GitHubAppTokenProvider:
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+    return GitHubAppTokenProvider(
+        http_client,
+        APP_ID,
+        pem,
+        installation_id,
+        api_base_url=str(test_server.make_url("")).rstrip("/"),
+        refresh_margin=300.0,
+        clock=fake_time.clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_github_app_token_provider_caches_token(
+    private_key: rsa.RSAPrivateKey,
+    fake_time: FakeTime,
+    token_server: tuple[TokenServer, BaseTestServer],
+) -> None:
+    """Ensure that concurrent callers share a single exchange, and the token is cached."""
+
+    server, test_server = token_server
+
+    async with HTTPClient() as http_client:
+        provider = _create_provider(http_client, private_key, test_server, fake_time)
+        tokens = await asyncio.gather(*(provider.get_token() for _ in range(5)))
+        fake_time.now += TOKEN_LIFETIME / 2
+
+        assert await provider.get_token() == "ghs_1"
+
+    assert tokens == ["ghs_1"] * 5
+    assert server.token_count == 1
+
+
+@pytest.mark.asyncio
+async def test_github_app_token_provider_refreshes_in_background(
+    private_key: rsa.RSAPrivateKey,
+    fake_time: FakeTime,
+    token_server: tuple[TokenServer, BaseTestServer],
+) -> None:
+    """Ensure that a token that is about to expire is refreshed without blocking callers."""
+
+    server, test_server = token_server
+
+    async with HTTPClient() as http_client:
+        provider = _create_provider(http_client, private_key, test_server, fake_time)
+
+        assert await provider.get_token() == "ghs_1"
+
+        # Within the refresh margin, the cached token is returned while the refresh is held
+        server.is_open.clear()
+        fake_time.now += TOKEN_LIFETIME - 60
+
+        assert await provider.get_token() == "ghs_1"
+        assert await provider.get_token() == "ghs_1"
+
+        server.is_open.set()
+        tokens = []
+
+        for _ in range(100):
+            tokens.append(await provider.get_token())
+
+            if tokens[-1] == "ghs_2":
+                break
+
+            await asyncio.sleep(0.01)
+
+        assert tokens[-1] == "ghs_2"
+
+    assert server.token_count == 2
+
+
+@pytest.mark.asyncio
+async def test_github_app_token_provider_waits_for_expired_token(
+    private_key: rsa.RSAPrivateKey,
+    fake_time: FakeTime,
+    token_server: tuple[TokenServer, BaseTestServer],
+) -> None:
+    """Ensure that an expired token is never returned."""
+
+    server, test_server = token_server
+
+    async with HTTPClient() as http_client:
+        provider = _create_provider(http_client, private_key, test_server, fake_time)
+
+        assert await provider.get_token() == "ghs_1"
+
+        fake_time.now += TOKEN_LIFETIME
+
+        assert await provider.get_token() == "ghs_2"
+
+
+@pytest.mark.asyncio
+async def test_github_app_token_provider_raises_on_error(
+    private_key: rsa.RSAPrivateKey,
+    fake_time: FakeTime,
+    token_server: tuple[TokenServer, BaseTestServer],
+) -> None:
+    """Ensure that a failed exchange raises a GitHubAPIError."""
+
+    _, test_server = token_server
+
+    async with HTTPClient() as http_client:
+        provider = _create_provider(
+            http_client, private_key, test_server, fake_time, installation_id=1
+        )
+
+        with pytest.raises(GitHubAPIError):
+            await provider.get_token()
@@ -0,0 +1,185 @@
+import re
+from typing import Any, AsyncIterator
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import BaseTestServer, TestServer
+from pydantic import HttpUrl
+
+from rely.clients.http_client import HTTPClient
+from rely.clients.github_api_client import GitHubAPIError
+from rely.clients.github_graphql_client import GitHubGraphQLClient, GraphQLRepository
+from rely.core.models.repo_identifier import RepoIdentifier
+from rely.core.models.repo_context import RepoContext, create_repo_contexts
+from rely.services.score_repo_service import score_repo_context
+
+
+# The stand-in server rejects queries with more repositories than this
+MAX_REPOS_PER_QUERY = 2
+
+
+def _create_repository(name: str) -> Any:
+    """Create a GraphQL repository response."""
+
+    return {
+        "name": name,
+        "nameWithOwner": f"test_owner/{name}",
+        "description": "Test repository",
+        "stargazerCount": 600,
+        "forkCount": 30,
+        "isArchived": False,
+        "isDisabled": False,
+        "pushedAt": "2025-10-17T00:00:00Z",
+        "licenseInfo": {
+            "key": "mit",
+            "name": "MIT License",
+            "spdxId": "MIT",
+            "url": "https://api.github.com/licenses/mit",
+            "id": "MDc6TGljZW5zZTEz",
+        },
+        "issues": {"totalCount": 3},
+        "pullRequests": {"totalCount": 4},
+        "object": {
+            "entries": [
+                {
+                    "name": "README.md",
+                    "path": "README.md",
+                    "type": "blob",
+                    "mode": 33188,
+                    "oid": "abc",
+                    "object": {"byteSize": 100},
+                },
+                {
+                    "name": "rely",
+                    "path": "rely",
+                    "type": "tree",
+                    "mode": 16384,
+                    "oid": "def",
+                    "object": {},
+                },
+            ]
+        },
+    }
+
+
+async def _handle_graphql(request: web.Request) -> web.Response:
+    """Stand-in GraphQL endpoint that answers aliased repository queries."""
+
+    payload = await request.json()
+    aliases = re.findall(r"(repo\d+): repository", payload["query"])
+
+    if len(aliases) > MAX_REPOS_PER_QUERY:
+        return web.json_response(
+            {
+                "errors": [
+                    {"type": "RESOURCE_LIMITS_EXCEEDED", "message": "Too expensive"}
+                ]
+            }
+        )
+
+    data: dict[str, Any] = {}
+    errors = []
+
+    for alias in aliases:
+        index = alias.removeprefix("repo")
+        name = payload["variables"][f"name{index}"]
+
+        if name == "empty":
+            # Empty repos have never been pushed to, and have no default branch
+            data[alias] = {
+                **_create_repository(name),
+                "pushedAt": None,
+                "object": None,
+            }
+        elif name == "invalid":
+            data[alias] = {**_create_repository(name), "stargazerCount": None}
+        elif name == "missing":
+            data[alias] = None
+            errors.append(
+                {"type": "NOT_FOUND", "path": [alias], "message": "Not found"}
+            )
+        else:
+            data[alias] = _create_repository(name)
+
+    return web.json_response({"data": data, "errors": errors})
+
+
+@pytest_asyncio.fixture
+async def graphql_server() -> AsyncIterator[BaseTestServer]:
+    """Fixture to run a local stand-in GraphQL server."""
+
+    app = web.Application()
+    app.router.add_post("/graphql", _handle_graphql)
+
+    async with TestServer(app) as test_server:
+        yield test_server
+
+
+@pytest.mark.asyncio
+async def test_github_graphql_client_get_repos(graphql_server: BaseTestServer) -> None:
+    """Ensure that GitHubGraphQLClient.get_repos maps (and splits) bulk queries."""
+
+    repo_names = ["a", "b", "missing", "c", "d", "empty", "invalid"]
+    repo_identifiers = [
+        RepoIdentifier(url=HttpUrl(f"https://github.com/test_owner/{repo_name}"))
+        for repo_name in repo_names
+    ]
+
+    async with HTTPClient() as http_client:
+        github_graphql_client = GitHubGraphQLClient(
+            http_client,
+            "test",
+            graphql_url=str(graphql_server.make_url("/graphql")),
+            max_query_cost=4 * GitHubGraphQLClient.ESTIMATED_REPO_COST,
+        )
+        results = await github_graphql_client.get_repos(repo_identifiers)
+
+    assert len(results) == 7
+    assert isinstance(results[2], GitHubAPIError)
+    assert isinstance(results[6], GitHubAPIError)
+
+    empty_repository = results[5]
+
+    assert isinstance(empty_repository, GraphQLRepository)
+    assert empty_repository.full_repository.pushed_at is None
+    assert empty_repository.content_tree_list.content_tree_list == []
+
+    graphql_repository = results[0]
+
+    assert isinstance(graphql_repository, GraphQLRepository)
+    assert graphql_repository.full_repository.name == "a"
+    assert graphql_repository.full_repository.open_issues_count == 7
+    assert graphql_repository.full_repository.license is not None
+    assert [
+        content_tree.type
+        for content_tree in graphql_repository.content_tree_list.content_tree_list
+    ] == ["file", "dir"]
+
+
+@pytest.mark.asyncio
+async def test_create_repo_contexts_can_be_scored(
+    graphql_server: BaseTestServer, repo_identifier: RepoIdentifier
+) -> None:
+    """Ensure that RepoContexts created with GraphQL can be scored like REST ones."""
+
+    async with HTTPClient() as http_client:
+        github_graphql_client = GitHubGraphQLClient(
+            http_client, "test", graphql_url=str(graphql_server.make_url("/graphql"))
+        )
+        repo_contexts = await create_repo_contexts(
+            [repo_identifier], github_graphql_client
+        )
+
+    repo_context = repo_contexts[0]
+
+    assert isinstance(repo_context, RepoContext)
+
+    repo_result = score_repo_context(repo_context)
+    metric_values = {
+        metric.normalized_name: metric.metric_value for metric in repo_result.metrics
+    }
+
+    assert metric_values["has_readme_metric"] is True
+    assert metric_values["has_license_metric"] is True
+    assert metric_values["star_count_metric"] == 600
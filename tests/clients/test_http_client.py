@@ -1,18 +1,21 @@
+import json
 from unittest import mock
 
 import pytest
 from pytest_mock import MockerFixture
 
 from rely.clients.http_client import HTTPClient
+from rely.clients.response_store import MemoryResponseStore, create_stored_response
 
 
 @pytest.fixture
 def mock_get(mocker: MockerFixture) -> mock.AsyncMock:
     """Fixture to mock aiohttp.ClientSession.get."""
 
-    return mocker.patch(
-        "aiohttp.ClientSession.get", return_value=mock.AsyncMock(autospec=True)
-    )
+    mock_response = mock.AsyncMock(autospec=True)
+    mock_response.__aenter__.return_value.read.return_value = b"{}"
+
+    return mocker.patch("aiohttp.ClientSession.get", return_value=mock_response)
 
 
 @pytest.mark.asyncio
@@ -28,3 +31,66 @@ async def test_http_client_get(
         await http_client.get(url=test_url)
 
     mock_get.assert_called_once_with(test_url, headers=None)
+
+
+def _create_mock_response(
+    status: int, headers: dict[str, str], body: object
+) -> mock.AsyncMock:
+    """Create a mock aiohttp response context manager."""
+
+    mock_response = mock.AsyncMock()
+    mock_response.__aenter__.return_value = mock.MagicMock(
+        status=status,
+        headers=headers,
+        read=mock.AsyncMock(return_value=json.dumps(body).encode()),
+    )
+
+    return mock_response
+
+
+@pytest.mark.asyncio
+async def test_http_client_get_sends_conditional_request(
+    mocker: MockerFixture,
+) -> None:
+    """Ensure that HTTPClient.get revalidates with ETags and reuses the stored body on a 304."""
+
+    test_url = "https://test.com"
+    test_body = {"name": "rely"}
+    m = mocker.patch(
+        "aiohttp.ClientSession.get",
+        side_effect=[
+            _create_mock_response(200, {"ETag": '"abc"'}, test_body),
+            _create_mock_response(304, {"ETag": '"abc"'}, None),
+        ],
+    )
+
+    async with HTTPClient(response_store=MemoryResponseStore(8)) as http_client:
+        first_body = await http_client.get(url=test_url)
+        second_body = await http_client.get(url=test_url)
+
+    assert first_body == test_body
+    assert second_body == test_body
+    assert m.call_args_list[0] == mock.call(test_url, headers=None)
+    assert m.call_args_list[1] == mock.call(
+        test_url, headers={"If-None-Match": '"abc"'}
+    )
+
+
+@pytest.mark.asyncio
+async def test_http_client_get_skips_request_for_fresh_response(
+    mock_get: mock.AsyncMock,
+) -> None:
+    """Ensure that HTTPClient.get doesn't perform a request when the stored response is younger than max_age."""
+
+    test_url = "https://test.com"
+    test_body = {"name": "rely"}
+    response_store = MemoryResponseStore(8)
+    response_store.set(
+        test_url, create_stored_response(json.dumps(test_body).encode(), '"abc"', None)
+    )
+
+    async with HTTPClient(response_store=response_store, max_age=60) as http_client:
+        body = await http_client.get(url=test_url)
+
+    assert body == test_body
+    mock_get.assert_not_called()
@@ -0,0 +1,248 @@
+import collections
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import BaseTestServer, TestServer
+
+from rely.clients.http_client import HTTPClient
+from rely.clients.package_resolver import (
+    CachedPackageResolver,
+    PackageResolutionError,
+    RegistryPackageResolver,
+    parse_github_repo_url,
+)
+from rely.clients.response_cache import ResponseCache
+from rely.core.models.dependency import (
+    Dependency,
+    create_npm_dependency,
+    create_pypi_dependency,
+)
+
+
+# Stand-in PyPI metadata (the "info" block of the JSON API) per package
+PYPI_PACKAGES = {
+    "pydantic": {
+        "project_urls": {
+            "Funding": "https://github.com/sponsors/samuelcolvin",
+            "Source": "https://github.com/pydantic/pydantic",
+        },
+        "home_page": None,
+    },
+    "requests": {
+        "project_urls": None,
+        "home_page": "https://github.com/psf/requests/",
+        "requires_dist": [
+            "charset_normalizer<4,>=2",
+            "urllib3<3,>=1.21.1",
+            'PySocks!=1.5.7,>=1.5.6; extra == "socks"',
+            'win-inet-pton; sys_platform == "win32" and extra == "socks"',
+        ],
+    },
+    "closed-source": {
+        "project_urls": {"Homepage": "https://example.com"},
+        "home_page": "",
+    },
+}
+# Stand-in npm metadata (the repository field of the latest version) per package
+NPM_PACKAGES: dict[str, object] = {
+    "react": {
+        "type": "git",
+        "url": "git+https://github.com/facebook/react.git",
+        "directory": "packages/react",
+    },
+    "@types/node": {
+        "type": "git",
+        "url": "https://github.com/DefinitelyTyped/DefinitelyTyped.git",
+    },
+    "left-pad": "stevemao/left-pad",
+    "no-repository": None,
+}
+
+# Stand-in npm dependencies of the latest version per package
+NPM_DEPENDENCIES = {
+    "react": {"loose-envify": "^1.1.0", "local-package": "file:../local-package"},
+}
+
+
+class PackageIndex:
+    """Local stand-in for the PyPI and npm registries (that counts requests per package)."""
+
+    def __init__(self) -> None:
+        self.request_counts: collections.Counter[str] = collections.Counter()
+
+    async def handle_pypi(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        self.request_counts[name] += 1
+
+        if name == "broken":
+            return web.json_response({"message": "Internal Server Error"}, status=500)
+        if name not in PYPI_PACKAGES:
+            return web.json_response({"message": "Not Found"}, status=404)
+
+        return web.json_response({"info": PYPI_PACKAGES[name]})
+
+    async def handle_npm(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        self.request_counts[name] += 1
+
+        if name not in NPM_PACKAGES:
+            return web.json_response({"error": "Not found"}, status=404)
+
+        return web.json_response(
+            {
+                "name": name,
+                "repository": NPM_PACKAGES[name],
+                "dependencies": NPM_DEPENDENCIES.get(name, {}),
+            }
+        )
+
+
+@pytest_asyncio.fixture
+async def package_index() -> AsyncIterator[tuple[PackageIndex, BaseTestServer]]:
+    """Fixture to run a local stand-in package index."""
+
+    package_index = PackageIndex()
+    app = web.Application()
+    app.router.add_get("/pypi/{name}/json", package_index.handle_pypi)
+    app.router.add_get("/npm/{name:.+}/latest", package_index.handle_npm)
+
+    async with TestServer(app) as test_server:
+        yield package_index, test_server
+
+
+def _create_resolver(
+    http_client: HTTPClient, test_server: BaseTestServer
+) -> RegistryPackageResolver:
+    base_url = str(test_server.make_url("")).rstrip("/")
+
+    return RegistryPackageResolver(
+        http_client, pypi_base_url=base_url, npm_base_url=f"{base_url}/npm"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "dependency, expected_repo_url",
+    [
+        (create_pypi_dependency("pydantic"), "https://github.com/pydantic/pydantic"),
+        (create_pypi_dependency("requests"), "https://github.com/psf/requests"),
+        (create_pypi_dependency("closed-source"), None),
+        (create_pypi_dependency("unknown"), None),
+        (create_npm_dependency("react"), "https://github.com/facebook/react"),
+        (
+            create_npm_dependency("@types/node"),
+            "https://github.com/DefinitelyTyped/DefinitelyTyped",
+        ),
+        (create_npm_dependency("left-pad"), "https://github.com/stevemao/left-pad"),
+        (create_npm_dependency("no-repository"), None),
+        (create_npm_dependency("unknown"), None),
+    ],
+)
+async def test_registry_package_resolver(
+    package_index: tuple[PackageIndex, BaseTestServer],
+    dependency: Dependency,
+    expected_repo_url: str | None,
+) -> None:
+    """Ensure that packages are resolved to their GitHub repos (or to none)."""
+
+    _, test_server = package_index
+
+    async with HTTPClient() as http_client:
+        package_resolution = await _create_resolver(http_client, test_server).resolve(
+            dependency
+        )
+
+    assert package_resolution.repo_url == expected_repo_url
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "dependency, expected_dependencies",
+    [
+        (
+            create_pypi_dependency("requests"),
+            (
+                create_pypi_dependency("charset-normalizer"),
+                create_pypi_dependency("urllib3"),
+            ),
+        ),
+        (create_npm_dependency("react"), (create_npm_dependency("loose-envify"),)),
+        (create_pypi_dependency("pydantic"), ()),
+    ],
+)
+async def test_registry_package_resolver_resolves_dependencies(
+    package_index: tuple[PackageIndex, BaseTestServer],
+    dependency: Dependency,
+    expected_dependencies: tuple[Dependency, ...],
+) -> None:
+    """Ensure that the dependencies of packages are resolved (skipping extras and local packages)."""
+
+    _, test_server = package_index
+
+    async with HTTPClient() as http_client:
+        package_resolution = await _create_resolver(http_client, test_server).resolve(
+            dependency
+        )
+
+    assert package_resolution.dependencies == expected_dependencies
+
+
+@pytest.mark.asyncio
+async def test_registry_package_resolver_raises_on_error(
+    package_index: tuple[PackageIndex, BaseTestServer],
+) -> None:
+    """Ensure that a failed registry lookup raises a PackageResolutionError."""
+
+    _, test_server = package_index
+
+    async with HTTPClient() as http_client:
+        with pytest.raises(PackageResolutionError):
+            await _create_resolver(http_client, test_server).resolve(
+                create_pypi_dependency("broken")
+            )
+
+
+@pytest.mark.asyncio
+async def test_cached_package_resolver(
+    package_index: tuple[PackageIndex, BaseTestServer],
+) -> None:
+    """Ensure that resolutions (including packages without a repo) are cached, and errors are not."""
+
+    server, test_server = package_index
+
+    async with HTTPClient() as http_client:
+        package_resolver = CachedPackageResolver(
+            _create_resolver(http_client, test_server), ResponseCache(16)
+        )
+
+        for _ in range(3):
+            await package_resolver.resolve(create_pypi_dependency("pydantic"))
+            await package_resolver.resolve(create_pypi_dependency("unknown"))
+
+            with pytest.raises(PackageResolutionError):
+                await package_resolver.resolve(create_pypi_dependency("broken"))
+
+    assert server.request_counts == {"pydantic": 1, "unknown": 1, "broken": 3}
+    assert package_resolver.cache_stats.hits == 4
+
+
+@pytest.mark.parametrize(
+    "url, expected_repo_url",
+    [
+        ("https://github.com/owner/repo", "https://github.com/owner/repo"),
+        ("git+ssh://git@github.com/owner/repo.git", "https://github.com/owner/repo"),
+        ("git@github.com:owner/repo.git", "https://github.com/owner/repo"),
+        (
+            "https://github.com/owner/repo/tree/main/docs",
+            "https://github.com/owner/repo",
+        ),
+        ("https://github.com/sponsors/owner", None),
+        ("https://gitlab.com/owner/repo", None),
+    ],
+)
+def test_parse_github_repo_url(url: str, expected_repo_url: str | None) -> None:
+    """Ensure that GitHub repo URLs are parsed out of URLs that point into repos."""
+
+    assert parse_github_repo_url(url) == expected_repo_url
@@ -0,0 +1,80 @@
+import pytest
+
+from rely.clients.rate_limiter import RateLimiter, is_rate_limited
+
+
+class FakeTime:
+    """Manually advanced clock (sleeping advances the clock)."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_requests_with_token_bucket() -> None:
+    """Ensure that requests beyond the burst are paced at the sustained rate."""
+
+    fake_time = FakeTime()
+    rate_limiter = RateLimiter(
+        requests_per_second=2, burst=2, clock=fake_time.clock, sleep=fake_time.sleep
+    )
+
+    for _ in range(4):
+        await rate_limiter.acquire()
+
+    assert fake_time.now == pytest.approx(1_001.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_reset_when_budget_is_exhausted() -> None:
+    """Ensure that no requests are let through until the budget resets."""
+
+    fake_time = FakeTime()
+    rate_limiter = RateLimiter(clock=fake_time.clock, sleep=fake_time.sleep)
+    rate_limiter.update(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Used": "5000",
+            "X-RateLimit-Reset": "1600",
+        }
+    )
+
+    assert rate_limiter.state.remaining == 0
+
+    await rate_limiter.acquire()
+
+    assert fake_time.now >= 1_600.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_honors_retry_after() -> None:
+    """Ensure that a Retry-After header pauses requests."""
+
+    fake_time = FakeTime()
+    rate_limiter = RateLimiter(
+        retry_backoff=0.5, clock=fake_time.clock, sleep=fake_time.sleep
+    )
+    rate_limiter.back_off(429, {"Retry-After": "30"}, attempt=0)
+
+    await rate_limiter.acquire()
+
+    assert 1_030.0 <= fake_time.now <= 1_030.5
+
+
+def test_is_rate_limited() -> None:
+    """Ensure that primary and secondary rate limit responses are detected."""
+
+    assert is_rate_limited(429, None)
+    assert is_rate_limited(403, {"X-RateLimit-Remaining": "0"})
+    assert is_rate_limited(403, {"Retry-After": "60"})
+    assert not is_rate_limited(403, {"X-RateLimit-Remaining": "10"})
+    assert not is_rate_limited(404, {"X-RateLimit-Remaining": "0"})
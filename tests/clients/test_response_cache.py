@@ -0,0 +1,55 @@
+from rely.clients.response_cache import ResponseCache
+
+
+class FakeClock:
+    """Manually advanced clock for testing TTLs."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_response_cache_hit_and_miss() -> None:
+    """Ensure that cached values are returned and counted."""
+
+    response_cache: ResponseCache[str] = ResponseCache(max_size=2)
+
+    assert response_cache.get("a") is None
+
+    response_cache.set("a", "value", ttl=60)
+
+    assert response_cache.get("a") == "value"
+    assert response_cache.stats.hits == 1
+    assert response_cache.stats.misses == 1
+
+
+def test_response_cache_expires_entries() -> None:
+    """Ensure that entries are dropped once their TTL has passed."""
+
+    clock = FakeClock()
+    response_cache: ResponseCache[str] = ResponseCache(max_size=2, clock=clock)
+    response_cache.set("short", "value", ttl=10)
+    response_cache.set("long", "value", ttl=100)
+
+    clock.now = 50
+
+    assert response_cache.get("short") is None
+    assert response_cache.get("long") == "value"
+    assert len(response_cache) == 1
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    """Ensure that the least recently used entry is evicted when the cache is full."""
+
+    response_cache: ResponseCache[str] = ResponseCache(max_size=2)
+    response_cache.set("a", "a", ttl=60)
+    response_cache.set("b", "b", ttl=60)
+    response_cache.get("a")
+    response_cache.set("c", "c", ttl=60)
+
+    assert response_cache.get("a") == "a"
+    assert response_cache.get("b") is None
+    assert response_cache.get("c") == "c"
+    assert response_cache.stats.evictions == 1
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+from rely.clients.models.content_tree import ContentTree
+from rely.clients.models.full_repository import FullRepository
+from rely.clients.models.scoring_content_tree import ScoringContentTree
+from rely.clients.models.scoring_repository import ScoringRepository
+
+
+FIXTURES_DIR = Path(__file__).parent / "test_github_api_client" / "fixtures"
+
+
+def test_scoring_repository_matches_full_repository() -> None:
+    """Ensure that the scoring view validates the same values as the full model."""
+
+    response = json.loads((FIXTURES_DIR / "get_repo_response.json").read_text())
+    full_repository = FullRepository.model_validate(response)
+    scoring_repository = ScoringRepository.model_validate(response)
+
+    for field_name in ScoringRepository.model_fields:
+        if field_name == "license":
+            continue
+
+        assert getattr(scoring_repository, field_name) == getattr(
+            full_repository, field_name
+        )
+
+    assert scoring_repository.license is not None
+    assert full_repository.license is not None
+    assert scoring_repository.license.key == full_repository.license.key
+    assert scoring_repository.license.spdx_id == full_repository.license.spdx_id
+
+
+def test_scoring_content_tree_matches_content_tree() -> None:
+    """Ensure that the scoring view validates the same values as the full model."""
+
+    response = json.loads(
+        (FIXTURES_DIR / "get_repo_contents_response.json").read_text()
+    )
+
+    for entry in response:
+        content_tree = ContentTree.model_validate(entry)
+        scoring_content_tree = ScoringContentTree.model_validate(entry)
+
+        for field_name in ScoringContentTree.model_fields:
+            assert getattr(scoring_content_tree, field_name) == getattr(
+                content_tree, field_name
+            )
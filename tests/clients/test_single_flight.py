@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from rely.clients.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_in_flight_task() -> None:
+    """Ensure that concurrent calls with the same key share a single task."""
+
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    is_open = asyncio.Event()
+    call_count = 0
+
+    async def _compute() -> int:
+        nonlocal call_count
+        call_count += 1
+        await is_open.wait()
+
+        return 42
+
+    waiters = [
+        asyncio.create_task(single_flight.run("key", _compute)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+
+    assert single_flight.stats.in_flight == 1
+
+    is_open.set()
+
+    assert await asyncio.gather(*waiters) == [42] * 5
+    assert call_count == 1
+    assert single_flight.stats.calls == 1
+    assert single_flight.stats.coalesced == 4
+    assert single_flight.stats.in_flight == 0
+
+    # Nothing is cached, so the next call starts a new task
+    assert await single_flight.run("key", _compute) == 42
+    assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_raises_error_to_every_waiter() -> None:
+    """Ensure that an error is raised to every waiter, and the key is retried afterwards."""
+
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    async def _fail() -> int:
+        await asyncio.sleep(0)
+
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        *(single_flight.run("key", _fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert [str(result) for result in results] == ["failed"] * 3
+    assert all(isinstance(result, ValueError) for result in results)
+    assert single_flight.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_cancelled_waiter() -> None:
+    """Ensure that a cancelled waiter doesn't cancel the task for the other waiters."""
+
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    is_open = asyncio.Event()
+
+    async def _compute() -> int:
+        await is_open.wait()
+
+        return 42
+
+    cancelled_waiter = asyncio.create_task(single_flight.run("key", _compute))
+    other_waiter = asyncio.create_task(single_flight.run("key", _compute))
+    await asyncio.sleep(0)
+    cancelled_waiter.cancel()
+    is_open.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_waiter
+
+    assert await other_waiter == 42
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_task_without_waiters() -> None:
+    """Ensure that the task is cancelled once its only waiter is cancelled."""
+
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    is_started = asyncio.Event()
+    is_cancelled = False
+
+    async def _compute() -> int:
+        nonlocal is_cancelled
+        is_started.set()
+
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            is_cancelled = True
+            raise
+
+        return 42
+
+    waiter = asyncio.create_task(single_flight.run("key", _compute))
+    await is_started.wait()
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    await asyncio.sleep(0)
+
+    assert is_cancelled
+    assert single_flight.stats.in_flight == 0
+
+    # A later call starts a new task (instead of joining the cancelled one)
+    is_started.clear()
+    later_waiter = asyncio.create_task(single_flight.run("key", _compute))
+    await is_started.wait()
+
+    assert single_flight.stats.calls == 2
+
+    later_waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await later_waiter
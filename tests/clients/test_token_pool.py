@@ -0,0 +1,104 @@
+import pytest
+
+from rely.clients.rate_limiter import RateLimiter
+from rely.clients.token_pool import TokenPool
+
+
+class FakeTime:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def clock(self) -> float:
+        return self.now
+
+
+def _rate_limit_headers(remaining: int, reset_at: int = 2_000) -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Used": str(5000 - remaining),
+        "X-RateLimit-Reset": str(reset_at),
+    }
+
+
+def test_token_pool_requires_tokens() -> None:
+    """Ensure that an empty token pool is rejected."""
+
+    with pytest.raises(ValueError):
+        TokenPool([])
+
+
+def test_token_pool_drops_duplicate_tokens() -> None:
+    """Ensure that duplicate tokens are only pooled once."""
+
+    assert len(TokenPool(["a", "b", "a"])) == 2
+
+
+@pytest.mark.asyncio
+async def test_token_pool_probes_every_token_first() -> None:
+    """Ensure that tokens with an unknown budget are used in turn."""
+
+    token_pool = TokenPool(["a", "b", "c"])
+    tokens = []
+
+    for _ in range(3):
+        pooled_token = token_pool.select()
+        await pooled_token.acquire()
+        tokens.append(await pooled_token.get_token())
+
+    assert sorted(tokens) == ["a", "b", "c"]
+    assert [usage.requests for usage in token_pool.usage] == [1, 1, 1]
+
+
+def test_token_pool_selects_token_with_most_remaining_budget() -> None:
+    """Ensure that the token with the most remaining budget is selected."""
+
+    token_pool = TokenPool(["a", "b", "c"])
+
+    for pooled_token, remaining in zip(token_pool._pooled_tokens, [10, 4000, 300]):
+        pooled_token.rate_limiter.update(_rate_limit_headers(remaining))
+
+    assert token_pool.select().credential == "b"
+
+
+def test_token_pool_skips_exhausted_tokens_until_reset() -> None:
+    """Ensure that exhausted tokens are skipped until their budget resets."""
+
+    fake_time = FakeTime()
+    token_pool = TokenPool(
+        ["a", "b"], create_rate_limiter=lambda: RateLimiter(clock=fake_time.clock)
+    )
+    first_token, second_token = token_pool._pooled_tokens
+    first_token.rate_limiter.update(_rate_limit_headers(0, reset_at=1_500))
+    second_token.rate_limiter.update(_rate_limit_headers(1))
+
+    assert token_pool.select() is second_token
+
+    second_token.rate_limiter.update(_rate_limit_headers(0, reset_at=1_800))
+
+    # NOTE: If every token is exhausted, the one that resets first is selected
+    assert token_pool.select() is first_token
+
+    fake_time.now = 1_500.0
+
+    assert first_token.rate_limiter.is_available()
+    assert token_pool.select() is first_token
+
+
+def test_token_pool_combines_rate_limit_state() -> None:
+    """Ensure that the pool reports the combined budget of its tokens."""
+
+    token_pool = TokenPool(["token-a", "token-b"])
+    first_token, second_token = token_pool._pooled_tokens
+    first_token.rate_limiter.update(_rate_limit_headers(100, reset_at=1_500))
+    second_token.rate_limiter.update(_rate_limit_headers(200, reset_at=1_800))
+
+    state = token_pool.state
+
+    assert state.limit == 10_000
+    assert state.remaining == 300
+    assert state.reset_at == 1_500
+    assert state.paused_until is None
+    assert [usage.token_hint for usage in token_pool.usage] == ["...en-a", "...en-b"]
@@ -0,0 +1,135 @@
+import datetime
+import random
+
+import pytest
+from pytest_mock import MockerFixture
+
+from rely.clients.models.scoring_content_tree import ScoringContentTree
+from rely.clients.models.scoring_repository import ScoringLicense
+from rely.core.metrics.columnar_scoring import create_metric_columns, score_columns
+from rely.core.metrics.fork_count_metric import ForkCountMetric
+from rely.core.metrics.last_commit_metric import LastCommitMetric
+from rely.core.metrics.open_issue_count_metric import OpenIssueCountMetric
+from rely.core.metrics.star_count_metric import StarCountMetric
+from rely.core.metrics.types import MetricScore
+from rely.core.metrics.watcher_count_metric import WatcherCountMetric
+from rely.core.models.repo_context import RepoContext
+from rely.services.score_repo_service import get_metric_classes, score_repo_context
+from tests.factories import create_synthetic_repo_context
+
+
+RANGE_METRIC_CLASSES = (
+    LastCommitMetric,
+    StarCountMetric,
+    ForkCountMetric,
+    WatcherCountMetric,
+    OpenIssueCountMetric,
+)
+# Values just below, at and just above every metric threshold
+BOUNDARY_VALUES = sorted(
+    {0, 100_000}
+    | {
+        threshold + offset
+        for metric_class in RANGE_METRIC_CLASSES
+        for threshold in (metric_class.AVERAGE_MIN, metric_class.AVERAGE_MAX)
+        for offset in (-1, 0, 1)
+    }
+)
+
+
+def _create_repo_context(
+    random_generator: random.Random, now: datetime.datetime, index: int
+) -> RepoContext:
+    """Create a random RepoContext (with values that hit every metric threshold)."""
+
+    def _random_count() -> int:
+        return random_generator.choice(BOUNDARY_VALUES)
+
+    return create_synthetic_repo_context(
+        index,
+        description=random_generator.choice([None, "", " ", "Test repository"]),
+        stargazers_count=_random_count(),
+        watchers_count=_random_count(),
+        forks_count=_random_count(),
+        open_issues_count=_random_count(),
+        archived=random_generator.random() < 0.5,
+        disabled=random_generator.random() < 0.5,
+        # NOTE: Half a day off whole days, so that the (real) clock can't cross a day boundary
+        #       (empty repos have never been pushed to)
+        pushed_at=(
+            now - datetime.timedelta(days=_random_count(), hours=12)
+            if random_generator.random() < 0.9
+            else None
+        ),
+        license=(
+            ScoringLicense(key="mit", name="MIT License")
+            if random_generator.random() < 0.5
+            else None
+        ),
+        readme=ScoringContentTree(
+            type=random_generator.choice(["file", "dir"]),
+            size=random_generator.choice([0, 100]),
+            name="README.md",
+            path=random_generator.choice(["README.md", "readme", "docs.md"]),
+            sha="abc",
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "metric_names",
+    [None, ["star_count_metric", "last_commit_metric", "has_readme_metric"]],
+)
+def test_score_columns_matches_metric_reducer(metric_names: list[str] | None) -> None:
+    """Ensure that columnar scores exactly match per-repo scores."""
+
+    random_generator = random.Random(42)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    metric_classes = get_metric_classes(metric_names)
+    repo_contexts = [
+        _create_repo_context(random_generator, now, index) for index in range(3_000)
+    ]
+
+    columnar_scores = score_columns(
+        create_metric_columns(repo_contexts), metric_classes, now=now
+    )
+
+    for index, repo_context in enumerate(repo_contexts):
+        repo_result = score_repo_context(repo_context, metric_classes)
+
+        assert (
+            columnar_scores.overall_scores[index] == repo_result.overall_score_decimal
+        )
+        assert (
+            columnar_scores.overall_scores_int[index] == repo_result.overall_score_int
+        )
+
+        for metric in repo_result.metrics:
+            assert (
+                columnar_scores.metric_scores[metric.normalized_name][index]
+                == metric.metric_score
+            )
+
+
+def test_score_columns_shares_metric_thresholds(mocker: MockerFixture) -> None:
+    """Ensure that changing a metric's thresholds changes its columnar scores too."""
+
+    mocker.patch.object(StarCountMetric, "AVERAGE_MIN", 5)
+    mocker.patch.object(StarCountMetric, "AVERAGE_MAX", 10)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    repo_contexts = [
+        _create_repo_context(random.Random(index), now, index) for index in range(3)
+    ]
+
+    for repo_context, stargazers_count in zip(repo_contexts, [4, 10, 11]):
+        repo_context.get_full_repository().stargazers_count = stargazers_count
+
+    columnar_scores = score_columns(
+        create_metric_columns(repo_contexts), [StarCountMetric], now=now
+    )
+
+    assert [
+        StarCountMetric(repo_context).compute_metric_score()
+        for repo_context in repo_contexts
+    ] == [MetricScore.POOR, MetricScore.AVERAGE, MetricScore.GOOD]
+    assert columnar_scores.metric_scores["star_count_metric"].tolist() == [1, 2, 3]
@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+
+from typing import cast
+
+from rely.core.models.repo_context import RepoContext
+from rely.core.metrics.types import MetricScore
+from rely.core.metrics.last_commit_metric import LastCommitMetric
+from rely.services.score_repo_service import RepoResult, score_repo_context
+from tests.conftest import ModelLoaderFunction
+
+
+def test_compute_last_commit_metric_without_commits(
+    local_test_dir: Path, load_model_from_file: ModelLoaderFunction
+) -> None:
+    """Ensure that repos without any commit (pushed_at is null) get the worst score."""
+
+    model_instance = load_model_from_file(
+        RepoContext, local_test_dir / "fixtures" / "repo_context_without_commits.json"
+    )
+    repo_context = cast(RepoContext, model_instance)
+    last_commit_metric = LastCommitMetric(repo_context)
+
+    assert last_commit_metric.compute_metric_value() is None
+    assert last_commit_metric.compute_metric_score() == MetricScore.POOR
+    assert last_commit_metric.serialize().metric_score == MetricScore.POOR.value
+
+
+def test_last_commit_metric_without_commits_round_trips(
+    local_test_dir: Path, load_model_from_file: ModelLoaderFunction
+) -> None:
+    """Ensure that the missing value of repos without any commit survives serialization (as null)."""
+
+    model_instance = load_model_from_file(
+        RepoContext, local_test_dir / "fixtures" / "repo_context_without_commits.json"
+    )
+    repo_context = cast(RepoContext, model_instance)
+    repo_result = score_repo_context(repo_context, [LastCommitMetric])
+
+    serialized_repo_result = repo_result.model_dump_json()
+    [serialized_metric] = json.loads(serialized_repo_result)["metrics"]
+
+    assert serialized_metric["metric_value"] is None
+    assert RepoResult.model_validate_json(serialized_repo_result) == repo_result
@@ -0,0 +1,60 @@
+import gc
+import tracemalloc
+
+from rely.core.metrics.memoization import memoize_method
+from rely.services.score_repo_service import get_metric_classes, score_repo_context
+from tests.factories import create_synthetic_repo_context
+
+
+# Number of synthetic repos that are scored in the soak test
+SOAK_REPO_COUNT = 10_000
+# Memory that may be retained after the warm-up (like interned objects), regardless of repo count
+MAX_RETAINED_MEMORY = 256 * 1024
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    @memoize_method
+    def count(self) -> int:
+        self.call_count += 1
+
+        return self.call_count
+
+
+def test_memoize_method_is_scoped_to_instance() -> None:
+    """Ensure that results are memoized per instance."""
+
+    first_counter = Counter()
+    second_counter = Counter()
+
+    assert first_counter.count() == 1
+    assert first_counter.count() == 1
+    assert second_counter.count() == 1
+
+
+def test_scoring_memory_is_flat() -> None:
+    """Ensure that scoring many repos doesn't retain memory (like a global cache would)."""
+
+    metric_classes = get_metric_classes()
+
+    # Warm up (imports, interned objects and the like)
+    for index in range(100):
+        score_repo_context(create_synthetic_repo_context(index), metric_classes)
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        for index in range(SOAK_REPO_COUNT):
+            score_repo_context(create_synthetic_repo_context(index), metric_classes)
+
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert retained - baseline < MAX_RETAINED_MEMORY
@@ -1,13 +1,21 @@
 from unittest import mock
 from pathlib import Path
 
+import asyncio
+
 import pytest
 from pytest_mock import MockerFixture
 
 from rely.clients.github_api_client import GitHubAPIClient
 from rely.core.models.repo_identifier import RepoIdentifier
-from rely.core.models.repo_context import RepoContext, create_repo_context
-from rely.clients.models.full_repository import FullRepository
+from rely.core.models.repo_context import (
+    DataSource,
+    LazyRepoContext,
+    MissingDataSourceError,
+    RepoContext,
+    create_repo_context,
+)
+from rely.clients.models.scoring_repository import ScoringRepository
 from rely.clients.models.content_tree_list import ContentTreeList
 from tests.conftest import ModelLoaderFunction
 
@@ -21,7 +29,7 @@ def mock_github_api_client(
     """Fixture to create a mock GitHubAPIClient."""
 
     full_repository = load_model_from_file(
-        FullRepository, local_test_dir / "fixtures" / "full_repository.json"
+        ScoringRepository, local_test_dir / "fixtures" / "full_repository.json"
     )
     content_tree_list = load_model_from_file(
         ContentTreeList, local_test_dir / "fixtures" / "content_tree_list.json"
@@ -46,7 +54,7 @@ def test_instantiate_repo_context(
     """Ensure that we can instantiate a RepoContext."""
 
     full_repository = load_model_from_file(
-        FullRepository, local_test_dir / "fixtures" / "full_repository.json"
+        ScoringRepository, local_test_dir / "fixtures" / "full_repository.json"
     )
     content_tree_list = load_model_from_file(
         ContentTreeList, local_test_dir / "fixtures" / "content_tree_list.json"
@@ -74,3 +82,48 @@ async def test_create_repo_context(
     )
 
     assert repo_context is not None
+
+
+@pytest.mark.asyncio
+async def test_create_repo_context_only_fetches_required_data_sources(
+    repo_identifier: RepoIdentifier,
+    mock_github_api_client: GitHubAPIClient,
+) -> None:
+    """Ensure that create_repo_context skips data sources that aren't required."""
+
+    repo_context = await create_repo_context(
+        repo_identifier=repo_identifier,
+        github_api_client=mock_github_api_client,
+        data_sources={DataSource.FULL_REPOSITORY},
+    )
+
+    assert repo_context.full_repository is not None
+    assert repo_context.content_tree_list is None
+    assert isinstance(mock_github_api_client.get_repo_contents, mock.AsyncMock)
+    mock_github_api_client.get_repo_contents.assert_not_awaited()
+
+    with pytest.raises(MissingDataSourceError):
+        repo_context.get_content_tree_list()
+
+
+@pytest.mark.asyncio
+async def test_lazy_repo_context_fetches_data_sources_once(
+    repo_identifier: RepoIdentifier,
+    mock_github_api_client: GitHubAPIClient,
+) -> None:
+    """Ensure that LazyRepoContext fetches each data source on first access only."""
+
+    lazy_repo_context = LazyRepoContext(repo_identifier, mock_github_api_client)
+
+    assert isinstance(mock_github_api_client.get_repo, mock.AsyncMock)
+    mock_github_api_client.get_repo.assert_not_awaited()
+
+    await asyncio.gather(
+        lazy_repo_context.get_full_repository(),
+        lazy_repo_context.get_full_repository(),
+    )
+    repo_context = await lazy_repo_context.load({DataSource.FULL_REPOSITORY})
+
+    mock_github_api_client.get_repo.assert_awaited_once()
+    assert repo_context.full_repository is not None
+    assert repo_context.content_tree_list is None
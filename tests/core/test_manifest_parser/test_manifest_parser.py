@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import pytest
+
+from rely.core.manifest_parser import (
+    ManifestError,
+    find_manifests,
+    parse_manifest,
+    parse_manifests,
+)
+from rely.core.models.dependency import (
+    Dependency,
+    create_npm_dependency,
+    create_pypi_dependency,
+)
+
+
+@pytest.fixture
+def project_dir(local_test_dir: Path) -> Path:
+    """Fixture to get path of a project directory with one manifest of each kind."""
+
+    return local_test_dir / "fixtures" / "project"
+
+
+@pytest.mark.parametrize(
+    "file_name, expected_dependencies",
+    [
+        (
+            "pyproject.toml",
+            [
+                create_pypi_dependency("aiohttp"),
+                create_pypi_dependency("pydantic-settings"),
+                create_pypi_dependency("pyjwt"),
+                create_pypi_dependency("pytest"),
+                create_pypi_dependency("ruff"),
+            ],
+        ),
+        (
+            "uv.lock",
+            [create_pypi_dependency("aiohttp"), create_pypi_dependency("yarl")],
+        ),
+        (
+            "requirements-dev.txt",
+            [
+                create_pypi_dependency("pytest-asyncio"),
+                create_pypi_dependency("mypy"),
+                create_pypi_dependency("named-url"),
+            ],
+        ),
+        (
+            "package.json",
+            [
+                create_npm_dependency("react"),
+                create_npm_dependency("@types/node"),
+                create_npm_dependency("typescript"),
+            ],
+        ),
+    ],
+)
+def test_parse_manifest(
+    project_dir: Path, file_name: str, expected_dependencies: list[Dependency]
+) -> None:
+    """Ensure that each kind of manifest is parsed (skipping local, VCS and URL dependencies)."""
+
+    assert parse_manifest(project_dir / file_name) == expected_dependencies
+
+
+def test_parse_manifests_deduplicates_dependencies(project_dir: Path) -> None:
+    """Ensure that all manifests in a directory are parsed, and their dependencies deduplicated."""
+
+    dependencies = parse_manifests(project_dir)
+
+    assert [manifest_path.name for manifest_path in find_manifests(project_dir)] == [
+        "package.json",
+        "pyproject.toml",
+        "requirements-dev.txt",
+        "uv.lock",
+    ]
+    assert len(dependencies) == len(set(dependencies)) == 12
+    assert dependencies.count(create_pypi_dependency("aiohttp")) == 1
+
+
+def test_find_manifests_rejects_unsupported_files(project_dir: Path) -> None:
+    """Ensure that a file that isn't a supported manifest raises a ManifestError."""
+
+    with pytest.raises(ManifestError):
+        find_manifests(project_dir / "README.md")
+
+
+def test_parse_manifest_raises_on_invalid_manifest(tmp_path: Path) -> None:
+    """Ensure that an invalid manifest raises a ManifestError."""
+
+    manifest_path = tmp_path / "package.json"
+    manifest_path.write_text("{")
+
+    with pytest.raises(ManifestError):
+        parse_manifest(manifest_path)
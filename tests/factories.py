@@ -0,0 +1,57 @@
+import datetime
+from typing import Any
+
+from pydantic import HttpUrl
+
+from rely.clients.models.content_tree_list import ContentTreeList
+from rely.clients.models.scoring_content_tree import ScoringContentTree
+from rely.clients.models.scoring_repository import ScoringRepository
+from rely.core.models.repo_context import RepoContext
+from rely.core.models.repo_identifier import RepoIdentifier
+
+
+def create_synthetic_repo_context(
+    index: int,
+    *,
+    readme: ScoringContentTree | None = None,
+    **full_repository_fields: Any,
+) -> RepoContext:
+    """
+    Create a synthetic RepoContext (values vary with index, so every metric threshold is hit).
+    NOTE: Fields of the full repository (and the README entry of the content tree list) can be overridden.
+    """
+
+    return RepoContext(
+        repo_identifier=RepoIdentifier(
+            url=HttpUrl(f"https://github.com/test_owner/repo_{index}")
+        ),
+        full_repository=ScoringRepository(
+            **{
+                "name": f"repo_{index}",
+                "full_name": f"test_owner/repo_{index}",
+                "description": "Test repository" if index % 2 else None,
+                "stargazers_count": index % 1_000,
+                "watchers_count": index % 1_000,
+                "forks_count": index % 100,
+                "open_issues_count": index % 300,
+                "archived": index % 7 == 0,
+                "disabled": index % 11 == 0,
+                "pushed_at": datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+                - datetime.timedelta(days=index % 1_000),
+                "license": None,
+                **full_repository_fields,
+            }
+        ),
+        content_tree_list=ContentTreeList(
+            content_tree_list=[
+                readme
+                or ScoringContentTree(
+                    type="file",
+                    size=index % 3,
+                    name="README.md",
+                    path="README.md",
+                    sha="a",
+                )
+            ]
+        ),
+    )
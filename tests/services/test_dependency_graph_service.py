@@ -0,0 +1,167 @@
+import asyncio
+from typing import Collection, Type
+from unittest import mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from rely.clients.github_api_client import GitHubAPIClient
+from rely.clients.package_resolver import PackageResolution, PackageResolutionError
+from rely.core.metrics.base_metric import BaseMetric
+from rely.core.models.dependency import Dependency, create_pypi_dependency
+from rely.services.dependency_graph_service import score_dependency_graph
+from rely.services.score_repo_service import RepoResult
+
+
+A = create_pypi_dependency("a")
+B = create_pypi_dependency("b")
+C = create_pypi_dependency("c")
+D = create_pypi_dependency("d")
+E = create_pypi_dependency("e")
+UNRESOLVABLE = create_pypi_dependency("unresolvable")
+
+# Resolutions of a small graph (with a cycle, and a repo that two packages share)
+RESOLUTIONS = {
+    A: PackageResolution("https://github.com/o/a", (B, C)),
+    B: PackageResolution("https://github.com/o/b", (D,)),
+    C: PackageResolution("https://github.com/o/c", (D, UNRESOLVABLE)),
+    D: PackageResolution("https://github.com/o/d", (A,)),
+    E: PackageResolution("https://github.com/o/B", (C,)),
+}
+# Overall scores (in percent) per repo
+SCORES = {"a": 90, "b": 80, "c": 70, "d": 40}
+
+
+class GraphResolver:
+    """Resolver of the small graph (that tracks the number of operations in flight)."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.scored_repo_urls: list[str] = []
+
+    async def track(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+    async def resolve(self, dependency: Dependency) -> PackageResolution:
+        await self.track()
+
+        if dependency not in RESOLUTIONS:
+            raise PackageResolutionError("Received 500 response with message: Error")
+
+        return RESOLUTIONS[dependency]
+
+
+@pytest.fixture
+def graph_resolver(mocker: MockerFixture) -> GraphResolver:
+    """Fixture to create a GraphResolver (and patch scoring to use the same tracking)."""
+
+    graph_resolver = GraphResolver()
+
+    async def _score_repo_with_client(
+        repo_url: str,
+        github_api_client: GitHubAPIClient,
+        metric_classes: Collection[Type[BaseMetric]] | None,
+    ) -> RepoResult:
+        await graph_resolver.track()
+        graph_resolver.scored_repo_urls.append(repo_url)
+        score = SCORES[repo_url.rsplit("/", 1)[1].lower()]
+
+        return RepoResult(
+            overall_score_decimal=score / 100,
+            overall_score_int=score,
+            maximum_metric_score=3,
+            metrics=[],
+        )
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_repo_with_client,
+    )
+
+    return graph_resolver
+
+
+@pytest.mark.asyncio
+async def test_score_dependency_graph_summarizes_weakest_links(
+    graph_resolver: GraphResolver,
+) -> None:
+    """Ensure that every unique repo is scored once, and weakest links propagate to every top-level dependency."""
+
+    dependency_graph_result = await score_dependency_graph(
+        [A, E], graph_resolver, mock.AsyncMock(), max_concurrency=3
+    )
+    summaries = {
+        summary.dependency: summary for summary in dependency_graph_result.summaries
+    }
+
+    # B and E share a repo (case-insensitively)
+    assert len(graph_resolver.scored_repo_urls) == 4
+    assert len(dependency_graph_result.nodes) == 6
+    assert summaries[A].weakest_dependency == D
+    assert summaries[A].weakest_score_int == 40
+    assert summaries[A].package_count == 5
+    assert summaries[A].error_count == 1
+    # E reaches D (and A) through C
+    assert summaries[E].weakest_dependency == D
+    assert summaries[E].package_count == 6
+    # Operations overlap, but never exceed the concurrency cap
+    assert graph_resolver.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_score_dependency_graph_respects_max_depth(
+    graph_resolver: GraphResolver,
+) -> None:
+    """Ensure that packages beyond the maximum depth are not walked."""
+
+    dependency_graph_result = await score_dependency_graph(
+        [A], graph_resolver, mock.AsyncMock(), max_concurrency=3, max_depth=1
+    )
+    [summary] = dependency_graph_result.summaries
+
+    assert {node.dependency for node in dependency_graph_result.nodes} == {A, B, C}
+    assert summary.weakest_dependency == C
+    assert summary.weakest_score_int == 70
+
+
+@pytest.mark.asyncio
+async def test_score_dependency_graph_walks_shallowest_path() -> None:
+    """
+    Ensure that a package first reached through a long (but quickly resolved) path is walked again,
+    once a short (but slowly resolved) path reaches it.
+    """
+
+    # A -> B -> D -> E (D is at the maximum depth), and C -> D (D is within the maximum depth)
+    resolutions = {
+        A: PackageResolution(None, (B,)),
+        B: PackageResolution(None, (D,)),
+        C: PackageResolution(None, (D,)),
+        D: PackageResolution(None, (E,)),
+        E: PackageResolution(None),
+    }
+
+    class SlowPathResolver:
+        async def resolve(self, dependency: Dependency) -> PackageResolution:
+            await asyncio.sleep(0.05 if dependency == C else 0.001)
+
+            return resolutions[dependency]
+
+    dependency_graph_result = await score_dependency_graph(
+        [A, C], SlowPathResolver(), mock.AsyncMock(), max_concurrency=3, max_depth=2
+    )
+    summaries = {
+        summary.dependency: summary for summary in dependency_graph_result.summaries
+    }
+
+    assert {node.dependency for node in dependency_graph_result.nodes} == {
+        A,
+        B,
+        C,
+        D,
+        E,
+    }
+    assert summaries[C].package_count == 3
@@ -0,0 +1,283 @@
+import asyncio
+import time
+
+import pytest
+from pydantic import HttpUrl
+
+from rely.clients.github_api_client import (
+    GitHubAPIClient,
+    GitHubAPIError,
+    GitHubUnavailableError,
+)
+from rely.clients.http_client import HTTPClient
+from rely.clients.rate_limiter import RateLimiter
+from rely.clients.token_pool import TokenPool
+from rely.core.models.repo_identifier import RepoIdentifier
+from rely.clients.single_flight import SingleFlight
+from rely.services.repo_result_cache import Freshness, RepoResultCache
+from rely.services.score_repo_service import RepoResult, ScoringKey
+
+
+SCORING_KEY: ScoringKey = ("1cph93/rely", ("star_count_metric",))
+
+
+class FakeTime:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def clock(self) -> float:
+        return self.now
+
+
+class FakeScorer:
+    """Scorer that returns results with increasing scores (or raises a given error)."""
+
+    def __init__(self) -> None:
+        self.score_count = 0
+        self.error: Exception | None = None
+
+    async def score(self) -> RepoResult:
+        await asyncio.sleep(0)
+
+        if self.error is not None:
+            raise self.error
+
+        self.score_count += 1
+
+        return RepoResult(
+            overall_score_decimal=self.score_count / 100,
+            overall_score_int=self.score_count,
+            maximum_metric_score=3,
+            metrics=[],
+        )
+
+
+@pytest.fixture
+def fake_time() -> FakeTime:
+    return FakeTime()
+
+
+@pytest.fixture
+def repo_result_cache(fake_time: FakeTime) -> RepoResultCache:
+    """Fixture to create a result cache (fresh for 10s, then stale for 100s or 1000s on errors)."""
+
+    single_flight: SingleFlight[ScoringKey, RepoResult] = SingleFlight()
+
+    return RepoResultCache(
+        single_flight,
+        max_size=8,
+        max_age=10.0,
+        stale_while_revalidate=100.0,
+        stale_if_error=1_000.0,
+        refresh_timeout=1.0,
+        clock=fake_time.clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_repo_result_cache_serves_fresh_results(
+    repo_result_cache: RepoResultCache, fake_time: FakeTime
+) -> None:
+    """Ensure that fresh results are served without scoring again."""
+
+    scorer = FakeScorer()
+
+    first = await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+    fake_time.now += 5
+    second = await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+
+    assert first.freshness == second.freshness == Freshness.FRESH
+    assert second.repo_result is first.repo_result
+    assert second.age == 5
+    assert scorer.score_count == 1
+
+
+@pytest.mark.asyncio
+async def test_repo_result_cache_revalidates_stale_results_in_background(
+    repo_result_cache: RepoResultCache, fake_time: FakeTime
+) -> None:
+    """Ensure that stale results are served immediately while they are refreshed in the background."""
+
+    scorer = FakeScorer()
+
+    await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+    fake_time.now += 50
+    stale_results = [
+        await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+        for _ in range(3)
+    ]
+
+    assert [stale_result.freshness for stale_result in stale_results] == [
+        Freshness.STALE
+    ] * 3
+    assert [
+        stale_result.repo_result.overall_score_int for stale_result in stale_results
+    ] == [1] * 3
+
+    # A single refresh runs in the background
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    refreshed = await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+
+    assert refreshed.freshness == Freshness.FRESH
+    assert refreshed.repo_result.overall_score_int == 2
+    assert scorer.score_count == 2
+
+
+@pytest.mark.asyncio
+async def test_repo_result_cache_serves_stale_results_if_github_is_unavailable(
+    repo_result_cache: RepoResultCache, fake_time: FakeTime
+) -> None:
+    """Ensure that stale results are served if GitHub is unavailable, but not for other errors."""
+
+    scorer = FakeScorer()
+
+    await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+    fake_time.now += 500
+    scorer.error = GitHubUnavailableError(
+        "Received 503 response with message: Unavailable"
+    )
+    stale_result = await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+
+    assert stale_result.freshness == Freshness.STALE_IF_ERROR
+    assert stale_result.repo_result.overall_score_int == 1
+    assert stale_result.age == 500
+
+    scorer.error = GitHubAPIError("Received 404 response with message: Not Found")
+
+    with pytest.raises(GitHubAPIError):
+        await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+
+    # Past the stale-if-error window, the result is dropped
+    fake_time.now += 1_000
+    scorer.error = GitHubUnavailableError(
+        "Received 503 response with message: Unavailable"
+    )
+
+    with pytest.raises(GitHubUnavailableError):
+        await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+
+    assert len(repo_result_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_repo_result_cache_cancels_background_refreshes_on_close(
+    repo_result_cache: RepoResultCache, fake_time: FakeTime
+) -> None:
+    """Ensure that closing the cache cancels background refreshes."""
+
+    scorer = FakeScorer()
+    is_open = asyncio.Event()
+
+    async def _score_slowly() -> RepoResult:
+        await is_open.wait()
+
+        return await scorer.score()
+
+    await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+    fake_time.now += 50
+    await repo_result_cache.get_or_score(SCORING_KEY, _score_slowly)
+    await repo_result_cache.close()
+    is_open.set()
+    await asyncio.sleep(0)
+
+    assert scorer.score_count == 1
+
+
+@pytest.mark.asyncio
+async def test_repo_result_cache_serves_stale_results_while_rate_limited(
+    fake_time: FakeTime,
+) -> None:
+    """Ensure that stale results are served at once while the rate limit is exhausted (instead of waiting for its reset)."""
+
+    rate_limiter = RateLimiter()
+    # The budget is spent, and resets in half an hour
+    rate_limiter.update(
+        {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 1_800),
+        }
+    )
+    scorer = FakeScorer()
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(
+            http_client,
+            token_pool=TokenPool(["test"], create_rate_limiter=lambda: rate_limiter),
+        )
+        single_flight: SingleFlight[ScoringKey, RepoResult] = SingleFlight()
+        repo_result_cache = RepoResultCache(
+            single_flight,
+            max_size=8,
+            max_age=10.0,
+            stale_while_revalidate=100.0,
+            stale_if_error=1_000.0,
+            refresh_timeout=60.0,
+            is_rate_limited=github_api_client.is_rate_limited,
+            clock=fake_time.clock,
+        )
+
+        async def _score_with_github() -> RepoResult:
+            await github_api_client.get_repo(
+                RepoIdentifier(url=HttpUrl("https://github.com/1cph93/rely"))
+            )
+
+            return await scorer.score()
+
+        await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+        fake_time.now += 500
+
+        async with asyncio.timeout(1.0):
+            stale_result = await repo_result_cache.get_or_score(
+                SCORING_KEY, _score_with_github
+            )
+
+        await repo_result_cache.close()
+
+    assert stale_result.freshness == Freshness.STALE_IF_ERROR
+    assert stale_result.repo_result.overall_score_int == 1
+
+
+@pytest.mark.asyncio
+async def test_repo_result_cache_serves_stale_results_if_refresh_is_slow(
+    fake_time: FakeTime,
+) -> None:
+    """Ensure that a stale result is served once the refresh timeout passes, and the refresh continues in the background."""
+
+    scorer = FakeScorer()
+    is_open = asyncio.Event()
+
+    async def _score_slowly() -> RepoResult:
+        await is_open.wait()
+
+        return await scorer.score()
+
+    single_flight: SingleFlight[ScoringKey, RepoResult] = SingleFlight()
+    repo_result_cache = RepoResultCache(
+        single_flight,
+        max_size=8,
+        max_age=10.0,
+        stale_while_revalidate=100.0,
+        stale_if_error=1_000.0,
+        refresh_timeout=0.01,
+        clock=fake_time.clock,
+    )
+
+    await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+    fake_time.now += 500
+    stale_result = await repo_result_cache.get_or_score(SCORING_KEY, _score_slowly)
+
+    assert stale_result.freshness == Freshness.STALE_IF_ERROR
+
+    is_open.set()
+
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    refreshed = await repo_result_cache.get_or_score(SCORING_KEY, scorer.score)
+
+    assert refreshed.freshness == Freshness.FRESH
+    assert refreshed.repo_result.overall_score_int == 2
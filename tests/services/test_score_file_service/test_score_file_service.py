@@ -0,0 +1,112 @@
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from rely.core.models.repo_context import RepoContext
+from rely.services.score_file_service import score_file, score_repo_context_lines
+from rely.services.score_repo_service import get_metric_classes, score_repo_context
+
+
+@pytest.fixture
+def repo_contexts_path(local_test_dir: Path) -> Path:
+    """Fixture to get path of an NDJSON file of archived repo contexts."""
+
+    return local_test_dir / "fixtures" / "repo_contexts.ndjson"
+
+
+def test_score_file_matches_score_repo_context(repo_contexts_path: Path) -> None:
+    """Ensure that archived repo contexts are scored exactly like loaded ones."""
+
+    repo_outcomes = list(score_file(repo_contexts_path))
+
+    assert [repo_outcome.repo_url for repo_outcome in repo_outcomes] == [
+        "https://github.com/1cph93/rely",
+        "https://github.com/1cph93/archived",
+    ]
+
+    for repo_outcome, line in zip(
+        repo_outcomes, repo_contexts_path.read_text().splitlines()
+    ):
+        assert repo_outcome.error is None
+        assert repo_outcome.result == score_repo_context(
+            RepoContext.model_validate_json(line)
+        )
+
+
+def test_score_repo_context_lines_captures_errors(repo_contexts_path: Path) -> None:
+    """Ensure that invalid lines (and missing data sources) become error outcomes, and blank lines are skipped."""
+
+    repo_context_line = repo_contexts_path.read_text().splitlines()[0]
+    partial_repo_context = json.loads(repo_context_line)
+    del partial_repo_context["content_tree_list"]
+
+    repo_outcomes = list(
+        score_repo_context_lines(
+            [
+                "not json",
+                "",
+                json.dumps(partial_repo_context),
+                repo_context_line,
+            ]
+        )
+    )
+
+    assert [repo_outcome.repo_url for repo_outcome in repo_outcomes] == [
+        "line 1",
+        "https://github.com/1cph93/rely",
+        "https://github.com/1cph93/rely",
+    ]
+    assert repo_outcomes[0].error is not None
+    assert repo_outcomes[1].error == "content_tree_list was not loaded"
+    assert repo_outcomes[2].result is not None
+
+
+def test_score_repo_context_lines_only_reads_required_data_sources(
+    repo_contexts_path: Path,
+) -> None:
+    """Ensure that records are scored even if they lack data that the selected metrics don't read."""
+
+    partial_repo_context = json.loads(repo_contexts_path.read_text().splitlines()[0])
+    del partial_repo_context["content_tree_list"]
+
+    [repo_outcome] = score_repo_context_lines(
+        [json.dumps(partial_repo_context)],
+        get_metric_classes(["star_count_metric"]),
+    )
+
+    assert repo_outcome.error is None
+
+
+def test_score_repo_context_lines_uses_constant_memory(
+    repo_contexts_path: Path,
+) -> None:
+    """Ensure that peak memory doesn't grow with the number of streamed lines."""
+
+    repo_context_line = repo_contexts_path.read_bytes().splitlines()[0]
+
+    def _measure_peak_memory(line_count: int) -> int:
+        def _generate_lines() -> Iterator[bytes]:
+            for _ in range(line_count):
+                yield repo_context_line
+
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            for _ in score_repo_context_lines(_generate_lines()):
+                pass
+
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return peak_memory
+
+    # Warm up (like compiling the scoring plan)
+    _measure_peak_memory(10)
+
+    assert _measure_peak_memory(2_000) < 2 * _measure_peak_memory(100)
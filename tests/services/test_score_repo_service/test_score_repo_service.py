@@ -0,0 +1,175 @@
+import asyncio
+from pathlib import Path
+from typing import cast
+from unittest import mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from rely.clients.github_api_client import GitHubAPIClient, GitHubAPIError
+from rely.clients.single_flight import SingleFlight
+from rely.core.metrics.metric_reducer import get_scoring_plan
+from rely.core.metrics.star_count_metric import StarCountMetric
+from rely.core.models.repo_context import RepoContext
+from rely.services.score_repo_service import (
+    get_metric_classes,
+    parse_metric_names,
+    RepoResult,
+    ScoringKey,
+    score_repo_coalesced,
+    score_repo_context,
+    score_repo_with_client,
+)
+from tests.conftest import ModelLoaderFunction
+
+
+@pytest.fixture
+def repo_context(
+    local_test_dir: Path, load_model_from_file: ModelLoaderFunction
+) -> RepoContext:
+    """Fixture to create RepoContext instance."""
+
+    model_instance = load_model_from_file(
+        RepoContext, local_test_dir / "fixtures" / "repo_context.json"
+    )
+
+    return cast(RepoContext, model_instance)
+
+
+def test_get_metric_classes_selects_named_metrics() -> None:
+    """Ensure that get_metric_classes only returns the named metrics."""
+
+    metric_classes = get_metric_classes(
+        parse_metric_names("star_count_metric, has_readme_metric")
+    )
+
+    assert [metric_class.get_normalized_name() for metric_class in metric_classes] == [
+        "star_count_metric",
+        "has_readme_metric",
+    ]
+
+
+def test_get_metric_classes_rejects_unknown_metrics() -> None:
+    """Ensure that get_metric_classes raises an error for unknown metric names."""
+
+    with pytest.raises(ValueError) as exception_info:
+        get_metric_classes(["unknown_metric"])
+
+    assert "unknown_metric" in str(exception_info.value)
+
+
+def test_get_metric_classes_rejects_empty_selection() -> None:
+    """Ensure that get_metric_classes raises an error if no metric name is given."""
+
+    with pytest.raises(ValueError, match="At least one metric must be selected"):
+        get_metric_classes([])
+
+
+@pytest.mark.asyncio
+async def test_score_repo_with_client_only_fetches_required_data_sources(
+    repo_context: RepoContext,
+) -> None:
+    """Ensure that scoring a subset of metrics doesn't fetch data that they don't read."""
+
+    github_api_client = mock.AsyncMock(spec=GitHubAPIClient)
+    github_api_client.get_repo.return_value = repo_context.full_repository
+
+    repo_result = await score_repo_with_client(
+        "https://github.com/1cph93/rely", github_api_client, [StarCountMetric]
+    )
+
+    assert [metric.normalized_name for metric in repo_result.metrics] == [
+        "star_count_metric"
+    ]
+    github_api_client.get_repo_root_contents.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_score_repo_coalesced_shares_scoring(
+    repo_context: RepoContext,
+) -> None:
+    """Ensure that concurrent scorings of the same repo and metrics share a single scoring."""
+
+    github_api_client = mock.AsyncMock(spec=GitHubAPIClient)
+    github_api_client.get_repo.return_value = repo_context.full_repository
+    github_api_client.get_repo_root_contents.return_value = (
+        repo_context.content_tree_list
+    )
+    single_flight: SingleFlight[ScoringKey, RepoResult] = SingleFlight()
+
+    repo_results = await asyncio.gather(
+        score_repo_coalesced(
+            "https://github.com/1cph93/rely",
+            github_api_client,
+            single_flight,
+            [StarCountMetric],
+        ),
+        score_repo_coalesced(
+            "https://github.com/1CPH93/Rely/",
+            github_api_client,
+            single_flight,
+            [StarCountMetric],
+        ),
+        # Different metrics are scored separately
+        score_repo_coalesced(
+            "https://github.com/1cph93/rely", github_api_client, single_flight
+        ),
+    )
+
+    assert repo_results[0] is repo_results[1]
+    assert repo_results[0] is not repo_results[2]
+    assert github_api_client.get_repo.await_count == 2
+    assert single_flight.stats.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_score_repo_coalesced_raises_error_to_every_caller() -> None:
+    """Ensure that a failed scoring is raised to every caller that shares it."""
+
+    github_api_client = mock.AsyncMock(spec=GitHubAPIClient)
+    github_api_client.get_repo.side_effect = GitHubAPIError(
+        "Received 404 response with message: Not Found"
+    )
+    single_flight: SingleFlight[ScoringKey, RepoResult] = SingleFlight()
+
+    results = await asyncio.gather(
+        *(
+            score_repo_coalesced(
+                "https://github.com/1cph93/rely",
+                github_api_client,
+                single_flight,
+                [StarCountMetric],
+            )
+            for _ in range(3)
+        ),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, GitHubAPIError) for result in results)
+    assert github_api_client.get_repo.await_count == 1
+
+
+def test_score_repo_context_evaluates_each_metric_once(
+    mocker: MockerFixture, repo_context: RepoContext
+) -> None:
+    """Ensure that every metric is evaluated exactly once (for both the overall score and serialization)."""
+
+    spy = mocker.spy(RepoContext, "get_full_repository")
+    metric_classes = get_metric_classes()
+
+    repo_result = score_repo_context(repo_context, metric_classes)
+
+    # NOTE: Every metric (except for HasReadmeMetric) reads the full repository once
+    assert spy.call_count == len(metric_classes) - 1
+    assert len(repo_result.metrics) == len(metric_classes)
+
+
+def test_get_scoring_plan_is_compiled_once() -> None:
+    """Ensure that scoring plans are compiled once per ordered collection of metric classes."""
+
+    scoring_plan = get_scoring_plan(get_metric_classes())
+
+    assert get_scoring_plan(get_metric_classes()) is scoring_plan
+    assert scoring_plan.highest_possible_score == sum(
+        3 * metric_class.get_metric_weight() for metric_class in get_metric_classes()
+    )
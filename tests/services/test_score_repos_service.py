@@ -0,0 +1,364 @@
+import asyncio
+import datetime
+from typing import AsyncIterator, Collection, Type
+from unittest import mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from rely.clients.github_api_client import (
+    GitHubAPIClient,
+    GitHubAPIError,
+    InvalidRepository,
+)
+from rely.clients.http_client import HTTPClient
+from rely.core.metrics.base_metric import BaseMetric
+from rely.services.score_repo_service import RepoResult
+from rely.clients.models.content_tree_list import ContentTreeList
+from rely.clients.package_resolver import PackageResolution, PackageResolutionError
+from rely.clients.models.scoring_repository import ScoringRepository
+from rely.services.score_repo_service import get_metric_classes
+from rely.core.models.dependency import (
+    Dependency,
+    create_npm_dependency,
+    create_pypi_dependency,
+)
+from rely.services.score_repos_service import (
+    scan_dependencies,
+    scan_org,
+    score_repos,
+)
+
+
+@pytest.fixture
+def repo_result() -> RepoResult:
+    """Fixture to create a RepoResult instance."""
+
+    return RepoResult(
+        overall_score_decimal=1.0,
+        overall_score_int=100,
+        maximum_metric_score=3,
+        metrics=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_score_repos_captures_errors(
+    mocker: MockerFixture, repo_result: RepoResult
+) -> None:
+    """Ensure that a single failing repo does not fail the whole batch."""
+
+    async def _score_repo_with_client(
+        repo_url: str,
+        github_api_client: GitHubAPIClient,
+        metric_classes: Collection[Type[BaseMetric]] | None,
+    ) -> RepoResult:
+        if repo_url.endswith("bad"):
+            raise GitHubAPIError("Received 404 response with message: Not Found")
+
+        return repo_result
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_repo_with_client,
+    )
+    repo_urls = ["https://github.com/a/good", "https://github.com/a/bad"]
+
+    outcomes = [
+        outcome
+        async for outcome in score_repos(repo_urls, mock.AsyncMock(), max_concurrency=2)
+    ]
+    outcomes_by_url = {outcome.repo_url: outcome for outcome in outcomes}
+
+    assert len(outcomes) == 2
+    assert outcomes_by_url["https://github.com/a/good"].result == repo_result
+    assert outcomes_by_url["https://github.com/a/bad"].result is None
+    assert "404" in str(outcomes_by_url["https://github.com/a/bad"].error)
+
+
+@pytest.mark.asyncio
+async def test_score_repos_captures_timeouts(mocker: MockerFixture) -> None:
+    """Ensure that a repo whose requests keep timing out is reported as a per-repo error."""
+
+    mocker.patch("aiohttp.ClientSession.get", side_effect=TimeoutError())
+
+    async with HTTPClient() as http_client:
+        github_api_client = GitHubAPIClient(http_client, "test", max_retries=0)
+        outcomes = [
+            outcome
+            async for outcome in score_repos(
+                ["https://github.com/a/slow"], github_api_client, max_concurrency=1
+            )
+        ]
+
+    [outcome] = outcomes
+
+    assert outcome.result is None
+    assert "TimeoutError" in str(outcome.error)
+
+
+@pytest.mark.asyncio
+async def test_score_repos_streams_async_repo_urls(
+    mocker: MockerFixture, repo_result: RepoResult
+) -> None:
+    """Ensure that outcomes are yielded while an async stream of repo URLs waits for its producer."""
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        return_value=repo_result,
+    )
+    first_outcome_received = asyncio.Event()
+
+    async def _produce_repo_urls() -> AsyncIterator[str]:
+        yield "https://github.com/a/first"
+        # A slow producer (like a pipe into stdin) only sends more once the first repo is scored
+        await first_outcome_received.wait()
+        yield "https://github.com/a/second"
+
+    outcomes = []
+
+    async with asyncio.timeout(5):
+        async for outcome in score_repos(
+            _produce_repo_urls(), mock.AsyncMock(), max_concurrency=3
+        ):
+            outcomes.append(outcome)
+            first_outcome_received.set()
+
+    assert [outcome.repo_url for outcome in outcomes] == [
+        "https://github.com/a/first",
+        "https://github.com/a/second",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_score_repos_bounds_concurrency(
+    mocker: MockerFixture, repo_result: RepoResult
+) -> None:
+    """Ensure that no more than max_concurrency repos are scored at once."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _score_repo_with_client(
+        repo_url: str,
+        github_api_client: GitHubAPIClient,
+        metric_classes: Collection[Type[BaseMetric]] | None,
+    ) -> RepoResult:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+
+        return repo_result
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_repo_with_client,
+    )
+    repo_urls = [f"https://github.com/a/repo_{i}" for i in range(20)]
+
+    outcomes = [
+        outcome
+        async for outcome in score_repos(repo_urls, mock.AsyncMock(), max_concurrency=3)
+    ]
+
+    assert len(outcomes) == 20
+    assert max_in_flight == 3
+
+
+def _create_full_repository(full_name: str) -> ScoringRepository:
+    return ScoringRepository(
+        name=full_name.split("/")[1],
+        full_name=full_name,
+        description="Test repository",
+        stargazers_count=100,
+        watchers_count=100,
+        forks_count=10,
+        open_issues_count=1,
+        archived=False,
+        disabled=False,
+        pushed_at=datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC),
+        license=None,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "metric_names, expected_contents_calls",
+    [(None, 2), (["star_count_metric", "is_archived_metric"], 0)],
+)
+async def test_scan_org_builds_contexts_from_listing(
+    metric_names: list[str] | None, expected_contents_calls: int
+) -> None:
+    """Ensure that scanning an org never fetches repos one by one, and only fetches contents if metrics read them."""
+
+    github_api_client = mock.AsyncMock()
+    github_api_client.list_owner_repos.return_value = [
+        _create_full_repository("test_org/first"),
+        _create_full_repository("test_org/second"),
+    ]
+    github_api_client.get_repo_root_contents.return_value = ContentTreeList(
+        content_tree_list=[]
+    )
+
+    outcomes = [
+        outcome
+        async for outcome in scan_org(
+            "test_org",
+            github_api_client,
+            max_concurrency=2,
+            metric_classes=(
+                get_metric_classes(metric_names) if metric_names is not None else None
+            ),
+        )
+    ]
+
+    assert sorted(outcome.repo_url for outcome in outcomes) == [
+        "https://github.com/test_org/first",
+        "https://github.com/test_org/second",
+    ]
+    assert all(outcome.result is not None for outcome in outcomes)
+    github_api_client.list_owner_repos.assert_awaited_once_with(
+        "test_org", is_user=False, max_concurrency=2
+    )
+    github_api_client.get_repo.assert_not_called()
+    assert github_api_client.get_repo_root_contents.await_count == (
+        expected_contents_calls
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_org_reports_invalid_repos() -> None:
+    """Ensure that repos that failed validation get an error outcome (without failing the scan)."""
+
+    github_api_client = mock.AsyncMock()
+    github_api_client.list_owner_repos.return_value = [
+        _create_full_repository("test_org/first"),
+        InvalidRepository(full_name="test_org/invalid", error="Invalid repository"),
+    ]
+
+    outcomes = {
+        outcome.repo_url: outcome
+        async for outcome in scan_org(
+            "test_org",
+            github_api_client,
+            max_concurrency=2,
+            metric_classes=get_metric_classes(["star_count_metric"]),
+        )
+    }
+
+    assert outcomes["https://github.com/test_org/first"].result is not None
+    assert outcomes["https://github.com/test_org/invalid"].result is None
+    assert outcomes["https://github.com/test_org/invalid"].error == (
+        "Invalid repository"
+    )
+
+
+class StaticPackageResolver:
+    """Resolver that resolves packages from a fixed mapping (waiting for an event first, if given)."""
+
+    def __init__(
+        self,
+        repo_urls: dict[Dependency, str | None],
+        events: dict[Dependency, asyncio.Event] | None = None,
+    ) -> None:
+        self.repo_urls = repo_urls
+        self.events = events or {}
+
+    async def resolve(self, dependency: Dependency) -> PackageResolution:
+        if dependency in self.events:
+            await self.events[dependency].wait()
+        if dependency not in self.repo_urls:
+            raise PackageResolutionError("Received 500 response with message: Error")
+
+        return PackageResolution(repo_url=self.repo_urls[dependency])
+
+
+@pytest.mark.asyncio
+async def test_scan_dependencies_scores_each_repo_once(
+    mocker: MockerFixture, repo_result: RepoResult
+) -> None:
+    """Ensure that dependencies that resolve to the same repo share a single scoring, and errors are captured."""
+
+    m = mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        return_value=repo_result,
+    )
+    package_resolver = StaticPackageResolver(
+        {
+            create_pypi_dependency("pydantic"): "https://github.com/pydantic/pydantic",
+            create_pypi_dependency("pydantic-core"): (
+                "https://github.com/Pydantic/Pydantic"
+            ),
+            create_npm_dependency("closed-source"): None,
+        }
+    )
+    dependencies = [
+        create_pypi_dependency("pydantic"),
+        create_pypi_dependency("pydantic-core"),
+        create_pypi_dependency("pydantic"),
+        create_npm_dependency("closed-source"),
+        create_npm_dependency("broken"),
+    ]
+
+    outcomes = [
+        outcome
+        async for outcome in scan_dependencies(
+            dependencies, package_resolver, mock.AsyncMock(), max_concurrency=4
+        )
+    ]
+    outcomes_by_name = {outcome.dependency.name: outcome for outcome in outcomes}
+
+    assert len(outcomes) == 4
+    assert m.call_count == 1
+    assert outcomes_by_name["pydantic"].result == repo_result
+    assert outcomes_by_name["pydantic-core"].result == repo_result
+    assert outcomes_by_name["closed-source"].error == "Could not find a GitHub repo"
+    assert "500" in str(outcomes_by_name["broken"].error)
+
+
+@pytest.mark.asyncio
+async def test_scan_dependencies_scores_while_resolving(
+    mocker: MockerFixture, repo_result: RepoResult
+) -> None:
+    """Ensure that scoring starts while other dependencies are still being resolved."""
+
+    first_dependency = create_pypi_dependency("first")
+    second_dependency = create_pypi_dependency("second")
+    # The second dependency is only resolved once the first one is being scored
+    is_first_scored = asyncio.Event()
+
+    async def _score_repo_with_client(
+        repo_url: str,
+        github_api_client: GitHubAPIClient,
+        metric_classes: Collection[Type[BaseMetric]] | None,
+    ) -> RepoResult:
+        is_first_scored.set()
+
+        return repo_result
+
+    mocker.patch(
+        "rely.services.score_repos_service.score_repo_with_client",
+        side_effect=_score_repo_with_client,
+    )
+    package_resolver = StaticPackageResolver(
+        {
+            first_dependency: "https://github.com/a/first",
+            second_dependency: "https://github.com/a/second",
+        },
+        events={second_dependency: is_first_scored},
+    )
+
+    async def _scan() -> list[str]:
+        return [
+            outcome.dependency.name
+            async for outcome in scan_dependencies(
+                [second_dependency, first_dependency],
+                package_resolver,
+                mock.AsyncMock(),
+                max_concurrency=2,
+            )
+        ]
+
+    assert await asyncio.wait_for(_scan(), timeout=1) == ["first", "second"]
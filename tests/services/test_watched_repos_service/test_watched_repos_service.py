@@ -0,0 +1,177 @@
+import asyncio
+from pathlib import Path
+from typing import cast
+from unittest import mock
+
+import pytest
+from pydantic import HttpUrl
+
+from rely.clients.github_api_client import GitHubAPIClient, GitHubAPIError
+from rely.core.metrics.star_count_metric import StarCountMetric
+from rely.core.models.repo_context import RepoContext
+from rely.core.models.repo_identifier import RepoIdentifier
+from rely.services.repo_result_cache import Freshness
+from rely.services.watched_repos_service import WatchedRepos, read_watched_repo_urls
+from tests.conftest import ModelLoaderFunction
+
+
+class FakeTime:
+    """Clock that is advanced by sleeping."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def repo_context(
+    local_test_dir: Path, load_model_from_file: ModelLoaderFunction
+) -> RepoContext:
+    """Fixture to create RepoContext instance."""
+
+    model_instance = load_model_from_file(
+        RepoContext, local_test_dir / "fixtures" / "repo_context.json"
+    )
+
+    return cast(RepoContext, model_instance)
+
+
+@pytest.fixture
+def github_api_client(repo_context: RepoContext) -> mock.AsyncMock:
+    """Fixture to mock a GitHubAPIClient (that can't find repos named "bad")."""
+
+    github_api_client = mock.AsyncMock(spec=GitHubAPIClient)
+
+    async def _get_repo(repo_identifier: RepoIdentifier) -> object:
+        if repo_identifier.repo_name == "bad":
+            raise GitHubAPIError("Received 404 response with message: Not Found")
+
+        return repo_context.full_repository
+
+    github_api_client.get_repo.side_effect = _get_repo
+    github_api_client.get_repo_root_contents.return_value = (
+        repo_context.content_tree_list
+    )
+
+    return github_api_client
+
+
+def test_read_watched_repo_urls(local_test_dir: Path) -> None:
+    """Ensure that blank lines and comments are ignored."""
+
+    assert read_watched_repo_urls(
+        local_test_dir / "fixtures" / "watched_repos.txt"
+    ) == [
+        "https://github.com/1cph93/rely",
+        "https://github.com/o/bad",
+        "https://github.com/1CPH93/Rely",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_watched_repos_serves_refreshed_results(
+    local_test_dir: Path, github_api_client: mock.AsyncMock
+) -> None:
+    """Ensure that watched repos are looked up without touching GitHub once they are refreshed."""
+
+    fake_time = FakeTime()
+    watched_repos = WatchedRepos(
+        read_watched_repo_urls(local_test_dir / "fixtures" / "watched_repos.txt"),
+        refresh_interval=60.0,
+        max_concurrency=2,
+        clock=fake_time.clock,
+        sleep=fake_time.sleep,
+    )
+    repo_identifier = RepoIdentifier(url=HttpUrl("https://github.com/1CPH93/RELY"))
+
+    assert len(watched_repos) == 2
+    assert watched_repos.get(repo_identifier) is None
+
+    await watched_repos.refresh_all(github_api_client, refresh_interval=60.0)
+    github_api_client.reset_mock()
+    cached_repo_result = watched_repos.get(repo_identifier)
+    star_count_result = watched_repos.get(repo_identifier, [StarCountMetric])
+
+    assert cached_repo_result is not None
+    assert cached_repo_result.freshness == Freshness.FRESH
+    assert len(cached_repo_result.repo_result.metrics) > 1
+    assert star_count_result is not None
+    assert [
+        metric.normalized_name for metric in star_count_result.repo_result.metrics
+    ] == ["star_count_metric"]
+    assert github_api_client.mock_calls == []
+    # Refreshes are spread across the refresh interval
+    assert fake_time.sleeps == [30.0, 30.0]
+    assert watched_repos.stats.model_dump() == {
+        "repo_count": 2,
+        "loaded_count": 1,
+        "refresh_count": 1,
+        "error_count": 1,
+    }
+
+    # Results that missed their refresh are stale
+    fake_time.now += 60.0
+    stale_repo_result = watched_repos.get(repo_identifier)
+
+    assert stale_repo_result is not None
+    assert stale_repo_result.freshness == Freshness.STALE
+
+
+def test_watched_repos_rejects_invalid_repo_urls() -> None:
+    """Ensure that invalid repo URLs are rejected up front."""
+
+    with pytest.raises(ValueError):
+        WatchedRepos(
+            ["https://example.com/a/b"], refresh_interval=60.0, max_concurrency=1
+        )
+
+
+@pytest.mark.asyncio
+async def test_watched_repos_keeps_refreshing_after_unexpected_errors(
+    github_api_client: mock.AsyncMock,
+    repo_context: RepoContext,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensure that an unexpected error fails a single refresh, without stopping the refresher."""
+
+    fake_time = FakeTime()
+    watched_repos = WatchedRepos(
+        ["https://github.com/1cph93/rely", "https://github.com/o/timeout"],
+        refresh_interval=60.0,
+        max_concurrency=2,
+        clock=fake_time.clock,
+        sleep=fake_time.sleep,
+    )
+
+    async def _get_repo(repo_identifier: RepoIdentifier) -> object:
+        if repo_identifier.repo_name == "timeout":
+            raise TimeoutError()
+
+        return repo_context.full_repository
+
+    github_api_client.get_repo.side_effect = _get_repo
+    run_task = asyncio.create_task(watched_repos.run(github_api_client))
+
+    # The first pass (and a few spread out passes) run to completion
+    for _ in range(1_000):
+        if watched_repos.stats.refresh_count >= 3 or run_task.done():
+            break
+
+        await asyncio.sleep(0)
+
+    assert not run_task.done()
+
+    run_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await run_task
+
+    assert watched_repos.stats.error_count >= 3
+    assert "Failed to refresh https://github.com/o/timeout" in caplog.text
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+from asyncclick.testing import CliRunner
+
+from rely.cli import _chain_repo_urls, cli
+
+
+@pytest.fixture
+def repo_contexts_path(local_test_dir: Path) -> Path:
+    """Fixture to get path of an NDJSON file of archived repo contexts."""
+
+    return local_test_dir / "fixtures" / "repo_contexts.ndjson"
+
+
+@pytest.mark.asyncio
+async def test_chain_repo_urls_reads_file_without_blocking() -> None:
+    """Ensure that waiting for more lines (like from a pipe into stdin) doesn't block the event loop."""
+
+    read_fd, write_fd = os.pipe()
+
+    with os.fdopen(read_fd) as repo_url_file, os.fdopen(write_fd, "w") as writer:
+        writer.write("# Comment\n\nhttps://github.com/a/from_file\n")
+        writer.flush()
+        repo_urls = _chain_repo_urls(["https://github.com/a/from_args"], repo_url_file)
+
+        assert await anext(repo_urls) == "https://github.com/a/from_args"
+        assert await anext(repo_urls) == "https://github.com/a/from_file"
+
+        # The writer hasn't sent the next line yet, but other tasks keep running
+        async def take_next_repo_url() -> str:
+            return await anext(repo_urls)
+
+        next_repo_url = asyncio.create_task(take_next_repo_url())
+        await asyncio.sleep(0.05)
+
+        assert not next_repo_url.done()
+
+        writer.write("https://github.com/a/later\n")
+        writer.close()
+
+        assert await next_repo_url == "https://github.com/a/later"
+        assert [repo_url async for repo_url in repo_urls] == []
+
+
+@pytest.mark.asyncio
+async def test_metrics_option_selects_metrics(repo_contexts_path: Path) -> None:
+    """Ensure that only the metrics given with --metrics are computed."""
+
+    result = await CliRunner().invoke(
+        cli,
+        [
+            "score-file",
+            str(repo_contexts_path),
+            "--metrics",
+            "star_count_metric,last_commit_metric",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert {
+        metric["normalized_name"]
+        for metric in json.loads(result.output)["result"]["metrics"]
+    } == {"star_count_metric", "last_commit_metric"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command", ["score", "score-file", "scan-org", "scan"])
+async def test_metrics_option_rejects_unknown_metrics(
+    command: str, repo_contexts_path: Path
+) -> None:
+    """Ensure that every scoring command rejects unknown metrics (before doing any work)."""
+
+    result = await CliRunner().invoke(
+        cli, [command, str(repo_contexts_path), "--metrics", "unknown_metric"]
+    )
+
+    assert result.exit_code == 2
+    assert "Invalid value for '--metrics'" in result.output
+    assert "unknown_metric" in result.output
+
+
+@pytest.mark.asyncio
+async def test_metrics_option_rejects_empty_selection(repo_contexts_path: Path) -> None:
+    """Ensure that selecting no metrics is rejected (instead of scoring without metrics)."""
+
+    result = await CliRunner().invoke(
+        cli, ["score-file", str(repo_contexts_path), "--metrics", ","]
+    )
+
+    assert result.exit_code == 2
+    assert "At least one metric must be selected" in result.output